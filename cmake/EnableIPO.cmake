@@ -0,0 +1,27 @@
+# This file is part of PyCPL the ESO CPL Python language bindings
+# Copyright (C) 2020-2024 European Southern Observatory
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>.
+
+# Enable link time optimization for a vendored CMake project, if the
+# toolchain supports it. The file is injected into the project through
+# CMAKE_PROJECT_INCLUDE, after its project() command enabled the languages.
+
+include(CheckIPOSupported)
+check_ipo_supported(RESULT _pycpl_ipo_supported OUTPUT _pycpl_ipo_output)
+if(_pycpl_ipo_supported)
+  set(CMAKE_INTERPROCEDURAL_OPTIMIZATION ON)
+else()
+  message(STATUS "Link time optimization is not supported: ${_pycpl_ipo_output}")
+endif()
@@ -16,7 +16,12 @@
 
 import os
 import sys
+import glob
+import shlex
+import shutil
+import hashlib
 import subprocess
+import sysconfig
 import multiprocessing
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
@@ -26,6 +31,31 @@ import pybind11
 from setuptools import setup, Extension
 from setuptools.command.build_ext import build_ext
 
+# Build tools are resolved once instead of searching PATH for every command
+CMAKE = shutil.which("cmake") or "cmake"
+MAKE = shutil.which("make") or "make"
+
+# Compiler flags used for all vendored libraries: use pipes instead of
+# temporary files between the compiler stages, and place code and data in
+# separate sections, so that the linker can discard what is unused. On ELF
+# platforms calls to external functions also bypass the PLT.
+DEPS_CFLAGS = "-pipe -ffunction-sections -fdata-sections"
+if sys.platform == "darwin":
+    GC_SECTIONS_LDFLAGS = "-Wl,-dead_strip"
+else:
+    DEPS_CFLAGS += " -fno-plt"
+    GC_SECTIONS_LDFLAGS = "-Wl,--gc-sections -Wl,--as-needed"
+
+
+def _run(args: list[str], **kwargs) -> subprocess.CompletedProcess:
+    """Run an external build command.
+
+    File descriptors are not inherited by child processes by default
+    (PEP 446), so closing them explicitly is not needed. Skipping it avoids
+    scanning the file descriptor table for every spawned process.
+    """
+    return subprocess.run(args, close_fds=False, **kwargs)
+
 
 class CMakeExtension(Extension):
     def __init__(self, name: str, sourcedir: str = "") -> None:
@@ -37,15 +67,36 @@ class CMakeBuildExt(build_ext):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.deps_built = False
+        self.ccache = None
+        self.generator_args = []
+        self.pybind11_dir = None
+        self.pycpl_version = None
+        self.deps_env = {}
 
     def run(self) -> None:
-        try:
-            _ = subprocess.check_output(["cmake", "--version"])
-        except OSError as e:
+        if shutil.which(CMAKE) is None:
             raise RuntimeError(
                 "CMake must be installed to build the following extensions: "
                 + ", ".join(e.name for e in self.extensions)
-            ) from e
+            )
+
+        # Use ccache as compiler launcher if it is available. It can be
+        # disabled by setting PYCPL_DISABLE_CCACHE in the environment.
+        if not int(os.environ.get("PYCPL_DISABLE_CCACHE", 0)):
+            self.ccache = shutil.which("ccache")
+        if self.ccache is not None:
+            print(f"Using compiler launcher: {self.ccache}")
+
+        # Prefer the Ninja generator if it is available, unless a generator
+        # was explicitly selected through the environment.
+        if "CMAKE_GENERATOR" not in os.environ and shutil.which("ninja"):
+            self.generator_args = ["-GNinja"]
+
+        # Settings which are the same for all extensions
+        if self.pybind11_dir is None:
+            self.pybind11_dir = pybind11.get_cmake_dir()
+        if self.pycpl_version is None:
+            self.pycpl_version = self.distribution.get_version()
 
         # Build vendored dependencies first
         if not self.deps_built:
@@ -73,59 +124,201 @@ class CMakeBuildExt(build_ext):
         deps_install_dir = deps_build_dir / "install"
         deps_install_dir.mkdir(parents=True, exist_ok=True)
 
+        # Environment used by the autoconf builds to find the dependencies
+        self.deps_env = self._dependencies_env(deps_install_dir)
+
+        # Skip the build if the installed libraries are up to date
+        stamp_file = deps_install_dir / ".pycpl_deps_stamp"
+        stamp = self._dependencies_stamp(vendor_dir)
+        if self._dependencies_installed(deps_install_dir) and (
+            stamp_file.exists() and stamp_file.read_text() == stamp
+        ):
+            print(">>> Vendored libraries are up to date, skipping rebuild")
+            os.environ["CPLDIR"] = str(deps_install_dir)
+            print(f"\nCPLDIR set to: {deps_install_dir}")
+            print("=" * 60)
+            return
+
         # Number of parallel jobs
-        njobs = os.environ.get("CMAKE_BUILD_PARALLEL_LEVEL") or str(multiprocessing.cpu_count())
+        njobs = self._choose_njobs()
 
         # Build dependencies with parallelization where possible
-        # Phase 1: Build cfitsio and fftw in parallel (independent)
-        print("\n>>> Phase 1: Building cfitsio and fftw in parallel...")
-        with ThreadPoolExecutor(max_workers=2) as executor:
-            future_cfitsio = executor.submit(
-                self._build_cfitsio, vendor_dir, deps_build_dir, deps_install_dir, njobs
-            )
-            future_fftw = executor.submit(
-                self._build_fftw, vendor_dir, deps_build_dir, deps_install_dir, njobs
-            )
+        # Phase 1: Build fftw in parallel with cfitsio and wcslib. The wcslib
+        # configure script checks for an installed cfitsio to build its
+        # cfitsio support, so wcslib is built after cfitsio was installed.
+        print("\n>>> Phase 1: Building fftw in parallel with cfitsio and wcslib...")
+        # Split the jobs between the concurrent builds so that they do not
+        # oversubscribe the available cores.
+        phase1_njobs = str(max(1, int(njobs) // 2))
+
+        def build_cfitsio_wcslib(*args) -> None:
+            self._build_cfitsio(*args)
+            self._build_wcslib(*args)
 
-            # Wait for both to complete and handle any errors
-            for future in as_completed([future_cfitsio, future_fftw]):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    build, vendor_dir, deps_build_dir, deps_install_dir, phase1_njobs
+                )
+                for build in (build_cfitsio_wcslib, self._build_fftw)
+            ]
+
+            # Wait for all to complete and handle any errors
+            for future in as_completed(futures):
                 future.result()  # Will raise exception if build failed
 
-        print(">>> Phase 1 complete: cfitsio and fftw built successfully")
+        print(">>> Phase 1 complete: cfitsio, fftw and wcslib built successfully")
 
-        # Phase 2: Build wcslib (depends on cfitsio)
-        print("\n>>> Phase 2: Building wcslib...")
-        self._build_wcslib(vendor_dir, deps_build_dir, deps_install_dir, njobs)
-
-        # Phase 3: Build cpl (depends on all three)
-        print("\n>>> Phase 3: Building cpl...")
+        # Phase 2: Build cpl (depends on all three)
+        print("\n>>> Phase 2: Building cpl...")
         self._build_cpl(vendor_dir, deps_build_dir, deps_install_dir, njobs)
 
+        stamp_file.write_text(stamp)
+
         # Set CPLDIR environment variable so FindCPL.cmake can find it
         os.environ["CPLDIR"] = str(deps_install_dir)
         print(f"\nCPLDIR set to: {deps_install_dir}")
         print("=" * 60)
 
+    @staticmethod
+    def _dependencies_stamp(vendor_dir: Path) -> str:
+        """Fingerprint of the vendored sources, the build script and the toolchain.
+
+        The fingerprint changes if a vendored file is added, removed or
+        modified, if the build settings in this file are modified, or if a
+        different compiler or different build flags are selected through the
+        environment.
+        """
+        stamp = hashlib.sha256()
+        stamp.update(Path(__file__).read_bytes())
+        stamp.update((Path(__file__).parent / "cmake" / "EnableIPO.cmake").read_bytes())
+        # Modification times are used rather than the contents, which is
+        # much cheaper and detects edits of the vendored sources as well
+        for src in sorted(vendor_dir.rglob("*")):
+            if src.is_dir() and not src.is_symlink():
+                continue
+            mtime = src.lstat().st_mtime_ns
+            stamp.update(f"{src.relative_to(vendor_dir)}={mtime}\0".encode())
+        # Resolve the compilers, so that a change of the compiler found in
+        # PATH is detected too
+        for name, default in (("CC", "cc"), ("CXX", "c++")):
+            command = shlex.split(
+                os.environ.get(name) or sysconfig.get_config_var(name) or default
+            )
+            command[0] = shutil.which(command[0]) or command[0]
+            stamp.update(f"{name}={shlex.join(command)}\0".encode())
+        for name in (
+            "CFLAGS",
+            "CPPFLAGS",
+            "LDFLAGS",
+            "PYCPL_DISABLE_LTO",
+            "PYCPL_DISABLE_CCACHE",
+            "CMAKE_GENERATOR",
+        ):
+            stamp.update(f"{name}={os.environ.get(name, '')}\0".encode())
+        return stamp.hexdigest()
+
+    @staticmethod
+    def _dependencies_installed(install_dir: Path) -> bool:
+        """Check that all vendored libraries are present in the installation tree."""
+        lib_dir = install_dir / "lib"
+        libraries = [
+            "libcfitsio",
+            "libfftw3",
+            "libfftw3f",
+            "libwcs",
+            "libcext",
+            "libcplcore",
+            "libcplui",
+            "libcpldfs",
+            "libcpldrs",
+        ]
+        return all(glob.glob(str(lib_dir / f"{name}.*")) for name in libraries)
+
+    @staticmethod
+    def _dependencies_env(install_dir: Path) -> dict[str, str]:
+        """Environment variables pointing the autoconf builds to the installed dependencies."""
+        include_path = str(install_dir / "include")
+        wcslib_include_path = str(install_dir / "include" / "wcslib")
+        lib_path = str(install_dir / "lib")
+        ldflags = f"-L{lib_path} -Wl,-rpath,{lib_path}"
+
+        env = {
+            "PKG_CONFIG_PATH": str(install_dir / "lib" / "pkgconfig"),
+            "CFITSIO_CFLAGS": f"-I{include_path}",
+            "CFITSIO_LIBS": f"-L{lib_path} -lcfitsio",
+            "FFTW3_CFLAGS": f"-I{include_path}",
+            "FFTW3_LIBS": f"-L{lib_path} -lfftw3",
+            "WCSLIB_CFLAGS": f"-I{wcslib_include_path}",
+            "WCSLIB_LIBS": f"-L{lib_path} -lwcs",
+        }
+        env["LDFLAGS"] = (
+            f"{ldflags} {os.environ['LDFLAGS']}"
+            if os.environ.get("LDFLAGS")
+            else ldflags
+        )
+        env["LD_LIBRARY_PATH"] = (
+            f"{lib_path}:{os.environ['LD_LIBRARY_PATH']}"
+            if os.environ.get("LD_LIBRARY_PATH")
+            else lib_path
+        )
+        if sys.platform == "darwin":
+            env["DYLD_LIBRARY_PATH"] = (
+                f"{lib_path}:{os.environ['DYLD_LIBRARY_PATH']}"
+                if os.environ.get("DYLD_LIBRARY_PATH")
+                else lib_path
+            )
+        return env
+
+    @staticmethod
+    def _choose_njobs() -> str:
+        """Number of parallel jobs used to build the vendored libraries.
+
+        An explicit setting of PYCPL_BUILD_PARALLEL_LEVEL, or
+        CMAKE_BUILD_PARALLEL_LEVEL takes precedence. Otherwise one job per
+        core is used, keeping one core in ten in reserve, but at most one job
+        per 2 GB of physical memory to avoid swapping on large machines.
+        """
+        for name in ("PYCPL_BUILD_PARALLEL_LEVEL", "CMAKE_BUILD_PARALLEL_LEVEL"):
+            if os.environ.get(name):
+                return os.environ[name]
+
+        njobs = max(1, int(multiprocessing.cpu_count() * 0.9))
+        try:
+            memory = os.sysconf("SC_PHYS_PAGES") * os.sysconf("SC_PAGE_SIZE")
+        except (AttributeError, ValueError, OSError):
+            return str(njobs)
+        return str(min(njobs, max(1, memory // 2**31)))
+
     def _build_cfitsio(self, vendor_dir: Path, build_dir: Path, install_dir: Path, njobs: str) -> None:
         """Build cfitsio library"""
         print("\n>>> Building cfitsio...")
         src_dir = vendor_dir / "cfitsio-4.6.2"
         build_subdir = build_dir / "cfitsio-build"
-        build_subdir.mkdir(parents=True, exist_ok=True)
 
-        # Use CMake for cfitsio
-        subprocess.run([
-            "cmake",
-            str(src_dir),
+        # Use CMake for cfitsio. Note that neither cfitsio nor fftw can be
+        # built with CMAKE_UNITY_BUILD: both define file local symbols with
+        # identical names in different source files.
+        _run([
+            CMAKE,
+            "-S", str(src_dir),
+            "-B", str(build_subdir),
+            *self._generator_args(build_subdir),
             f"-DCMAKE_INSTALL_PREFIX={install_dir}",
             "-DCMAKE_BUILD_TYPE=Release",
             "-DBUILD_SHARED_LIBS=ON",
             "-DUSE_PTHREADS=ON",
+            "-DTESTS=OFF",
+            "-DUTILS=OFF",
             "-DCMAKE_INSTALL_LIBDIR=lib",
-        ], cwd=build_subdir, check=True)
+            *self._release_args(),
+            *self._launcher_args(),
+        ], check=True)
 
-        subprocess.run(["cmake", "--build", ".", "-j", njobs], cwd=build_subdir, check=True)
-        subprocess.run(["cmake", "--install", "."], cwd=build_subdir, check=True)
+        _run(
+            [CMAKE, "--build", str(build_subdir), "--target", "install", "-j", njobs],
+            check=True,
+        )
 
         # Fix install names on macOS
         self._fix_darwin_install_names(
@@ -143,37 +336,49 @@ class CMakeBuildExt(build_ext):
         # Build double precision (default)
         print(">>> Building fftw (double precision)...")
         build_double = build_dir / "fftw-build-double"
-        build_double.mkdir(parents=True, exist_ok=True)
 
-        subprocess.run([
-            "cmake",
-            str(src_dir),
+        _run([
+            CMAKE,
+            "-S", str(src_dir),
+            "-B", str(build_double),
+            *self._generator_args(build_double),
             f"-DCMAKE_INSTALL_PREFIX={install_dir}",
             "-DCMAKE_BUILD_TYPE=Release",
             "-DBUILD_SHARED_LIBS=ON",
             "-DENABLE_THREADS=ON",
+            "-DBUILD_TESTS=OFF",
             "-DCMAKE_INSTALL_LIBDIR=lib",
-        ], cwd=build_double, check=True)
-        subprocess.run(["cmake", "--build", ".", "-j", njobs], cwd=build_double, check=True)
-        subprocess.run(["cmake", "--install", "."], cwd=build_double, check=True)
+            *self._release_args(),
+            *self._launcher_args(),
+        ], check=True)
+        _run(
+            [CMAKE, "--build", str(build_double), "--target", "install", "-j", njobs],
+            check=True,
+        )
 
         # Build single precision
         print(">>> Building fftw (single precision)...")
         build_single = build_dir / "fftw-build-single"
-        build_single.mkdir(parents=True, exist_ok=True)
 
-        subprocess.run([
-            "cmake",
-            str(src_dir),
+        _run([
+            CMAKE,
+            "-S", str(src_dir),
+            "-B", str(build_single),
+            *self._generator_args(build_single),
             f"-DCMAKE_INSTALL_PREFIX={install_dir}",
             "-DCMAKE_BUILD_TYPE=Release",
             "-DBUILD_SHARED_LIBS=ON",
             "-DENABLE_THREADS=ON",
+            "-DBUILD_TESTS=OFF",
             "-DENABLE_FLOAT=ON",  # Enable single precision
             "-DCMAKE_INSTALL_LIBDIR=lib",
-        ], cwd=build_single, check=True)
-        subprocess.run(["cmake", "--build", ".", "-j", njobs], cwd=build_single, check=True)
-        subprocess.run(["cmake", "--install", "."], cwd=build_single, check=True)
+            *self._release_args(),
+            *self._launcher_args(),
+        ], check=True)
+        _run(
+            [CMAKE, "--build", str(build_single), "--target", "install", "-j", njobs],
+            check=True,
+        )
 
         self._fix_darwin_install_names(
             install_dir / "lib",
@@ -192,53 +397,40 @@ class CMakeBuildExt(build_ext):
         print("\n>>> Building wcslib...")
         src_dir = vendor_dir / "wcslib-8.2.2"
 
-        # wcslib doesn't support out-of-tree builds well, build in-source
-        env = os.environ.copy()
-        # Set proper LDFLAGS and CFLAGS instead of CFITSIOLIB/CFITSIOINC
-        env["CFLAGS"] = f"-I{install_dir / 'include'}"
-        lib_path = str(install_dir / "lib")
-        ldflags = f"-L{lib_path} -Wl,-rpath,{lib_path}"
-        env["LDFLAGS"] = (
-            f"{ldflags} {env['LDFLAGS']}"
-            if env.get("LDFLAGS")
-            else ldflags
-        )
-        env["LD_LIBRARY_PATH"] = (
-            f"{lib_path}:{env['LD_LIBRARY_PATH']}"
-            if env.get("LD_LIBRARY_PATH")
-            else lib_path
-        )
-        if sys.platform == "darwin":
-            env["DYLD_LIBRARY_PATH"] = (
-                f"{lib_path}:{env['DYLD_LIBRARY_PATH']}"
-                if env.get("DYLD_LIBRARY_PATH")
-                else lib_path
-            )
+        # wcslib doesn't support out-of-tree builds well, build in a copy of
+        # the source tree. The copy is kept for incremental rebuilds.
+        build_subdir = build_dir / f"{src_dir.name}-build"
+        self._copy_source_tree(src_dir, build_subdir)
+
+        env = {**os.environ, **self.deps_env}
+        # Set proper CFLAGS instead of CFITSIOLIB/CFITSIOINC. Since this
+        # replaces the configure default, the optimization level is set too.
+        env["CFLAGS"] = f"-I{install_dir / 'include'} -O2 {DEPS_CFLAGS}"
+        self._apply_launcher_env(env)
 
-        subprocess.run([
+        _run([
             "./configure",
             f"--prefix={install_dir}",
             "--without-pgplot",
             "--disable-fortran",
-        ], cwd=src_dir, env=env, check=True)
+            "--disable-utils",
+        ], cwd=build_subdir, env=env, check=True)
 
-        subprocess.run(["make", f"-j{njobs}"], cwd=src_dir, check=True)
+        _run([MAKE, f"-j{njobs}"], cwd=build_subdir, check=True)
         # Install library and headers, skip documentation
-        subprocess.run(["make", "-C", "C", "install"], cwd=src_dir, check=True)
+        _run([MAKE, "-C", "C", "install"], cwd=build_subdir, check=True)
         # Install wcsconfig.h and other header files
-        subprocess.run(["make", "install-nobase_includeHEADERS"], cwd=src_dir, check=False)
+        _run([MAKE, "install-nobase_includeHEADERS"], cwd=build_subdir, check=False)
         # Install pkg-config file
         pkgconfig_dir = install_dir / "lib" / "pkgconfig"
         pkgconfig_dir.mkdir(parents=True, exist_ok=True)
-        if (src_dir / "wcsconfig.h").exists():
-            import shutil
+        if (build_subdir / "wcsconfig.h").exists():
             # Copy wcsconfig.h to the wcslib include directory
             wcslib_include = install_dir / "include" / "wcslib"
             if wcslib_include.exists():
-                shutil.copy(src_dir / "wcsconfig.h", wcslib_include / "wcsconfig.h")
-        if (src_dir / "wcslib.pc").exists():
-            import shutil
-            shutil.copy(src_dir / "wcslib.pc", pkgconfig_dir / "wcslib.pc")
+                shutil.copy(build_subdir / "wcsconfig.h", wcslib_include / "wcsconfig.h")
+        if (build_subdir / "wcslib.pc").exists():
+            shutil.copy(build_subdir / "wcslib.pc", pkgconfig_dir / "wcslib.pc")
 
         # Fix install names on macOS
         self._fix_darwin_install_names(
@@ -246,8 +438,6 @@ class CMakeBuildExt(build_ext):
             ["libwcs.8.dylib"],
         )
 
-        # Clean up build artifacts
-        subprocess.run(["make", "distclean"], cwd=src_dir, check=False)
         print(">>> wcslib built successfully")
 
     def _build_cpl(self, vendor_dir: Path, build_dir: Path, install_dir: Path, njobs: str) -> None:
@@ -255,52 +445,54 @@ class CMakeBuildExt(build_ext):
         print("\n>>> Building CPL...")
         src_dir = vendor_dir / "cpl-7.3.2"
 
+        # Build in a copy of the source tree, which is kept for incremental
+        # rebuilds, so that the vendored sources are never modified.
+        build_subdir = build_dir / f"{src_dir.name}-build"
+        self._copy_source_tree(src_dir, build_subdir)
+
         # CPL uses autoconf and needs to find the dependencies
-        env = os.environ.copy()
+        env = {**os.environ, **self.deps_env}
         # Prevent Java from being found to avoid building cpljava
         env.pop("JAVA_HOME", None)
-        env["PKG_CONFIG_PATH"] = str(install_dir / "lib" / "pkgconfig")
-        env["CFITSIO_CFLAGS"] = f"-I{install_dir / 'include'}"
-        env["CFITSIO_LIBS"] = f"-L{install_dir / 'lib'} -lcfitsio"
-        env["FFTW3_CFLAGS"] = f"-I{install_dir / 'include'}"
-        env["FFTW3_LIBS"] = f"-L{install_dir / 'lib'} -lfftw3"
-        env["WCSLIB_CFLAGS"] = f"-I{install_dir / 'include' / 'wcslib'}"
-        env["WCSLIB_LIBS"] = f"-L{install_dir / 'lib'} -lwcs"
         env["CPPFLAGS"] = f"-I{install_dir / 'include'} -I{install_dir / 'include' / 'wcslib'}"
-        lib_path = str(install_dir / "lib")
-        ldflags = f"-L{lib_path} -Wl,-rpath,{lib_path}"
-        env["LDFLAGS"] = (
-            f"{ldflags} {env['LDFLAGS']}"
-            if env.get("LDFLAGS")
-            else ldflags
-        )
-        env["LD_LIBRARY_PATH"] = (
-            f"{lib_path}:{env['LD_LIBRARY_PATH']}"
-            if env.get("LD_LIBRARY_PATH")
-            else lib_path
-        )
-        if sys.platform == "darwin":
-            env["DYLD_LIBRARY_PATH"] = (
-                f"{lib_path}:{env['DYLD_LIBRARY_PATH']}"
-                if env.get("DYLD_LIBRARY_PATH")
-                else lib_path
-            )
-
-        # Regenerate autotools files if configure is missing
-        if not (src_dir / "configure").exists():
+        # Build without debug information, which is enabled by default, and
+        # let the linker discard unused code
+        env["CFLAGS"] = f"{env.get('CFLAGS', '-O2')} -g0 {DEPS_CFLAGS}"
+        env["LDFLAGS"] = f"{env['LDFLAGS']} {GC_SECTIONS_LDFLAGS}"
+        if (
+            sys.platform.startswith("linux")
+            and not int(os.environ.get("PYCPL_DISABLE_LTO", 0))
+            and self._is_gcc(env)
+        ):
+            # Link time optimization across the CPL modules. The flags are
+            # GCC specific, other compilers build without LTO.
+            env["CFLAGS"] += " -flto=auto -fno-fat-lto-objects"
+            env["LDFLAGS"] += " -flto=auto -fuse-linker-plugin"
+        self._apply_launcher_env(env)
+
+        # Regenerate autotools files if configure is missing, or if
+        # configure.ac changed since they were last regenerated here
+        autoreconf_stamp = build_subdir / ".autoreconf_stamp"
+        configure_ac_mtime = str((build_subdir / "configure.ac").stat().st_mtime_ns)
+        if not (build_subdir / "configure").exists() or (
+            autoreconf_stamp.exists()
+            and autoreconf_stamp.read_text() != configure_ac_mtime
+        ):
             print(">>> Regenerating autotools files for CPL...")
-            subprocess.run(["autoreconf", "-i"], cwd=src_dir, env=env, check=True)
+            _run(["autoreconf", "-i"], cwd=build_subdir, env=env, check=True)
+            autoreconf_stamp.write_text(configure_ac_mtime)
 
-        subprocess.run([
+        _run([
             "./configure",
             f"--prefix={install_dir}",
             "--disable-static",
             "--enable-shared",
             "--disable-java",
-        ], cwd=src_dir, env=env, check=True)
+            "--disable-gasgano",
+        ], cwd=build_subdir, env=env, check=True)
 
-        subprocess.run(["make", f"-j{njobs}"], cwd=src_dir, check=True)
-        subprocess.run(["make", "install"], cwd=src_dir, check=True)
+        _run([MAKE, f"-j{njobs}"], cwd=build_subdir, check=True)
+        _run([MAKE, "install"], cwd=build_subdir, check=True)
 
         # Fix install names on macOS for all CPL libraries
         self._fix_darwin_install_names(
@@ -314,10 +506,99 @@ class CMakeBuildExt(build_ext):
             ],
         )
 
-        # Clean up build artifacts
-        subprocess.run(["make", "distclean"], cwd=src_dir, check=False)
         print(">>> CPL built successfully")
 
+    @staticmethod
+    def _is_gcc(env: dict[str, str]) -> bool:
+        """Check whether the C compiler used by the autoconf builds is GCC."""
+        cc = env.get("CC") or sysconfig.get_config_var("CC") or "cc"
+        try:
+            version = _run(
+                [*shlex.split(cc), "--version"],
+                capture_output=True,
+                text=True,
+                env=env,
+                check=False,
+            ).stdout
+        except OSError:
+            return False
+        # Only GCC prints the FSF copyright notice, clang also answers to
+        # "gcc" on macOS
+        return "Free Software Foundation" in version
+
+    @staticmethod
+    def _copy_source_tree(src_dir: Path, build_subdir: Path) -> None:
+        """Copy a vendored source tree to its build directory, or refresh the copy.
+
+        Regular copies are used rather than hard links, so that tools
+        rewriting files in place cannot modify the vendored sources. If the
+        copy already exists, only vendored files which are missing from it
+        or newer than their copy are copied again. Files generated in the
+        copy are kept, so that rebuilds stay incremental.
+        """
+        if not build_subdir.exists():
+            shutil.copytree(src_dir, build_subdir, symlinks=True)
+            return
+        for src in src_dir.rglob("*"):
+            if src.is_dir() and not src.is_symlink():
+                continue
+            dst = build_subdir / src.relative_to(src_dir)
+            if dst.is_symlink() or dst.exists():
+                if src.lstat().st_mtime_ns <= dst.lstat().st_mtime_ns:
+                    continue
+                dst.unlink()
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dst, follow_symlinks=False)
+
+    @staticmethod
+    def _release_args() -> list[str]:
+        """CMake arguments for a Release build of the vendored libraries.
+
+        The default Release flags are kept, but unused code is removed when
+        the shared libraries are linked. Link time optimization is used if
+        the toolchain supports it, unless PYCPL_DISABLE_LTO is set.
+        """
+        args = [
+            f"-DCMAKE_C_FLAGS_RELEASE=-O3 -DNDEBUG {DEPS_CFLAGS}",
+            f"-DCMAKE_SHARED_LINKER_FLAGS_RELEASE={GC_SECTIONS_LDFLAGS}",
+        ]
+        if not int(os.environ.get("PYCPL_DISABLE_LTO", 0)):
+            ipo_script = Path(__file__).parent.resolve() / "cmake" / "EnableIPO.cmake"
+            args += [
+                # Vendored projects require CMake 3.5, so enabling IPO needs
+                # the policy to be set explicitly.
+                "-DCMAKE_POLICY_DEFAULT_CMP0069=NEW",
+                f"-DCMAKE_PROJECT_INCLUDE={ipo_script}",
+            ]
+        return args
+
+    def _generator_args(self, build_dir: Path) -> list[str]:
+        """CMake arguments selecting the generator for a build directory.
+
+        The generator of an already configured build directory cannot be
+        changed, so it is only selected for a fresh directory. Otherwise
+        CMake keeps using the generator recorded in its cache.
+        """
+        if (build_dir / "CMakeCache.txt").exists():
+            return []
+        return self.generator_args
+
+    def _launcher_args(self) -> list[str]:
+        """CMake arguments selecting ccache as compiler launcher, if enabled."""
+        if self.ccache is None:
+            return []
+        return [
+            f"-DCMAKE_C_COMPILER_LAUNCHER={self.ccache}",
+            f"-DCMAKE_CXX_COMPILER_LAUNCHER={self.ccache}",
+        ]
+
+    def _apply_launcher_env(self, env: dict[str, str]) -> None:
+        """Prefix the autoconf compiler variables in env with ccache, if enabled."""
+        if self.ccache is None:
+            return
+        env["CC"] = f"{self.ccache} {env.get('CC', 'cc')}"
+        env["CXX"] = f"{self.ccache} {env.get('CXX', 'c++')}"
+
     def _fix_darwin_install_names(self, lib_dir: Path, libraries: list[str]) -> None:
         """Fix macOS dylib install names and dependencies to use @rpath so they can be relocated."""
         if sys.platform != "darwin":
@@ -330,7 +611,7 @@ class CMakeBuildExt(build_ext):
             dylib = lib_dir / name
             if not dylib.exists():
                 continue
-            subprocess.run(
+            _run(
                 ["install_name_tool", "-id", f"@rpath/{name}", str(dylib)],
                 check=True,
             )
@@ -342,7 +623,7 @@ class CMakeBuildExt(build_ext):
                 continue
 
             # Get list of dependencies
-            result = subprocess.run(
+            result = _run(
                 ["otool", "-L", str(dylib)],
                 capture_output=True,
                 text=True,
@@ -362,16 +643,13 @@ class CMakeBuildExt(build_ext):
                     # Extract just the library filename
                     dep_name = Path(dep_path).name
                     # Change to use @rpath
-                    subprocess.run(
+                    _run(
                         ["install_name_tool", "-change", dep_path, f"@rpath/{dep_name}", str(dylib)],
                         check=True,
                     )
 
     def _copy_vendored_libraries(self, extdir: Path) -> None:
         """Copy vendored shared libraries alongside the extension module."""
-        import shutil
-        import glob
-
         deps_install_dir = Path(self.build_temp).resolve() / "deps" / "install"
         lib_dir = deps_install_dir / "lib"
 
@@ -402,21 +680,15 @@ class CMakeBuildExt(build_ext):
                 os.symlink(link_target, dest)
                 print(f"  Creating symlink {lib_path.name} -> {link_target}")
 
-    def build_extension(self, ext: CMakeExtension) -> None:
-        # CAUTION: Using extdir requires trailing slash for auto-detection &
-        # inclusion of auxiliary "native" libs
-        #
-        # Must be in this form due to bug in .resolve() only fixed in
-        # Python 3.10+
-        ext_fullpath = Path.cwd() / self.get_ext_fullpath(ext.name)
-        extdir = ext_fullpath.parent.resolve()
-
+    def _build_common_args(self, extdir: Path) -> tuple[list[str], list[str]]:
+        """Compute the CMake configure and build arguments for an extension."""
         debug = (
             int(os.environ.get("PYCPL_BUILD_DEBUG", 0))
             if self.debug is None
             else self.debug
         )
         sanitize = os.environ.get("PYCPL_BUILD_SANITIZE", "")
+        pch = int(os.environ.get("PYCPL_BUILD_PCH", 0))
         # Preferably the namespace protected variable should be used,
         # however the environment variable VERBOSE is checked and used
         # by cmake and its generated scripts. So we are conservative here
@@ -435,19 +707,27 @@ class CMakeBuildExt(build_ext):
             debug = 1
             cmake_args += [f"-DSANITIZE:STRING={sanitize}"]
 
+        if pch:
+            cmake_args += ["-DPYCPL_USE_PCH=ON"]
+
         cfg = "Debug" if debug else "Release"
         cmake_args += [
             f"-DCMAKE_BUILD_TYPE={cfg}",  # not used on MSVC, but no harm
+            # CAUTION: Using extdir requires trailing slash for auto-detection
+            # & inclusion of auxiliary "native" libs
             f"-DCMAKE_LIBRARY_OUTPUT_DIRECTORY={extdir}{os.sep}",
             f"-DPython3_EXECUTABLE={sys.executable}",
+            "-DCMAKE_EXPORT_COMPILE_COMMANDS=ON",
         ]
 
         if "CMAKE_ARGS" in os.environ:
             cmake_args += [item for item in os.environ["CMAKE_ARGS"].split(" ") if item]
 
-        cmake_args += [f"-DPYCPL_VERSION={self.distribution.get_version()}"]
+        cmake_args += [f"-DPYCPL_VERSION={self.pycpl_version}"]
 
-        cmake_args += ["-Dpybind11_DIR:PATH=" + pybind11.get_cmake_dir()]
+        cmake_args += ["-Dpybind11_DIR:PATH=" + self.pybind11_dir]
+
+        cmake_args += self._launcher_args()
 
         cpldir = os.environ.get("CPLDIR", None)
         if cpldir is not None:
@@ -465,16 +745,29 @@ class CMakeBuildExt(build_ext):
                 # CMake 3.12+ only.
                 build_args += [f"-j{self.parallel}"]
 
+        return cmake_args, build_args
+
+    def build_extension(self, ext: CMakeExtension) -> None:
+        # Must be in this form due to bug in .resolve() only fixed in
+        # Python 3.10+
+        ext_fullpath = Path.cwd() / self.get_ext_fullpath(ext.name)
+        extdir = ext_fullpath.parent.resolve()
+
+        cmake_args, build_args = self._build_common_args(extdir)
+
         build_temp = Path(self.build_temp) / ext.name
-        if not build_temp.exists():
-            build_temp.mkdir(parents=True)
 
-        subprocess.run(
-            ["cmake", ext.sourcedir, *cmake_args], cwd=build_temp, check=True
-        )
-        subprocess.run(
-            ["cmake", "--build", ".", *build_args], cwd=build_temp, check=True
+        _run(
+            [
+                CMAKE,
+                "-S", ext.sourcedir,
+                "-B", str(build_temp),
+                *self._generator_args(build_temp),
+                *cmake_args,
+            ],
+            check=True,
         )
+        _run([CMAKE, "--build", str(build_temp), *build_args], check=True)
 
         # Copy vendored libraries alongside the extension
         self._copy_vendored_libraries(extdir)
@@ -26,6 +26,7 @@
 #include <sstream>
 
 #include <cpl_memory.h>
+#include <cpl_stats.h>
 
 namespace cpl
 {
@@ -973,6 +974,28 @@ ImageBase::reject(size y, size x)
                            coords.second);
 }
 
+void
+ImageBase::reject_pixels(const std::vector<std::pair<size, size>>& positions)
+{
+  // Check all positions first, so that the bad pixel map is left unchanged
+  // if one of them is out of range
+  const size width = get_width();
+  const size height = get_height();
+  for (const auto& [y, x] : positions) {
+    if (y < 0 || y >= height || x < 0 || x >= width) {
+      std::ostringstream oss;
+      oss << "Position (" << y << ", " << x << ") is outside of the image";
+      throw cpl::core::AccessOutOfRangeError(PYCPL_ERROR_LOCATION, oss.str());
+    }
+  }
+  for (const auto& [y, x] : positions) {
+    std::pair<size, size> coords = cpl::core::cpl_coord(x, y);
+
+    Error::throw_errors_with(cpl_image_reject, m_interface, coords.first,
+                             coords.second);
+  }
+}
+
 void
 ImageBase::accept(size y, size x)
 {
@@ -1024,6 +1047,28 @@ ImageBase::get_max(std::optional<Window> area) const
   }
 }
 
+std::pair<double, double>
+ImageBase::get_minmax(std::optional<Window> area) const
+{
+  // Both extrema are found in the same pass over the pixels
+  const cpl_stats_mode mode =
+      static_cast<cpl_stats_mode>(CPL_STATS_MIN | CPL_STATS_MAX);
+  cpl_stats* stats;
+  if (!area.has_value()) {
+    stats = Error::throw_errors_with(cpl_stats_new_from_image, m_interface,
+                                     mode);
+  } else {
+    Window selected_window = area.value();
+    stats = Error::throw_errors_with(cpl_stats_new_from_image_window,
+                                     m_interface, mode,
+                                     EXPAND_WINDOW(selected_window));
+  }
+  std::pair<double, double> minmax =
+      std::make_pair(cpl_stats_get_min(stats), cpl_stats_get_max(stats));
+  cpl_stats_delete(stats);
+  return minmax;
+}
+
 double
 ImageBase::get_mean(std::optional<Window> area) const
 {
@@ -1313,6 +1358,9 @@ ImageBase::operator=(ImageBase&& other) noexcept
 bool
 ImageBase::operator==(const ImageBase& other) const
 {
+  if (this == &other || m_interface == other.m_interface) {
+    return true;
+  }
   if (get_width() != other.get_width() || get_height() != other.get_height() ||
       get_type() != other.get_type()) {
     return false;
@@ -1341,6 +1341,17 @@ class ImageBase
    */
   void reject(size y, size x);
 
+  /**
+   * @brief Set several pixels as bad in an image
+   * @param positions (y, x) pixel positions in the image (first pixel is 0)
+   *
+   * All positions are checked before any pixel is rejected, so the bad pixel
+   * map is not modified if one of them is out of range.
+   *
+   * @throws AccessOutOfRangeError if one of the positions is out of range
+   */
+  void reject_pixels(const std::vector<std::pair<size, size>>& positions);
+
   /**
    * @brief Set a pixel as good in an image
    * @param y the y pixel position in the image (first pixel is 0)
@@ -1393,6 +1404,18 @@ class ImageBase
    */
   double get_max(std::optional<Window> area) const;
 
+  /**
+   * @brief computes minimum and maximum pixel values over an image or image
+   *        sub-window in a single pass.
+   * @param area The area of this image to operate on
+   *
+   * Images can be CPL_TYPE_FLOAT, CPL_TYPE_INT or CPL_TYPE_DOUBLE.
+   *
+   * @return the minimum and the maximum value as a pair
+   * @throws DataNotFoundError if all pixels in the area are rejected
+   */
+  std::pair<double, double> get_minmax(std::optional<Window> area) const;
+
   /**
    * @brief computes mean pixel value over an image or sub window.
    * @param area The area of this image to opreate on
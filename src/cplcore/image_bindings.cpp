@@ -150,9 +150,9 @@ std::shared_ptr<cpl::core::ImageBase>
 image_from_arr(py::iterable obj)
 {
   // Numpy array or other buffer first argument
-  // If iteration of the ndarray is too slow,
-  // then (given the numpy array is perfectly native & matches size)
-  // a memcpy from the numpy array could be faster.
+  // If the numpy array is perfectly native, C contiguous and of a
+  // pixel type CPL images support, its buffer is copied with a memcpy.
+  // Otherwise it is converted element by element.
 
   py::array input_arr;
   try {
@@ -194,13 +194,15 @@ image_from_arr(py::iterable obj)
   if (
       // All padding/alignment is native c-style:
       cpl::pystruct_type_is_native(info.format) &&
-      // Type is a good CPL type:
-      inferred_type.has_value() && inferred_type != CPL_TYPE_STRING &&
-      std::all_of(info.strides.begin(), info.strides.end(),
-                  [](ssize_t stride) -> bool {
-                    // All strides are 1.
-                    return 1 == stride;
-                  })) {
+      // Type is a CPL image pixel type, which does not need conversion.
+      // Python integers end up as 64 bit integers, which are converted
+      // below:
+      inferred_type.has_value() &&
+      (inferred_type == CPL_TYPE_INT || inferred_type == CPL_TYPE_FLOAT ||
+       inferred_type == CPL_TYPE_DOUBLE) &&
+      // Rows are stored one after another without gaps. Note that strides
+      // are given in bytes:
+      (input_arr.flags() & py::array::c_style)) {
     assert(info.itemsize ==
            static_cast<ssize_t>(cpl_type_get_sizeof(*inferred_type)));
     // The numpy storage exactly matches C-style storage
@@ -2458,6 +2460,57 @@ bind_image(py::module& m)
         cpl.core.AccessOutOfRangeError
             if the specified position is outside of the image
         )pydoc")
+      .def(
+          "reject_pixels",
+          [](cpl::core::ImageBase& self, py::object positions_like) -> void {
+            py::array positions = py::array::ensure(positions_like);
+            // An empty sequence of positions has nothing to reject
+            if (positions && positions.size() == 0) {
+              return;
+            }
+            if (!positions || positions.ndim() != 2 ||
+                positions.shape(1) != 2) {
+              throw cpl::core::IllegalInputError(
+                  PYCPL_ERROR_LOCATION,
+                  "positions must be an array of shape (N, 2)");
+            }
+            // Only integer positions are converted, casting floating point
+            // positions would silently truncate them
+            const char kind = positions.dtype().kind();
+            if (kind != 'i' && kind != 'u') {
+              throw cpl::core::IllegalInputError(
+                  PYCPL_ERROR_LOCATION, "positions must be integers");
+            }
+            auto int_positions =
+                py::array_t<size, py::array::c_style | py::array::forcecast>(
+                    positions);
+            auto pos = int_positions.unchecked<2>();
+            std::vector<std::pair<size, size>> pairs;
+            pairs.reserve(pos.shape(0));
+            for (py::ssize_t i = 0; i < pos.shape(0); ++i) {
+              pairs.emplace_back(pos(i, 0), pos(i, 1));
+            }
+            self.reject_pixels(pairs);
+          },
+          py::arg("positions"), R"pydoc(
+        Set several pixels as bad in an image
+
+        Equivalent to calling reject() for every position, but the positions are
+        rejected in one C++ loop instead of one Python call per pixel.
+
+        Parameters
+        ----------
+        positions : array_like
+            Integer array of shape (N, 2), each row being the (y, x) position of a
+            pixel in the image (first pixel is 0)
+
+        Raises
+        ------
+        cpl.core.IllegalInputError
+            if `positions` is not of shape (N, 2), or is not an integer array
+        cpl.core.AccessOutOfRangeError
+            if one of the positions is outside of the image
+        )pydoc")
       .def(
           "reject_from_mask",
           [](const cpl::core::ImageBase& self, py::object map) -> void {
@@ -2620,6 +2673,45 @@ bind_image(py::module& m)
         --------
         cpl.core.Image.get_min : Get the minimum pixel value over the entire image or image sub window.
         )pydoc")
+      .def("get_minmax", &cpl::core::ImageBase::get_minmax,
+           py::arg("window").none(true) = py::none(), R"pydoc(
+        Computes the minimum and maximum pixel values over an entire image or image sub window
+
+        Both values are computed in a single pass over the pixels, which is faster than
+        calling get_min() and get_max() separately.
+
+        Images can be cpl.core.Type.FLOAT, cpl.core.Type.INT or cpl.core.Type.DOUBLE.
+
+        Parameters
+        ----------
+        window : tuple(int,int,int,int), optional
+            Window to operate on in the format (llx, lly, urx, ury) where:
+            - `llx` Lower left X coordinate (0 for leftmost)
+            - `lly` Lower left Y coordinate (0 for lowest)
+            - `urx` Upper right X coordinate (inclusive)
+            - `ury` Upper right Y coordinate (inclusive)
+
+        Returns
+        -------
+        tuple(float, float)
+            the minimum and the maximum value in the format (min, max)
+
+        Notes
+        -----
+        Does not work on complex images.
+
+        Raises
+        ------
+        cpl.core.IllegalInputError
+            If the specified window is illegal
+        cpl.core.DataNotFoundError
+            If all pixels in the image or window are rejected
+
+        See Also
+        --------
+        cpl.core.Image.get_min : Get the minimum pixel value over the entire image or image sub window.
+        cpl.core.Image.get_max : Get the maximum pixel value over the entire image or image sub window.
+        )pydoc")
       .def("get_mean", &cpl::core::ImageBase::get_mean,
            py::arg("window").none(true) = py::none(), R"pydoc(
         Computes the mean pixel value over an entire image or sub-window.
@@ -3836,6 +3928,51 @@ bind_image(py::module& m)
            [](std::shared_ptr<cpl::core::ImageList> self) -> size {
              return self->size();
            })
+      // conversion to numpy array via np.array or np.asarray
+      .def(
+          "__array__",
+          [](const cpl::core::ImageList& self, py::object dtype,
+             const py::kwargs& /* unused */) -> py::array {
+            if (self.size() == 0) {
+              return py::array(py::dtype::from_args(dtype), 0);
+            }
+            // All images of an image list have the same type and size, so
+            // the pixel buffers can be copied into the 3d array one by one,
+            // instead of going through a numpy array for each image.
+            std::shared_ptr<cpl::core::ImageBase> first = self.get_at(0);
+            py::buffer_info info = cpl::core::run_func_for_type<
+                cpl::core::Image, buffer_info_getter, py::buffer_info>(
+                first->get_type(), first.get());
+            size nbytes = info.itemsize * info.size;
+            py::array result(py::dtype(info),
+                             std::vector<size>{self.size(), info.shape[0],
+                                               info.shape[1]});
+            char* data = static_cast<char*>(result.mutable_data());
+            for (size i = 0; i < self.size(); ++i) {
+              std::memcpy(data + i * nbytes, self.get_at(i)->data(), nbytes);
+            }
+            if (!dtype.is_none()) {
+              return result.attr("astype")(dtype);
+            }
+            return result;
+          },
+          py::arg("dtype") = py::none())
+      .def(
+          "as_array",
+          [imagelist](const cpl::core::ImageList& self) {
+            return imagelist.attr("__array__")(self);
+          },
+          R"pydoc(
+        Returns a copy of the ImageList as a 3d numpy array.
+
+        Returns
+        -------
+        numpy.ndarray
+            New numpy array of shape (len(self), height, width) containing the
+            pixel values of the images in the ImageList. The data type of the
+            array will be the same as the data type of the images. An empty
+            ImageList gives an empty array.
+        )pydoc")
       .def("__str__",
            [](const cpl::core::ImageList& self) -> std::string {
              return self.dump(cpl::core::Window::All);
@@ -4233,6 +4370,57 @@ bind_image(py::module& m)
         cpl.core.UnsupportedModeError
             if the passed mode is none of the above listed
         )pydoc")
+      .def("collapse_sigclip_into",
+           &cpl::core::ImageList::collapse_sigclip_into, py::arg("contrib"),
+           py::arg("kappalow"), py::arg("kappahigh"), py::arg("keepfrac"),
+           py::arg("mode"), R"pydoc(
+        Collapse an imagelist with kappa-sigma-clipping rejection into a given contribution map
+
+        Same as cpl.core.ImageList.collapse_sigclip_create, except that the contribution
+        map is written into `contrib` instead of a newly created image. When collapsing
+        the same image list repeatedly, e.g. with varying `keepfrac`, the contribution
+        map can be allocated once and reused.
+
+        Parameters
+        ----------
+        contrib : cpl.core.Image
+            Image of type cpl.core.Type.INT with the same size as the images in the list.
+            On success it contains the contribution map, i.e. the number of kept
+            (non-clipped) values after the iterative process on every pixel.
+        kappalow : float
+            kappa-factor for lower clipping threshold
+        kappahigh : float
+            kappa-factor for upper clipping threshold
+        keepfrac : float
+            The fraction of values to keep (0.0 < keepfrac <= 1.0)
+        mode : cpl.core.ImageList.Collapse
+            Clipping mode, cpl.core.ImageList.Collapse.MEAN or cpl.core.ImageList.Collapse.MEDIAN
+
+        Returns
+        -------
+        cpl.core.Image
+            The collapsed image
+
+        Raises
+        ------
+        cpl.core.DataNotFoundError
+            if there are less than 2 images in the list
+        cpl.core.IllegalInputError
+            if the sum of `kappalow` and `kappahigh` is non-positive,
+        cpl.core.AccessOutOfRangeError
+            if keepfrac is outside the required interval which is 0.0 < keepfrac <= 1.0
+        cpl.core.IllegalInputError
+            if `contrib` is not of type cpl.core.Type.INT or its size differs from the
+            size of the images in the list
+        cpl.core.InvalidTypeError
+            if the type of the input imagelist is unsupported
+        cpl.core.UnsupportedModeError
+            if the passed mode is none of the above listed
+
+        See Also
+        --------
+        cpl.core.ImageList.collapse_sigclip_create : Collapse an imagelist with kappa-sigma-clipping rejection
+        )pydoc")
       .def("collapse_median_create",
            &cpl::core::ImageList::collapse_median_create, R"pydoc(
         Create a median image from the Imagelist
@@ -41,7 +41,8 @@ ImageList::ImageList()
 ImageList::ImageList(std::vector<std::shared_ptr<ImageBase>> images)
     : m_interface(Error::throw_errors_with(cpl_imagelist_new))
 {
-  for (std::shared_ptr<ImageBase> i : images) {
+  m_images.reserve(images.size());
+  for (const std::shared_ptr<ImageBase>& i : images) {
     append(i);
   }
 }
@@ -315,6 +316,17 @@ ImageList::collapse_sigclip_create(double kappalow, double kappahigh,
   }
 }
 
+std::shared_ptr<ImageBase>
+ImageList::collapse_sigclip_into(ImageBase& contrib, double kappalow,
+                                 double kappahigh, double keepfrac,
+                                 cpl_collapse_mode mode)
+{
+  cpl_image* res = Error::throw_errors_with(
+      cpl_imagelist_collapse_sigclip_create, m_interface, kappalow, kappahigh,
+      keepfrac, mode, contrib.m_interface);
+  return ImageBase::make_image(res);
+}
+
 std::shared_ptr<ImageList>
 ImageList::swap_axis_create(cpl_swap_axis mode) const
 {
@@ -340,7 +352,7 @@ ImageList::save(const std::filesystem::path& filename, const PropertyList& pl,
 }
 
 bool
-ImageList::is_uniform()
+ImageList::is_uniform() const
 {
   int res = Error::throw_errors_with(cpl_imagelist_is_uniform, m_interface);
   // 0=uniform, 1=empty, positive=non-uniform, negative=error
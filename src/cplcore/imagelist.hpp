@@ -304,6 +304,29 @@ class ImageList
   collapse_sigclip_create(double kappalow, double kappahigh, double keepfrac,
                           cpl_collapse_mode mode);
 
+  /**
+   * @brief Collapse an imagelist with kappa-sigma-clipping rejection, writing
+   *        the contribution map into a pre-allocated image
+   * @param contrib Pre-allocated image of type CPL_TYPE_INT and size equal to
+   *                the images in the imagelist, receiving the contribution map
+   * @param kappalow kappa-factor for lower clipping threshold
+   * @param kappahigh kappa-factor for upper clipping threshold
+   * @param keepfrac The fraction of values to keep (0.0 < keepfrac <= 1.0)
+   * @param mode Clipping mode, CPL_COLLAPSE_MEAN or CPL_COLLAPSE_MEDIAN
+   *
+   * Same as collapse_sigclip_create(), except that the contribution map is not
+   * allocated for every call. This is useful when collapsing repeatedly, e.g.
+   * with varying keepfrac.
+   *
+   * @return The collapsed image
+   * @throws IllegalInputError if contrib is not of type CPL_TYPE_INT or does
+   * not match the size of the images in the imagelist
+   * @see collapse_sigclip_create
+   */
+  std::shared_ptr<ImageBase>
+  collapse_sigclip_into(ImageBase& contrib, double kappalow, double kappahigh,
+                        double keepfrac, cpl_collapse_mode mode);
+
   /**
    * @brief Divide an image list by an image.
    * @param img image for division
@@ -479,7 +502,7 @@ class ImageList
 
   */
   /*----------------------------------------------------------------------------*/
-  bool is_uniform();
+  bool is_uniform() const;
 
 
   /*----------------------------------------------------------------------------*/
@@ -21,6 +21,7 @@
 
 #include "cplcore/mask.hpp"
 
+#include <algorithm>
 #include <cstdio>
 #include <cstring>
 #include <sstream>
@@ -32,6 +33,70 @@ namespace cpl
 {
 namespace core
 {
+namespace
+{
+/**
+ * @brief Threshold pixels of an image without bad pixels into mask data
+ *
+ * Same result as cpl_mask_threshold_image() for an image without a bad pixel
+ * map. The loop has no branches, so the compiler can vectorise it.
+ */
+template <typename T>
+void
+threshold_pixels(const T* pixels, cpl_binary* out, size npix, double lo_cut,
+                 double hi_cut, bool inval)
+{
+  const cpl_binary flip = inval ? CPL_BINARY_0 : CPL_BINARY_1;
+  for (size i = 0; i < npix; ++i) {
+    const double value = pixels[i];
+    out[i] = static_cast<cpl_binary>((lo_cut < value) & (value < hi_cut)) ^
+             flip;
+  }
+}
+
+/*
+ * Transpose the n x n pixels of source into out, optionally reversing the
+ * order of the source rows and/or columns. This covers the turns by 90
+ * degrees and the flips around the diagonals of a square mask.
+ * cpl_mask_turn() and cpl_mask_flip() walk the source in one direction and
+ * the output in the other, so for large masks every write misses the
+ * cache. Working on tiles keeps both in cache.
+ */
+void
+transpose_pixels(const cpl_binary* source, cpl_binary* out, size n,
+                 bool reverse_rows, bool reverse_columns)
+{
+  constexpr size tile = 64;
+  for (size i0 = 0; i0 < n; i0 += tile) {
+    const size i1 = std::min(i0 + tile, n);
+    for (size j0 = 0; j0 < n; j0 += tile) {
+      const size j1 = std::min(j0 + tile, n);
+      for (size i = i0; i < i1; ++i) {
+        const size x = reverse_columns ? n - 1 - i : i;
+        cpl_binary* out_row = out + i * n;
+        for (size j = j0; j < j1; ++j) {
+          const size y = reverse_rows ? n - 1 - j : j;
+          out_row[j] = source[y * n + x];
+        }
+      }
+    }
+  }
+}
+
+/*
+ * Square masks keep their dimensions when transposed, so the result can be
+ * written back into the same cpl_mask.
+ */
+void
+transpose_square(Mask& self, bool reverse_rows, bool reverse_columns)
+{
+  cpl_binary* pixels = self.data();
+  const std::vector<cpl_binary> source(pixels, pixels + self.get_size());
+  transpose_pixels(source.data(), pixels, self.get_width(), reverse_rows,
+                   reverse_columns);
+}
+}  // namespace
+
 Mask::Mask(cpl_mask* to_steal) noexcept : m_interface(to_steal) {}
 
 Mask::Mask(const Mask& other)
@@ -53,16 +118,49 @@ Mask::Mask(Mask&& other) noexcept
 }
 
 Mask::Mask(const ImageBase& in, double lo_cut, double hi_cut)
+    : m_interface(Error::throw_errors_with(cpl_mask_new, in.get_width(),
+                                           in.get_height()))
 {
-  m_interface = Error::throw_errors_with(cpl_mask_threshold_image_create,
-                                         in.ptr(), lo_cut, hi_cut);
+  try {
+    threshold_image(in, lo_cut, hi_cut, true);
+  }
+  catch (...) {
+    // The destructor is not run for a constructor that throws
+    cpl_mask_delete(m_interface);
+    throw;
+  }
 }
 
 void
 Mask::threshold_image(const ImageBase& image, double lo_cut, double hi_cut,
                       bool inval)
 {
-  Error::throw_errors_with(cpl_mask_threshold_image, m_interface, image.ptr(),
+  // CPL tests the bad pixel map of the image for every pixel, even if there
+  // is none. Without a bad pixel map the pixels are thresholded here with a
+  // loop that can be vectorised. Anything else, including size mismatches
+  // and unsupported types, is left to CPL and its error handling.
+  const cpl_image* input = image.ptr();
+  if (cpl_image_get_bpm_const(input) == nullptr &&
+      image.get_width() == get_width() && image.get_height() == get_height()) {
+    const size npix = get_size();
+    switch (image.get_type()) {
+      case CPL_TYPE_DOUBLE:
+        threshold_pixels(cpl_image_get_data_double_const(input), data(), npix,
+                         lo_cut, hi_cut, inval);
+        return;
+      case CPL_TYPE_FLOAT:
+        threshold_pixels(cpl_image_get_data_float_const(input), data(), npix,
+                         lo_cut, hi_cut, inval);
+        return;
+      case CPL_TYPE_INT:
+        threshold_pixels(cpl_image_get_data_int_const(input), data(), npix,
+                         lo_cut, hi_cut, inval);
+        return;
+      default:
+        break;
+    }
+  }
+  Error::throw_errors_with(cpl_mask_threshold_image, m_interface, input,
                            lo_cut, hi_cut, inval);
 }
 
@@ -110,23 +208,24 @@ Mask::Mask(cpl::core::size width, cpl::core::size height,
 {
 }
 
-Mask::Mask(cpl::core::size width, cpl::core::size height, std::string bitmask)
+Mask::Mask(cpl::core::size width, cpl::core::size height,
+           std::string_view bitmask)
     // THIS DOESN'T WORK because the underlying string might be deallocated
     // whilst the c_str() ptr is still in use by this mask. Not to mention,
     // the const cast requirement telling us somethings' wrong.
     // : m_interface(cpl_mask_wrap(width, height, const_cast<unsigned char *>(
     //     reinterpret_cast<const unsigned char *>(bitmask.c_str()))))
-    : m_interface(cpl_mask_new(width, height))
+    : m_interface(Error::throw_errors_with(cpl_mask_new, width, height))
 {
   if (bitmask.length() != get_size()) {
+    // The destructor is not run for a constructor that throws
+    cpl_mask_delete(m_interface);
     throw IllegalInputError(
         PYCPL_ERROR_LOCATION,
         "Mask input string size doesn't match width * height");
   }
 
-  unsigned char* data_ptr =
-      Error::throw_errors_with(cpl_mask_get_data, m_interface);
-  std::memcpy(data_ptr, bitmask.c_str(), bitmask.length());
+  std::memcpy(data(), bitmask.data(), bitmask.length());
 }
 
 Mask::~Mask()
@@ -250,7 +349,11 @@ Mask::and_with(const Mask& other)
 Mask
 Mask::operator&(const Mask& other) const
 {
-  return Mask(*this).and_with(other);
+  // and_with() returns a reference, so returning its result directly would
+  // copy the whole mask a second time. The same applies to | and ^ below.
+  Mask result(*this);
+  result.and_with(other);
+  return result;
 }
 
 Mask&
@@ -263,7 +366,9 @@ Mask::or_with(const Mask& other)
 Mask
 Mask::operator|(const Mask& other) const
 {
-  return Mask(*this).or_with(other);
+  Mask result(*this);
+  result.or_with(other);
+  return result;
 }
 
 Mask&
@@ -276,7 +381,9 @@ Mask::xor_with(const Mask& other)
 Mask
 Mask::operator^(const Mask& other) const
 {
-  return Mask(*this).xor_with(other);
+  Mask result(*this);
+  result.xor_with(other);
+  return result;
 }
 
 Mask&
@@ -289,7 +396,9 @@ Mask::negate()
 Mask
 Mask::operator~() const
 {
-  return Mask(*this).negate();
+  Mask result(*this);
+  result.negate();
+  return result;
 }
 
 Mask
@@ -320,6 +429,11 @@ Mask::extract(Window window) const
 Mask&
 Mask::rotate(int right_angle_turns)
 {
+  const int turns = (right_angle_turns % 4 + 4) % 4;
+  if ((turns == 1 || turns == 3) && get_width() == get_height()) {
+    transpose_square(*this, turns == 3, turns == 1);
+    return *this;
+  }
   Error::throw_errors_with(cpl_mask_turn, m_interface, right_angle_turns);
   return *this;
 }
@@ -345,6 +459,10 @@ Mask::insert(const Mask& to_insert, size y, size x)
 Mask&
 Mask::flip(int axis)
 {
+  if ((axis == 1 || axis == 3) && get_width() == get_height()) {
+    transpose_square(*this, axis == 3, axis == 3);
+    return *this;
+  }
   Error::throw_errors_with(cpl_mask_flip, m_interface, axis);
   return *this;
 }
@@ -359,19 +477,48 @@ Mask::move(size nb_cut, const std::vector<size>& positions)
    *
    *
    */
-  if (nb_cut * nb_cut != positions.size()) {
-    throw IllegalInputError(PYCPL_ERROR_LOCATION,
-                            "positions not equal to nb_cut^2");
-  }
-  if (this->get_width() % nb_cut != 0 || this->get_height() % nb_cut != 0 ||
-      nb_cut < 1) {
+  if (nb_cut < 1 || this->get_width() % nb_cut != 0 ||
+      this->get_height() % nb_cut != 0) {
     throw IllegalInputError(PYCPL_ERROR_LOCATION,
                             "nb_cut of " + std::to_string(nb_cut) +
                                 " cant slice mask of shape" +
                                 std::to_string(this->get_width()) + "x" +
                                 std::to_string(this->get_height()));
   }
-  Error::throw_errors_with(cpl_mask_move, m_interface, nb_cut, &positions[0]);
+  if (nb_cut * nb_cut != positions.size()) {
+    throw IllegalInputError(PYCPL_ERROR_LOCATION,
+                            "positions not equal to nb_cut^2");
+  }
+  // Same check as cpl_mask_move(): positions must be a permutation of
+  // 1..nb_cut^2
+  std::vector<size> sorted_positions(positions);
+  std::sort(sorted_positions.begin(), sorted_positions.end());
+  for (size i = 0; i < nb_cut * nb_cut; ++i) {
+    if (sorted_positions[i] != i + 1) {
+      throw IllegalInputError(PYCPL_ERROR_LOCATION,
+                              "positions is not a permutation of the tiles");
+    }
+  }
+
+  // cpl_mask_move() copies one pixel at a time. A tile row is contiguous
+  // in both the source and the destination, so copy whole rows instead.
+  const size nx = get_width();
+  const size tile_nx = nx / nb_cut;
+  const size tile_ny = get_height() / nb_cut;
+  cpl_binary* pixels = data();
+  const std::vector<cpl_binary> source(pixels, pixels + get_size());
+
+  for (size j = 0; j < nb_cut; ++j) {
+    for (size i = 0; i < nb_cut; ++i) {
+      const size tile_x = (positions[i + j * nb_cut] - 1) % nb_cut;
+      const size tile_y = (positions[i + j * nb_cut] - 1) / nb_cut;
+      for (size l = 0; l < tile_ny; ++l) {
+        std::memcpy(pixels + tile_x * tile_nx + nx * (l + tile_y * tile_ny),
+                    source.data() + i * tile_nx + nx * (l + j * tile_ny),
+                    tile_nx);
+      }
+    }
+  }
   return *this;
 }
 
@@ -419,12 +566,21 @@ Mask::unwrap(Mask&& self)
 
 Mask::operator std::string() const
 {
-  return std::string(reinterpret_cast<const char*>(data()));
+  // The mask is binary data, so don't stop at the first zero byte
+  return std::string(reinterpret_cast<const char*>(data()), get_size());
 }
 
 bool
 Mask::operator==(const Mask& other) const
 {
+  if (this == &other || m_interface == other.m_interface) {
+    return true;
+  }
+  // Masks of different shapes may still have the same number of pixels
+  if (get_width() != other.get_width() || get_height() != other.get_height()) {
+    return false;
+  }
+  // memcmp stops at the first differing byte
   return std::memcmp(data(), other.data(), get_size()) == 0;
 }
 
@@ -27,6 +27,7 @@
 #include <functional>
 #include <optional>
 #include <string>
+#include <string_view>
 #include <utility>
 #include <vector>
 
@@ -93,7 +94,7 @@ class Mask
    * If the size of the bitmask doesn't match width * height,
    * an IllegalInputError is thrown.
    */
-  Mask(size width, size height, std::string bitmask);
+  Mask(size width, size height, std::string_view bitmask);
 
   ~Mask();
 
@@ -269,7 +270,7 @@ class Mask
   Mask collapse_rows() const;
   /**
    * @brief Create a 1-column mask, all elements are the logical AND
-   *        of each cell in its corresponding column. Height is kept the same
+   *        of each cell in its corresponding row. Height is kept the same
    */
   Mask collapse_cols() const;
 
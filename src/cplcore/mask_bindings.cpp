@@ -63,10 +63,36 @@ bind_mask(py::module& m)
                [](int width, int height, py::object data) -> cpl::core::Mask {
                  if (data.is_none()) {
                    return cpl::core::Mask(width, height, nullptr);
-                 } else {
-                   return cpl::core::Mask(width, height,
-                                          std::string(data.cast<py::bytes>()));
                  }
+                 // Any bytes-like object (bytes, bytearray, memoryview, numpy
+                 // array): the Mask copies its buffer once
+                 py::buffer buf;
+                 try {
+                   buf = data.cast<py::buffer>();
+                 }
+                 catch (const py::cast_error& /* unused */) {
+                   throw py::type_error(
+                       std::string("expected a bytes-like object, not ") +
+                       data.get_type().attr("__name__").cast<std::string>());
+                 }
+                 py::buffer_info info = buf.request();
+                 // Elements must be single bytes stored one after another
+                 bool contiguous = info.itemsize == 1;
+                 ssize_t expected_stride = 1;
+                 for (ssize_t dim = info.ndim - 1; dim >= 0; --dim) {
+                   contiguous = contiguous &&
+                                (info.strides[dim] == expected_stride ||
+                                 info.shape[dim] == 1);
+                   expected_stride *= info.shape[dim];
+                 }
+                 if (!contiguous) {
+                   throw py::value_error(
+                       "expected a contiguous buffer of single bytes");
+                 }
+                 return cpl::core::Mask(
+                     width, height,
+                     std::string_view(static_cast<const char*>(info.ptr),
+                                      info.size));
                }),
            py::arg("width"), py::arg("height"), py::arg("data") = py::none())
       .def_static("load", cpl::core::load_mask, py::arg("filename"),
@@ -171,6 +197,7 @@ bind_mask(py::module& m)
       .def("__or__", &cpl::core::Mask::operator|)
       .def("__xor__", &cpl::core::Mask::operator^)
       .def("__invert__", &cpl::core::Mask::operator~)
+      .def("invert", [](cpl::core::Mask& self) -> void { self.negate(); })
       .def("collapse_rows", &cpl::core::Mask::collapse_rows)
       .def("collapse_cols", &cpl::core::Mask::collapse_cols)
       .def("extract", &cpl::core::Mask::extract)
@@ -248,6 +275,14 @@ bind_mask(py::module& m)
                     height = len(lists)
                     if len(lists) == 0:
                         raise ValueError("Mask expected a non-empty list of lists, empty list given")
+                    if isinstance(lists, np.ndarray):
+                        # Convert the whole array at once. A bool array already has the
+                        # byte layout of a mask, other types are compared against zero.
+                        if lists.ndim != 2:
+                            raise ValueError("Mask from an array requires a 2d array")
+                        if lists.dtype != np.bool_:
+                            lists = lists != 0
+                        return _Mask1D(lists.shape[1], height, np.ascontiguousarray(lists).tobytes())
                     width = len(lists[0])
 
                     maskbytes = bytearray()
@@ -290,12 +325,37 @@ bind_mask(py::module& m)
                         return cls(_Mask1D.load(*args))
                     else:
                         return cls(_Mask1D.load(fitsfile, extension, plane))
+
+                @classmethod
+                def ones(cls, width, height):
+                    '''
+                    Create a mask with all elements set to True.
+
+                    Same as ~Mask(width, height), but only one mask is allocated.
+
+                    Parameters
+                    ----------
+                    width : int
+                        width of the new mask
+                    height : int
+                        height of the new mask
+
+                    Raises
+                    ------
+                    cpl.core.IllegalInputError
+                        if width or height is not positive
+                    '''
+                    new_mask = _Mask1D(width, height)
+                    new_mask.invert()
+                    return cls(new_mask)
                 
                 def __new__(cls,*args):
                     '''
                     Generate a new Mask with the following formats:
                     Mask(Collection) : Pass a non-empty list of homogeneous lists
-                    Mask(width, height, bytes) : Build a 2d mask from a bytestring with given dimensions
+                    Mask(width, height, bytes) : Build a 2d mask from a bytestring with given dimensions.
+                        Any bytes-like object (bytearray, memoryview, numpy array of single bytes) can
+                        be used in place of bytes
                     
                     Raises
                     ------
@@ -304,7 +364,7 @@ bind_mask(py::module& m)
                     '''
                     if len(args) == 1 and isinstance(args[0], Collection):
                         new_mask = Mask._2d_to_bytes(args[0]) #Non-empty list of homogenous lists
-                    elif len(args) == 3 and isinstance(args[2], bytes):
+                    elif len(args) == 3 and isinstance(args[2], (bytes, bytearray, memoryview, np.ndarray)):
                         new_mask = _Mask1D(*args) #Optional bytes present
                     elif len(args) == 3 and isinstance(args[0], Image):
                         new_mask = _Mask1D(*args) #Create new mask using image thresholding
@@ -319,6 +379,11 @@ bind_mask(py::module& m)
 
                     obj._mask= new_mask
                     return obj
+
+                def __reduce__(self):
+                    # The ndarray implementation would not restore the wrapped CPL mask
+                    return (self.__class__, (self.width, self.height, self.tobytes()))
+
                 def rotate(self, turns):
                     '''
                     Rotate this mask by a multiple of 90 degrees clockwise
@@ -356,15 +421,15 @@ bind_mask(py::module& m)
                     """ Number of rows high this mask is"""
                     return self._mask.height
 
-                #Checks equality by xoring the two masks
                 def __eq__(self, other):
                     '''
-                    Checks equality by xoring the two masks
+                    Checks that both masks have the same dimensions and elements
                     '''
                     if not isinstance(other, self.__class__):
                         return False
 
-                    return Mask(self._mask.__xor__(other._mask)).is_empty()
+                    # Compares the buffers directly, no XOR mask is allocated
+                    return self._mask == other._mask
 
                 def copy(self):
                     '''
@@ -386,11 +451,21 @@ bind_mask(py::module& m)
 
                     Parameters
                     ----------
-                    window : int
-                        Rectangle to count bits in the format (x1,y1,x2,y2)
+                    window : tuple(int, int, int, int), optional
+                        Rectangle to count bits in the format (x1,y1,x2,y2), inclusive.
+                        Defaults to the entire mask.
+
+                    Returns
+                    -------
+                    int
+                        Number of elements set to True
 
+                    Raises
+                    ------
+                    cpl.core.IllegalInputError
+                        if the window is not inside the mask
                     '''
-                    return self._mask.count() if window == None else self._mask.count(window)
+                    return self._mask.count() if window is None else self._mask.count(window)
 
                 def __and__(self, other):
                     return Mask(self._mask.__and__(other._mask))
@@ -404,17 +479,25 @@ bind_mask(py::module& m)
                 def __invert__(self):
                     return Mask(self._mask.__invert__())
 
+                def invert(self):
+                    '''
+                    Invert this mask in place, setting all True elements to False and vice versa.
+
+                    Unlike ~mask no new mask is created.
+                    '''
+                    self._mask.invert()
+
                 def collapse_rows(self):
                     '''
-                    Create a 1-row mask, all elements are the logical AND of each cell in its 
-                    corresponding column. Width is kept the same
+                    Create a 1-row mask, all elements are the logical AND of each cell in its
+                    corresponding column. Width is kept the same.
                     '''
                     return Mask(self._mask.collapse_rows())
 
                 def collapse_cols(self):
                     '''
-                    Create a 1-column mask, all elements are the logical AND of each cell in its 
-                    corresponding column. Height is kept the same.
+                    Create a 1-column mask, all elements are the logical AND of each cell in its
+                    corresponding row. Height is kept the same.
                     '''
                     return Mask(self._mask.collapse_cols())
 
@@ -497,6 +580,8 @@ bind_mask(py::module& m)
                         if angle is not as specified
                     """
                     self._mask.flip(axis)
+                    # Flipping around a diagonal swaps width and height
+                    self.shape=(self._mask.height, self._mask.width)
 
                 def move(self, nb_cut, positions):
                     '''
@@ -718,6 +803,43 @@ bind_mask(py::module& m)
                     threshold_mask = cls(image.width, image.height)
                     threshold_mask._mask.threshold_image(image, lo_cut, hi_cut, inval)
                     return threshold_mask
+
+                def fill_from_threshold(self, image, lo_cut, hi_cut, inval=True):
+                    '''
+                    Overwrite this Mask by applying the given thresholds to a `cpl.core.Image`.
+
+                    Unlike threshold_image no new Mask is created, so a single Mask can be
+                    reused when thresholding many images of the same size.
+
+                    Parameters
+                    ----------
+                    image : cpl.core.Image
+                        Image to threshold, with the same size as this mask
+                    lo_cut : float
+                        Lower bound for threshold
+                    hi_cut : float
+                        Upper bound for threshold
+                    inval : bool, optional
+                        This value (0 or 1, False or True) is assigned where
+                        the pixel value is not marked as rejected and is strictly
+                        inside the provided interval. The other positions are assigned
+                        the other value. Defaults to True.
+
+                    Raises
+                    ------
+                    cpl.core.UnsupportedModeError
+                        if the image data type is unsupported
+                    cpl.core.IncompatibleInputError
+                        if the mask and the image have different sizes
+
+                    Notes
+                    -----
+                    The input image type can be cpl.core.Type.DOUBLE, cpl.core.Type.FLOAT or cpl.core.Type.INT.
+
+                    If `lo_cut` is greater than or equal to `hi_cut`, then the mask is filled with
+                    outval (opposite of `inval`).
+                    '''
+                    self._mask.threshold_image(image, lo_cut, hi_cut, inval)
         )",
       m.attr("__dict__"));
 }
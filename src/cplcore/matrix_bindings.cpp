@@ -17,6 +17,7 @@
 #include "matrix_bindings.hpp"
 
 #include <cstddef>
+#include <cstring>
 #include <filesystem>
 #include <sstream>
 #include <string>
@@ -182,6 +183,18 @@ bind_matrix(py::module& m)
                                                     "rows cannot be 0");
                }
                size columns = input_arr.size() / rows.value();
+               // Numeric data: copy the whole buffer at once, as for 2d data
+               const char kind = input_arr.dtype().kind();
+               if (input_arr.size() > 0 &&
+                   (kind == 'b' || kind == 'i' || kind == 'u' || kind == 'f')) {
+                 auto values = py::array_t<double, py::array::c_style |
+                                                       py::array::forcecast>(
+                     input_arr);
+                 return cpl::core::Matrix(
+                     rows.value(), columns,
+                     std::vector<double>(values.data(),
+                                         values.data() + values.size()));
+               }
                return cpl::core::Matrix(rows.value(), columns,
                                         input_arr.cast<std::vector<double>>());
 
@@ -194,6 +207,19 @@ bind_matrix(py::module& m)
                  throw cpl::core::IllegalInputError(PYCPL_ERROR_LOCATION,
                                                     err_msg.str());
                }
+               // Numeric data: copy the whole buffer at once instead of
+               // converting the elements one by one
+               const char kind = input_arr.dtype().kind();
+               if (input_arr.size() > 0 &&
+                   (kind == 'b' || kind == 'i' || kind == 'u' || kind == 'f')) {
+                 auto values = py::array_t<double, py::array::c_style |
+                                                       py::array::forcecast>(
+                     input_arr);
+                 return cpl::core::Matrix(
+                     values.shape(0), values.shape(1),
+                     std::vector<double>(values.data(),
+                                         values.data() + values.size()));
+               }
                return matrix_from_python_matrix(data);
              }
            }),
@@ -452,6 +478,43 @@ bind_matrix(py::module& m)
         cpl.core.IllegalInputError
             nrow or ncol are not positive.
         )pydoc")
+      .def(
+          "assign",
+          [](cpl::core::Matrix& self,
+             py::array_t<double, py::array::c_style | py::array::forcecast>
+                 values) -> void {
+            if (values.ndim() != 2 || values.shape(0) != self.get_nrow() ||
+                values.shape(1) != self.get_ncol()) {
+              std::ostringstream err_msg;
+              err_msg << "expected an array of shape (" << self.get_nrow()
+                      << ", " << self.get_ncol() << ")";
+              throw cpl::core::IncompatibleInputError(PYCPL_ERROR_LOCATION,
+                                                      err_msg.str());
+            }
+            std::memcpy(self.get_data(), values.data(),
+                        values.size() * sizeof(double));
+          },
+          py::arg("values"), R"pydoc(
+        Overwrite all matrix elements with the values of an array.
+
+        The values are copied into `self` with a single copy of the array
+        buffer, which is much faster than filling the matrix element by
+        element for large matrices.
+
+        Parameters
+        ----------
+        values : array-like
+            2d array of numbers with the same shape as `self`.
+
+        Raises
+        ------
+        cpl.core.IncompatibleInputError
+            `values` is not 2d or its shape differs from the shape of `self`.
+
+        See Also
+        --------
+        cpl.core.Matrix.fill : Write the same value to all matrix elements.
+        )pydoc")
       .def("shift", &cpl::core::Matrix::shift, py::arg("rshift"),
            py::arg("cshift"), R"pydoc(
         Shift matrix elements.
@@ -1308,9 +1371,6 @@ bind_matrix(py::module& m)
         cpl.core.multiply : Multiply `self` by `other`, element by element.
         cpl.core.matrix.multiply_scalar : Multiply `self` by a scalar.
         )pydoc")
-      .def("__deepcopy__",
-           [](cpl::core::Matrix& self, py::dict /* memo */)
-               -> cpl::core::Matrix { return self.duplicate(); })
       .def("product_transpose", &cpl::core::Matrix::product_transpose,
            py::arg("ma"), py::arg("mb"), R"pydoc(
         Fill a matrix with the product of A * B'
@@ -1491,6 +1551,24 @@ bind_matrix(py::module& m)
           },
           py::keep_alive<0, 1>(), "Iterate through the matrix rows")
       .def("__len__", &cpl::core::Matrix::get_nrow)
+      // conversion to numpy array via np.array or np.asarray
+      .def(
+          "__array__",
+          [](const cpl::core::Matrix& self, py::object dtype,
+             const py::kwargs& /* unused */) -> py::array {
+            // A copy rather than a view: resizing the matrix reallocates its
+            // buffer, which would leave a view dangling. The rows are stored
+            // contiguously, so this is a single memcpy.
+            py::array_t<double> result(
+                std::vector<size>{self.get_nrow(), self.get_ncol()});
+            std::memcpy(result.mutable_data(), self.get_data(),
+                        sizeof(double) * result.size());
+            if (!dtype.is_none()) {
+              return result.attr("astype")(dtype);
+            }
+            return result;
+          },
+          py::arg("dtype") = py::none())
       .def("__str__", &cpl::core::Matrix::dump)
       .def(
           "__getitem__",
@@ -1619,6 +1697,30 @@ bind_matrix(py::module& m)
              ss << "])";
              return ss.str();
            })
+      .def(
+          "copy",
+          [](const cpl::core::Matrix& self) -> cpl::core::Matrix {
+            return cpl::core::Matrix(self);
+          },
+          R"pydoc(
+        Return a copy of the Matrix.
+
+        The matrix buffer is duplicated in a single copy, which is much cheaper
+        than going through `copy.deepcopy()`.
+
+        Returns
+        -------
+        cpl.core.Matrix
+            A new Matrix containing a copy of the elements of the original.
+
+        See Also
+        --------
+        cpl.core.Matrix.copy_values_from : Copy values from a matrix into `self`.
+        )pydoc")
+      .def("__copy__",
+           [](const cpl::core::Matrix& self) -> cpl::core::Matrix {
+             return cpl::core::Matrix(self);
+           })
       .def("__deepcopy__",
            [](const cpl::core::Matrix& self, py::object /* memo */)
                -> cpl::core::Matrix { return cpl::core::Matrix(self); });
@@ -23,6 +23,21 @@ namespace cpl
 namespace core
 {
 
+namespace
+{
+/*
+ * CPL cuts every message line, including the component tag, to
+ * CPL_MAX_MSG_LENGTH bytes. Copy at most that much, so an oversized
+ * component name or message isn't duplicated in full just to be thrown
+ * away by CPL.
+ */
+std::string
+truncate_message(std::string_view text)
+{
+  return std::string(text.substr(0, CPL_MAX_MSG_LENGTH - 1));
+}
+}  // namespace
+
 int Msg::current_indentation = 0;
 int Msg::current_width = 0;
 bool Msg::display_thread_id = false;
@@ -113,31 +128,35 @@ Msg::get_domain()
 }
 
 void
-Msg::debug(const std::string& component, const std::string& message)
+Msg::debug(std::string_view component, std::string_view message)
 {
-  cpl_msg_debug(component.c_str(), "%s",
-                message.c_str());  // Function doesn't throw any errors
+  // Function doesn't throw any errors
+  cpl_msg_debug(truncate_message(component).c_str(), "%s",
+                truncate_message(message).c_str());
 }
 
 void
-Msg::error(const std::string& component, const std::string& message)
+Msg::error(std::string_view component, std::string_view message)
 {
-  cpl_msg_error(component.c_str(), "%s",
-                message.c_str());  // Function doesn't throw any errors
+  // Function doesn't throw any errors
+  cpl_msg_error(truncate_message(component).c_str(), "%s",
+                truncate_message(message).c_str());
 }
 
 void
-Msg::info(const std::string& component, const std::string& message)
+Msg::info(std::string_view component, std::string_view message)
 {
-  cpl_msg_info(component.c_str(), "%s",
-               message.c_str());  // Function doesn't throw any errors
+  // Function doesn't throw any errors
+  cpl_msg_info(truncate_message(component).c_str(), "%s",
+               truncate_message(message).c_str());
 }
 
 void
-Msg::warning(const std::string& component, const std::string& message)
+Msg::warning(std::string_view component, std::string_view message)
 {
-  cpl_msg_warning(component.c_str(), "%s",
-                  message.c_str());  // Function doesn't throw any errors
+  // Function doesn't throw any errors
+  cpl_msg_warning(truncate_message(component).c_str(), "%s",
+                  truncate_message(message).c_str());
 }
 
 void
@@ -19,6 +19,7 @@
 
 #include <filesystem>
 #include <string>
+#include <string_view>
 
 #include <cpl_msg.h>
 
@@ -130,7 +131,7 @@ class Msg
    *
    * See the description of the function @c error().
    */
-  static void debug(const std::string& component, const std::string& message);
+  static void debug(std::string_view component, std::string_view message);
 
   /**
    * @brief
@@ -149,8 +150,12 @@ class Msg
    * are not required. If @em component is a @c NULL pointer, it would
    * be set to the string "<empty field>". If @em format is a @c NULL
    * pointer, the message "<empty message>" would be printed.
+   *
+   * Only the first CPL_MAX_MSG_LENGTH - 1 bytes of @em component and
+   * @em message are passed on to CPL, as any longer text would be cut
+   * from the output anyway.
    */
-  static void error(const std::string& component, const std::string& message);
+  static void error(std::string_view component, std::string_view message);
 
   /**
    * @brief
@@ -163,7 +168,7 @@ class Msg
    *
    * See the description of the function @c cpl_msg_error().
    */
-  static void info(const std::string& component, const std::string& message);
+  static void info(std::string_view component, std::string_view message);
 
   /**
    * @brief
@@ -176,7 +181,7 @@ class Msg
    *
    * See the description of the function @c cpl_msg_error().
    */
-  static void warning(const std::string& component, const std::string& message);
+  static void warning(std::string_view component, std::string_view message);
 
   /**
    * @brief
@@ -16,6 +16,7 @@
 
 #include "cplcore/polynomial.hpp"
 
+#include <cstddef>
 #include <cstdio>
 #include <cstring>
 #include <limits>
@@ -122,6 +123,32 @@ Polynomial::set_coeff(const std::vector<size>& pows, double value)
                            value);
 }
 
+void
+Polynomial::set_coeffs(const std::vector<size>& pows,
+                       const std::vector<double>& values)
+{
+  const size dim = get_dimension();
+  if (pows.size() != values.size() * dim) {
+    std::ostringstream ss;
+    ss << "set_coeffs takes " << dim << " powers (dimensionality) per ";
+    ss << "coefficient, but was received " << pows.size();
+    ss << " powers for " << values.size() << " coefficients";
+    throw cpl::core::IllegalInputError(PYCPL_ERROR_LOCATION, ss.str());
+  }
+  // Check all powers first, so that no coefficient is set if one of them is
+  // invalid
+  for (size power : pows) {
+    if (power < 0) {
+      throw cpl::core::IllegalInputError(PYCPL_ERROR_LOCATION,
+                                         "set_coeffs takes non-negative powers");
+    }
+  }
+  for (std::size_t i = 0; i < values.size(); ++i) {
+    Error::throw_errors_with(cpl_polynomial_set_coeff, m_interface,
+                             &pows[i * dim], values[i]);
+  }
+}
+
 int
 Polynomial::compare(const Polynomial& other, double tol) const
 {
@@ -287,6 +287,23 @@ class Polynomial
    */
   void set_coeff(const std::vector<size>& pows, double value);
 
+  /**
+   * @brief Set several coefficients of the polynomial
+   * @param pows The non-negative powers of the variables of all coefficients,
+   *             one group of dimension powers per coefficient
+   * @param values The coefficients
+   *
+   * The coefficients are set in the given order, as if set_coeff() was
+   * called for each of them, so the size of pows must be the size of values
+   * times the polynomial dimension. All powers are checked before the first
+   * coefficient is set.
+   *
+   * @throws IllegalInputError if the size of pows does not match, or if pows
+   * contains negative values
+   */
+  void set_coeffs(const std::vector<size>& pows,
+                  const std::vector<double>& values);
+
   /**
    * @brief Compare the coefficients of two polynomials
    * @param other The 2nd polynomial
@@ -21,6 +21,7 @@
 #include <filesystem>
 #include <memory>
 #include <optional>
+#include <sstream>
 #include <string>
 #include <utility>
 #include <vector>
@@ -28,6 +29,7 @@
 #include <pybind11/numpy.h>
 #include <pybind11/stl.h>
 
+#include "cplcore/error.hpp"
 #include "cplcore/polynomial.hpp"
 #include "cplcore/vector_bindings.hpp"
 #include "dump_handler.hpp"
@@ -273,6 +275,69 @@ bind_polynomial(py::module& cplcore)
         -----
         For an N-dimensional polynomial the complexity is O(N)
         )pydoc")
+      .def(
+          "set_coeffs",
+          [](cpl::core::Polynomial& self, py::object pows_like,
+             py::array_t<double, py::array::c_style | py::array::forcecast>
+                 values) -> void {
+            py::array pows_array = py::array::ensure(pows_like);
+            if (!pows_array) {
+              throw cpl::core::IllegalInputError(
+                  PYCPL_ERROR_LOCATION, "pows must be an array of integers");
+            }
+            // Without coefficients there is nothing to set
+            if (pows_array.size() == 0 && values.size() == 0) {
+              return;
+            }
+            // Only integer powers are converted, casting floating point
+            // powers would silently truncate them
+            const char kind = pows_array.dtype().kind();
+            if (kind != 'i' && kind != 'u') {
+              throw cpl::core::IllegalInputError(
+                  PYCPL_ERROR_LOCATION, "pows must be an array of integers");
+            }
+            auto pows =
+                py::array_t<size, py::array::c_style | py::array::forcecast>(
+                    pows_array);
+            if (pows.ndim() != 2 || values.ndim() != 1 ||
+                pows.shape(0) != values.shape(0) ||
+                pows.shape(1) != self.get_dimension()) {
+              std::ostringstream ss;
+              ss << "set_coeffs takes an array of powers of shape (n, ";
+              ss << self.get_dimension() << ") and an array of n values";
+              throw cpl::core::IllegalInputError(PYCPL_ERROR_LOCATION,
+                                                 ss.str());
+            }
+            self.set_coeffs(
+                std::vector<size>(pows.data(), pows.data() + pows.size()),
+                std::vector<double>(values.data(),
+                                    values.data() + values.size()));
+          },
+          py::arg("pows"), py::arg("values"), R"pydoc(
+        Set several coefficients of the polynomial with a single call
+
+        The coefficients are set in the given order, with the same effect as
+        calling `set_coeff` for each pair of powers and value, but without
+        the overhead of a Python call per coefficient.
+
+        Parameters
+        ----------
+        pows : array-like of ints
+            The non-negative powers of the variables, with shape (n, dimension):
+            one row of powers per coefficient
+        values : array-like of floats
+            The n coefficients
+
+        Raises
+        ------
+        cpl.core.IllegalInputError
+            if pows is not an integer array, if the shapes of pows and values do
+            not match, or if pows contains negative values
+
+        See Also
+        --------
+        cpl.core.Polynomial.set_coeff : Set a coefficient of the polynomial.
+        )pydoc")
       // FIXME: Using a parameter sections for the following overloadend
       // functions causes Sphinx to issue a critical warning regarding an
       // unexpected section title. As a consequence manual formatting is used
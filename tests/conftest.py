@@ -28,7 +28,12 @@ from random import randint
 import sys
 
 from astropy.io import fits
-from numpy import random as np_random, repeat as np_repeat
+from numpy import (
+    array as np_array,
+    double as np_double,
+    random as np_random,
+    repeat as np_repeat,
+)
 from pytest import fixture
 import pytest
 
@@ -149,8 +154,9 @@ def make_mock_fits(request, tmp_path_factory):
 
         filename = random_filename(tmp_path_factory)
 
-        # New file created
-        hdu_list.writeto(filename)
+        # New file created. The HDUs are built by the tests themselves, so
+        # skip astropy's verification pass over every header card.
+        hdu_list.writeto(filename, output_verify="ignore")
         created_files.append(filename)
 
         return filename
@@ -165,6 +171,36 @@ def make_mock_fits(request, tmp_path_factory):
             pass
 
 
+@fixture(scope="module")
+def mock_image_list_fits(request, make_mock_image, make_mock_fits):
+    """
+    Return a (filename, data) tuple for a FITS file holding a cube of 3 mock images
+
+    The pixel type of the mock images is taken from indirect parametrization,
+    defaulting to double. The file is written once per module and pixel type,
+    so that the ImageList load tests can share it instead of each writing
+    their own copy. Pass scope="module" to the parametrize marker so that
+    pytest groups the tests by pixel type.
+
+    Example::
+
+        @pytest.mark.parametrize(
+            "mock_image_list_fits", [np.intc, np.double], indirect=True, scope="module"
+        )
+        def test_foo(mock_image_list_fits):
+            filename, data = mock_image_list_fits
+            imlist = cpl.core.ImageList.load(filename)
+                ...
+
+    """
+    pixel_type = getattr(request, "param", np_double)
+    data = np_array(
+        [make_mock_image(dtype=pixel_type, width=256, height=512) for _ in range(3)]
+    )
+    filename = make_mock_fits(fits.HDUList([fits.PrimaryHDU(data)]))
+    return filename, data
+
+
 @fixture(scope="session")
 def make_mock_sof(request, tmp_path_factory):
     """
@@ -79,6 +79,24 @@ class TestImage:
         assert img[2][0] == 4
         assert img[2][1] == -99
 
+    @pytest.mark.parametrize(
+        "cpl_typeid, pixel_type",
+        [
+            (cplcore.Type.INT, np.intc),
+            (cplcore.Type.FLOAT, np.single),
+            (cplcore.Type.DOUBLE, np.double),
+        ],
+    )
+    def test_constructor_from_ndarray_layout(self, cpl_typeid, pixel_type):
+        arr = np.arange(24, dtype=pixel_type).reshape(4, 6)
+        # C contiguous arrays are copied as a whole, any other layout is
+        # converted element by element
+        for data in (arr, arr[1:3], arr[:, ::2], arr.T, np.asfortranarray(arr)):
+            img = cplcore.Image(data)
+            assert img.type == cpl_typeid
+            assert img.shape == data.shape
+            np.testing.assert_array_equal(np.asarray(img), data)
+
     @pytest.mark.parametrize(
         "cpl_typeid, pixel_type",
         [
@@ -381,6 +399,33 @@ class TestImage:
         img.accept(0, 0)
         assert img[0][0] == 5
 
+    def test_reject_pixels(self):
+        img = cplcore.Image.zeros(3, 2, cplcore.Type.DOUBLE)
+        img.reject_pixels(np.array([[0, 0], [1, 2], [0, 1]]))
+        assert np.array_equal(img.bpm, [[True, True, False], [False, False, True]])
+        # Any integer type and plain lists are accepted
+        img = cplcore.Image.zeros(3, 2, cplcore.Type.DOUBLE)
+        img.reject_pixels(np.array([[1, 0]], dtype=np.uint8))
+        img.reject_pixels([[0, 2]])
+        assert np.array_equal(img.bpm, [[False, False, True], [True, False, False]])
+        # Nothing to reject
+        img.reject_pixels([])
+        img.reject_pixels(np.empty((0, 2), dtype=int))
+        assert np.array_equal(img.bpm, [[False, False, True], [True, False, False]])
+
+    def test_reject_pixels_invalid(self):
+        img = cplcore.Image.zeros(3, 2, cplcore.Type.DOUBLE)
+        with pytest.raises(cplcore.IllegalInputError):
+            img.reject_pixels(np.array([0, 0, 1]))
+        with pytest.raises(cplcore.IllegalInputError):
+            # Floating point positions are not truncated to pixel indices
+            img.reject_pixels(np.array([[0.5, 1.9]]))
+        assert not img.is_rejected(0, 1)
+        with pytest.raises(cplcore.AccessOutOfRangeError):
+            img.reject_pixels(np.array([[0, 0], [2, 0]]))
+        # No pixel is rejected if one of the positions is invalid
+        assert not img.is_rejected(0, 0)
+
     @pytest.fixture(scope="function")
     def pathological_image(self, request):
         img = cplcore.Image(
@@ -2004,6 +2049,12 @@ class TestImage:
         assert not im.equals(im2)
         assert im != im2
 
+    def test_equals_same_image(self):
+        im = cplcore.Image([[2.0, math.nan], [52.0, 25.0]])
+        assert im.equals(im)
+        assert im == im
+        assert im == im.duplicate()
+
     def test_equals_complex(self):
         im = cplcore.Image(
             [[5 + 6j, -3 - 6j, 0], [99 + 94j, -559 + 1j, -50 + 4j]],
@@ -2259,6 +2310,21 @@ class TestImage:
                         np.max(small_image["img"].extract(small_window["window"]))
                     )
 
+    def test_minmax(self, small_image, small_window):
+        with small_window["expectation"]:
+            with small_image["expectation"]:
+                if small_window["window"] is None:
+                    expected = np.asarray(small_image["img"])
+                    minmax = small_image["img"].get_minmax()
+                else:
+                    expected = np.asarray(
+                        small_image["img"].extract(small_window["window"])
+                    )
+                    minmax = small_image["img"].get_minmax(
+                        window=small_window["window"]
+                    )
+                assert minmax == pytest.approx((np.min(expected), np.max(expected)))
+
     def test_mean(self, small_image, small_window):
         with small_window["expectation"]:
             with small_image["expectation"]:
@@ -2557,6 +2623,26 @@ class TestImage:
         img = cplcore.Image([[1, 2, 3], [4, 5, 6]], dtype=pycpl_type)
         assert np.sum(img) == pytest.approx(21)
 
+    @pytest.mark.parametrize(
+        "pycpl_type,np_type",
+        [
+            (cplcore.Type.INT, np.intc),
+            (cplcore.Type.FLOAT, np.single),
+            (cplcore.Type.DOUBLE, np.double),
+        ],
+        ids=("int", "float", "double"),
+    )
+    def test_asarray_no_copy(self, pycpl_type, np_type):
+        # np.asarray goes through the buffer protocol and wraps the CPL pixel
+        # buffer directly, as_array() returns an independent copy
+        img = cplcore.Image([[1, 2, 3], [4, 5, 6]], dtype=pycpl_type)
+        view = np.asarray(img)
+        assert view.dtype == np_type
+        assert np.shares_memory(view, np.asarray(img))
+        view[1][2] = 42
+        assert img[1][2] == 42
+        assert not np.shares_memory(img.as_array(), view)
+
     @pytest.mark.parametrize(
         "pycpl_type,np_type",
         [
@@ -14,14 +14,79 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import os
+import itertools
+from math import isclose
 
 import pytest
 import numpy as np
-import subprocess
+from astropy.io import fits
 
 from cpl import core as cplcore
 
+DBL_EPSILON = np.finfo(np.float64).eps
+FLT_EPSILON = np.finfo(np.float32).eps
+
+# Expected output of repr() and dump() for the ImageList built from the
+# 1x3 images [[2, 3, 4]], [[1, 2, 3]] and [[5, 6, 7]]
+IMAGELIST_REPR = """Imagelist with 3 image(s)
+Image nb 0 of 3 in imagelist
+Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
+Image nb 1 of 3 in imagelist
+Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
+Image nb 2 of 3 in imagelist
+Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
+"""
+
+IMAGELIST_DUMP = """Image nb 0 of 3 in imagelist
+#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
+	X	Y	value
+	1	1	2
+	2	1	3
+	3	1	4
+Image nb 1 of 3 in imagelist
+#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
+	X	Y	value
+	1	1	1
+	2	1	2
+	3	1	3
+Image nb 2 of 3 in imagelist
+#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
+	X	Y	value
+	1	1	5
+	2	1	6
+	3	1	7
+"""  # noqa
+
+
+# numpy pixel types of the noise images
+NOISE_DTYPES = {
+    cplcore.Type.INT: np.intc,
+    cplcore.Type.FLOAT: np.single,
+    cplcore.Type.DOUBLE: np.double,
+}
+
+
+@pytest.fixture(
+    scope="class",
+    params=list(itertools.product(NOISE_DTYPES, [3, 5, 8])),
+    ids=lambda param: f"{param[0].name}-{param[1]}",
+)
+def noise_image_list(request):
+    # The image list is only read by the tests using it, so it is shared
+    # by all tests of a class with the same pixel type and size. The noise
+    # is drawn from a generator seeded with the parameters, so that every
+    # pytest-xdist worker builds the same images.
+    pixel_type, size = request.param
+    rng = np.random.default_rng([int(pixel_type), size])
+    return cplcore.ImageList(
+        [
+            cplcore.Image(
+                rng.uniform(-100, 200, (10, 10)).astype(NOISE_DTYPES[pixel_type])
+            )
+            for i in range(size)
+        ]
+    )
+
 
 class TestImageList:
     def test_constructor(self):
@@ -44,15 +109,7 @@ class TestImageList:
         img2 = cplcore.Image([[2, 3, 4]])
         img3 = cplcore.Image([[5, 6, 7]])
         imlist = cplcore.ImageList([img2, img1, img3])
-        outp = """Imagelist with 3 image(s)
-Image nb 0 of 3 in imagelist
-Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
-Image nb 1 of 3 in imagelist
-Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
-Image nb 2 of 3 in imagelist
-Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
-"""
-        assert repr(imlist) == outp
+        assert repr(imlist) == IMAGELIST_REPR
 
     def test_dump_bad_window(self):
         img1 = cplcore.Image([[1, 2, 3, 5, 4]])
@@ -70,136 +127,58 @@ Image with 3 X 1 pixel(s) of type 'int' and 0 bad pixel(s)
         img2 = cplcore.Image([[2, 3, 4]])
         img3 = cplcore.Image([[5, 6, 7]])
         imlist = cplcore.ImageList([img2, img1, img3])
-        outp = """Image nb 0 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	2
-	2	1	3
-	3	1	4
-Image nb 1 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	1
-	2	1	2
-	3	1	3
-Image nb 2 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	5
-	2	1	6
-	3	1	7
-"""  # noqa
-        assert str(imlist) == outp
+        assert str(imlist) == IMAGELIST_DUMP
         assert isinstance(imlist.dump(show=False), str)
         # test some special cases
-        assert imlist.dump(window=None, show=False) == outp
-        assert imlist.dump(window=(0, 0, 0, 0), show=False) == outp
-
-    def test_dump_stdout(self):
-        # for some reason we can't capture stdout using capsys
-        # a cheeky workaround using subprocess does the trick
-        cmd = "from cpl import core as cplcore; "
-        cmd += "img1 = cplcore.Image([[1, 2, 3]]);"
-        cmd += "img2 = cplcore.Image([[2, 3, 4]]);"
-        cmd += "img3 = cplcore.Image([[5, 6, 7]]);"
-        cmd += "imglist = cplcore.ImageList([img2, img1, img3]);"
-        cmd += "imglist.dump()"
-        response = subprocess.run(["python", "-c", cmd], stdout=subprocess.PIPE)
-        outp = str(response.stdout, "utf-8")
-        expect = """Image nb 0 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	2
-	2	1	3
-	3	1	4
-Image nb 1 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	1
-	2	1	2
-	3	1	3
-Image nb 2 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	5
-	2	1	6
-	3	1	7
-"""  # noqa
-        assert outp == expect
+        assert imlist.dump(window=None, show=False) == IMAGELIST_DUMP
+        assert imlist.dump(window=(0, 0, 0, 0), show=False) == IMAGELIST_DUMP
+
+    def test_dump_stdout(self, capfd):
+        # CPL writes to the C level stdout, which capsys can't see, so capture
+        # file descriptor 1 instead
+        img1 = cplcore.Image([[1, 2, 3]])
+        img2 = cplcore.Image([[2, 3, 4]])
+        img3 = cplcore.Image([[5, 6, 7]])
+        imglist = cplcore.ImageList([img2, img1, img3])
+        imglist.dump()
+        outp = capfd.readouterr().out
+        assert outp == IMAGELIST_DUMP
 
     def test_dump_file(self, tmp_path):
         img1 = cplcore.Image([[1, 2, 3]])
         img2 = cplcore.Image([[2, 3, 4]])
         img3 = cplcore.Image([[5, 6, 7]])
         imlist = cplcore.ImageList([img2, img1, img3])
-        outp = """Image nb 0 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	2
-	2	1	3
-	3	1	4
-Image nb 1 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	1
-	2	1	2
-	3	1	3
-Image nb 2 of 3 in imagelist
-#----- image: 1 <= x <= 3, 1 <= y <= 1 -----
-	X	Y	value
-	1	1	5
-	2	1	6
-	3	1	7
-"""  # noqa
         d = tmp_path / "sub"
         d.mkdir()
         p = d / "cpl_imagelist_dump.txt"
         filename = tmp_path.joinpath(p)
         imlist.dump(filename=str(filename))
-        contents = ""
-        with open(str(filename), "r") as f:
-            for line in f.readlines():
-                contents += line
-        assert contents == outp
+        contents = filename.read_text()
+        assert contents == IMAGELIST_DUMP
 
     def test_constructor_3darray(self):
         imlist = cplcore.ImageList([[[5, 6, 7]], [[2, 3, 4]], [[1, 2, 3]]])
         assert len(imlist) == 3
-        assert imlist[0][0][0] == 5
-        assert imlist[0][0][1] == 6
-        assert imlist[0][0][2] == 7
-        assert imlist[1][0][0] == 2
-        assert imlist[1][0][1] == 3
-        assert imlist[1][0][2] == 4
-        assert imlist[2][0][0] == 1
-        assert imlist[2][0][1] == 2
-        assert imlist[2][0][2] == 3
+        np.testing.assert_array_equal(
+            imlist.as_array(), [[[5, 6, 7]], [[2, 3, 4]], [[1, 2, 3]]]
+        )
 
     def test_constructor_iterator(self):
         imlist = cplcore.ImageList(cplcore.Image([[i, i + 1]]) for i in range(3))
 
         assert len(imlist) == 3
-        for i in range(3):
-            assert imlist[i][0][0] == i
-            assert imlist[i][0][1] == i + 1
+        np.testing.assert_array_equal(
+            imlist.as_array(), [[[i, i + 1]] for i in range(3)]
+        )
 
     def test_constructor_numpy(self):
-        import numpy as np
-
         arr1 = np.array([[5, 6, 7]])
         arr2 = np.array([[2, 3, 4]])
         arr3 = np.array([[1, 2, 3]])
         imlist = cplcore.ImageList([arr1, arr2, arr3])
         assert len(imlist) == 3
-        assert imlist[0][0][0] == 5
-        assert imlist[0][0][1] == 6
-        assert imlist[0][0][2] == 7
-        assert imlist[1][0][0] == 2
-        assert imlist[1][0][1] == 3
-        assert imlist[1][0][2] == 4
-        assert imlist[2][0][0] == 1
-        assert imlist[2][0][1] == 2
-        assert imlist[2][0][2] == 3
+        np.testing.assert_array_equal(imlist.as_array(), [arr1, arr2, arr3])
 
     @pytest.mark.parametrize(
         "cpl_typeid, pixel_type",
@@ -207,237 +186,137 @@ Image nb 2 of 3 in imagelist
             (cplcore.Type.INT, np.intc),
             (cplcore.Type.FLOAT, np.single),
             (cplcore.Type.DOUBLE, np.double),
+            (cplcore.Type.FLOAT_COMPLEX, np.csingle),
+            (cplcore.Type.DOUBLE_COMPLEX, np.cdouble),
         ],
+        ids=("int", "float", "double", "complex-float", "complex-double"),
     )
-    def test_constructor_load_native(
-        self, make_mock_image, make_mock_fits, cpl_typeid, pixel_type
-    ):
-        from astropy.io import fits
-        import numpy as np
-
-        mock_image1 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image2 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image3 = make_mock_image(dtype=pixel_type, width=256, height=512)
-
-        mock_image_list = np.array([mock_image1, mock_image2, mock_image3])
-
-        # Write the image list to a FITS file
-        my_fits_filename = make_mock_fits(
-            fits.HDUList([fits.PrimaryHDU(mock_image_list)])
+    def test_as_array(self, cpl_typeid, pixel_type):
+        arr = np.array(
+            [[[1, 2, 3], [4, 5, 6]], [[7, 8, 9], [10, 11, 12]]], dtype=pixel_type
+        )
+        imlist = cplcore.ImageList(
+            [
+                cplcore.Image([[1, 2, 3], [4, 5, 6]], dtype=cpl_typeid),
+                cplcore.Image([[7, 8, 9], [10, 11, 12]], dtype=cpl_typeid),
+            ]
         )
+        np.testing.assert_array_equal(imlist.as_array(), arr)
+        assert imlist.as_array().dtype == arr.dtype
+        np.testing.assert_array_equal(np.asarray(imlist), arr)
+        # as_array returns a copy
+        copy = imlist.as_array()
+        copy[0][0][0] = 42
+        assert imlist[0][0][0] == 1
+        wider = np.result_type(arr.dtype, np.double)
+        converted = np.asarray(imlist, dtype=wider)
+        assert converted.dtype == wider
+        np.testing.assert_array_equal(converted, arr)
+
+    def test_as_array_empty(self):
+        assert cplcore.ImageList().as_array().shape == (0,)
+
+    @pytest.mark.parametrize(
+        "cpl_typeid, mock_image_list_fits",
+        [
+            (cplcore.Type.INT, np.intc),
+            (cplcore.Type.FLOAT, np.single),
+            (cplcore.Type.DOUBLE, np.double),
+        ],
+        indirect=["mock_image_list_fits"],
+        scope="module",
+    )
+    def test_constructor_load_native(self, mock_image_list_fits, cpl_typeid):
+        my_fits_filename, mock_image_list = mock_image_list_fits
 
         new_image_list = cplcore.ImageList.load(
             my_fits_filename, dtype=cplcore.Type.UNSPECIFIED
         )
 
         assert len(new_image_list) == mock_image_list.shape[0]
-        assert new_image_list[0].shape == mock_image1.shape
-        assert new_image_list[1].shape == mock_image2.shape
-        assert new_image_list[2].shape == mock_image3.shape
-        assert new_image_list[0].type == cpl_typeid
-        assert new_image_list[1].type == cpl_typeid
-        assert new_image_list[2].type == cpl_typeid
-
-        # Just check some random indicies
-        # Checking the whole image list takes too long
-        assert new_image_list[0][0][0] == mock_image_list[0][0][0]
-        assert new_image_list[1][61][126] == mock_image_list[1][61][126]
-        assert new_image_list[0][172][91] == mock_image_list[0][172][91]
-        assert new_image_list[1][482][146] == mock_image_list[1][482][146]
-        assert new_image_list[0][49][211] == mock_image_list[0][49][211]
-        assert new_image_list[2][46][142] == mock_image_list[2][46][142]
-        assert new_image_list[2][44][41] == mock_image_list[2][44][41]
-        assert new_image_list[0][393][186] == mock_image_list[0][393][186]
-        assert new_image_list[1][184][235] == mock_image_list[1][184][235]
-        assert new_image_list[0][466][40] == mock_image_list[0][466][40]
-        assert new_image_list[2][130][93] == mock_image_list[2][130][93]
-        assert new_image_list[0][511][255] == mock_image_list[0][511][255]
-
-    @pytest.mark.parametrize("pixel_type", [np.intc, np.single, np.double])
-    def test_constructor_load_default(
-        self, make_mock_image, make_mock_fits, pixel_type
-    ):
-        from astropy.io import fits
-        import numpy as np
-
-        mock_image1 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image2 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image3 = make_mock_image(dtype=pixel_type, width=256, height=512)
-
-        mock_image_list = np.array([mock_image1, mock_image2, mock_image3])
+        for new_image in new_image_list:
+            assert new_image.shape == mock_image_list.shape[1:]
+            assert new_image.type == cpl_typeid
 
-        # Write the image list to a FITS file
-        my_fits_filename = make_mock_fits(
-            fits.HDUList([fits.PrimaryHDU(mock_image_list)])
-        )
+        assert np.array_equal(np.asarray(new_image_list), mock_image_list)
+
+    @pytest.mark.parametrize(
+        "mock_image_list_fits",
+        [np.intc, np.single, np.double],
+        indirect=True,
+        scope="module",
+    )
+    def test_constructor_load_default(self, mock_image_list_fits):
+        my_fits_filename, mock_image_list = mock_image_list_fits
 
         new_image_list = cplcore.ImageList.load(my_fits_filename)
 
         assert len(new_image_list) == mock_image_list.shape[0]
-        assert new_image_list[0].shape == mock_image1.shape
-        assert new_image_list[1].shape == mock_image2.shape
-        assert new_image_list[2].shape == mock_image3.shape
-        assert new_image_list[0].type == cplcore.Type.DOUBLE
-        assert new_image_list[1].type == cplcore.Type.DOUBLE
-        assert new_image_list[2].type == cplcore.Type.DOUBLE
+        for new_image in new_image_list:
+            assert new_image.shape == mock_image_list.shape[1:]
+            assert new_image.type == cplcore.Type.DOUBLE
 
-        # Just check some random indicies
-        # Checking the whole image list takes too long
-        assert new_image_list[0][0][0] == mock_image_list[0][0][0]
-        assert new_image_list[1][61][126] == mock_image_list[1][61][126]
-        assert new_image_list[0][172][91] == mock_image_list[0][172][91]
-        assert new_image_list[1][482][146] == mock_image_list[1][482][146]
-        assert new_image_list[0][49][211] == mock_image_list[0][49][211]
-        assert new_image_list[2][46][142] == mock_image_list[2][46][142]
-        assert new_image_list[2][44][41] == mock_image_list[2][44][41]
-        assert new_image_list[0][393][186] == mock_image_list[0][393][186]
-        assert new_image_list[1][184][235] == mock_image_list[1][184][235]
-        assert new_image_list[0][466][40] == mock_image_list[0][466][40]
-        assert new_image_list[2][130][93] == mock_image_list[2][130][93]
-        assert new_image_list[0][511][255] == mock_image_list[0][511][255]
+        assert np.array_equal(np.asarray(new_image_list), mock_image_list)
 
     @pytest.mark.parametrize(
-        "cpl_typeid, pixel_type",
+        "cpl_typeid, mock_image_list_fits",
         [
             (cplcore.Type.INT, np.intc),
             (cplcore.Type.FLOAT, np.single),
             (cplcore.Type.DOUBLE, np.double),
         ],
+        indirect=["mock_image_list_fits"],
+        scope="module",
     )
-    def test_constructor_load_type(
-        self, make_mock_image, make_mock_fits, cpl_typeid, pixel_type
-    ):
-        from astropy.io import fits
-        import numpy as np
-
-        mock_image1 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image2 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image3 = make_mock_image(dtype=pixel_type, width=256, height=512)
-
-        mock_image_list = np.array([mock_image1, mock_image2, mock_image3])
-
-        # Write the image list to a FITS file
-        my_fits_filename = make_mock_fits(
-            fits.HDUList([fits.PrimaryHDU(mock_image_list)])
-        )
+    def test_constructor_load_type(self, mock_image_list_fits, cpl_typeid):
+        my_fits_filename, mock_image_list = mock_image_list_fits
 
         new_image_list = cplcore.ImageList.load(my_fits_filename, dtype=cpl_typeid)
 
         assert len(new_image_list) == mock_image_list.shape[0]
-        assert new_image_list[0].shape == mock_image1.shape
-        assert new_image_list[1].shape == mock_image2.shape
-        assert new_image_list[2].shape == mock_image3.shape
-        assert new_image_list[0].type == cpl_typeid
-        assert new_image_list[1].type == cpl_typeid
-        assert new_image_list[2].type == cpl_typeid
-
-        # Just check some random indicies
-        # Checking the whole image list takes too long
-        assert new_image_list[0][0][0] == mock_image_list[0][0][0]
-        assert new_image_list[1][61][126] == mock_image_list[1][61][126]
-        assert new_image_list[0][172][91] == mock_image_list[0][172][91]
-        assert new_image_list[1][482][146] == mock_image_list[1][482][146]
-        assert new_image_list[0][49][211] == mock_image_list[0][49][211]
-        assert new_image_list[2][46][142] == mock_image_list[2][46][142]
-        assert new_image_list[2][44][41] == mock_image_list[2][44][41]
-        assert new_image_list[0][393][186] == mock_image_list[0][393][186]
-        assert new_image_list[1][184][235] == mock_image_list[1][184][235]
-        assert new_image_list[0][466][40] == mock_image_list[0][466][40]
-        assert new_image_list[2][130][93] == mock_image_list[2][130][93]
-        assert new_image_list[0][511][255] == mock_image_list[0][511][255]
+        for new_image in new_image_list:
+            assert new_image.shape == mock_image_list.shape[1:]
+            assert new_image.type == cpl_typeid
+
+        assert np.array_equal(np.asarray(new_image_list), mock_image_list)
 
     @pytest.mark.parametrize(
-        "cpl_typeid, pixel_type, tiny",
+        "cpl_typeid, mock_image_list_fits, tiny",
         [
             (cplcore.Type.DOUBLE, np.intc, np.finfo(np.double).eps),
             (cplcore.Type.INT, np.single, 1),
             (cplcore.Type.INT, np.double, 1),
         ],
+        indirect=["mock_image_list_fits"],
+        scope="module",
     )
-    def test_constructor_load_cast(
-        self, make_mock_image, make_mock_fits, cpl_typeid, pixel_type, tiny
-    ):
-        from astropy.io import fits
-        import numpy as np
-
-        mock_image1 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image2 = make_mock_image(dtype=pixel_type, width=256, height=512)
-        mock_image3 = make_mock_image(dtype=pixel_type, width=256, height=512)
-
-        mock_image_list = np.array([mock_image1, mock_image2, mock_image3])
-
-        # Write the image list to a FITS file
-        my_fits_filename = make_mock_fits(
-            fits.HDUList([fits.PrimaryHDU(mock_image_list)])
-        )
+    def test_constructor_load_cast(self, mock_image_list_fits, cpl_typeid, tiny):
+        my_fits_filename, mock_image_list = mock_image_list_fits
 
         new_image_list = cplcore.ImageList.load(my_fits_filename, dtype=cpl_typeid)
 
         assert len(new_image_list) == mock_image_list.shape[0]
-        assert new_image_list[0].shape == mock_image1.shape
-        assert new_image_list[1].shape == mock_image2.shape
-        assert new_image_list[2].shape == mock_image3.shape
-        assert new_image_list[0].type == cpl_typeid
-        assert new_image_list[1].type == cpl_typeid
-        assert new_image_list[2].type == cpl_typeid
-
-        # Just check some random indicies
-        # Checking the whole image list takes too long
-        assert np.abs(new_image_list[0][0][0] - mock_image_list[0][0][0]) < tiny
-        assert np.abs(new_image_list[1][61][126] - mock_image_list[1][61][126]) < tiny
-        assert np.abs(new_image_list[0][172][91] - mock_image_list[0][172][91]) < tiny
-        assert np.abs(new_image_list[1][482][146] - mock_image_list[1][482][146]) < tiny
-        assert np.abs(new_image_list[0][49][211] - mock_image_list[0][49][211]) < tiny
-        assert np.abs(new_image_list[2][46][142] - mock_image_list[2][46][142]) < tiny
-        assert np.abs(new_image_list[2][44][41] - mock_image_list[2][44][41]) < tiny
-        assert np.abs(new_image_list[0][393][186] - mock_image_list[0][393][186]) < tiny
-        assert np.abs(new_image_list[1][184][235] - mock_image_list[1][184][235]) < tiny
-        assert np.abs(new_image_list[0][466][40] - mock_image_list[0][466][40]) < tiny
-        assert np.abs(new_image_list[2][130][93] - mock_image_list[2][130][93]) < tiny
-        assert np.abs(new_image_list[0][511][255] - mock_image_list[0][511][255]) < tiny
+        for new_image in new_image_list:
+            assert new_image.shape == mock_image_list.shape[1:]
+            assert new_image.type == cpl_typeid
 
-    def test_constructor_load_window(self, make_mock_image, make_mock_fits):
-        from astropy.io import fits
-        import numpy as np
+        assert np.max(np.abs(new_image_list.as_array() - mock_image_list)) < tiny
 
-        mock_image1 = np.block(
-            [
-                [
-                    np.array([1] * 9, dtype=np.double).reshape(3, 3),
-                    np.array([2] * 9, dtype=np.double).reshape(3, 3),
-                ],
-                [
-                    np.array([3] * 9, dtype=np.double).reshape(3, 3),
-                    np.array([4] * 9, dtype=np.double).reshape(3, 3),
-                ],
-            ]
-        )
-        mock_image2 = np.block(
-            [
-                [
-                    np.array([1] * 9, dtype=np.double).reshape(3, 3),
-                    np.array([2] * 9, dtype=np.double).reshape(3, 3),
-                ],
-                [
-                    np.array([3] * 9, dtype=np.double).reshape(3, 3),
-                    np.array([4] * 9, dtype=np.double).reshape(3, 3),
-                ],
-            ]
-        )
-        mock_image3 = np.block(
+    def test_constructor_load_window(self, make_mock_image, make_mock_fits):
+        # All three images consist of four 3x3 blocks of constant value
+        mock_image = np.block(
             [
                 [
-                    np.array([1] * 9, dtype=np.double).reshape(3, 3),
-                    np.array([2] * 9, dtype=np.double).reshape(3, 3),
+                    np.full((3, 3), 1, dtype=np.double),
+                    np.full((3, 3), 2, dtype=np.double),
                 ],
                 [
-                    np.array([3] * 9, dtype=np.double).reshape(3, 3),
-                    np.array([4] * 9, dtype=np.double).reshape(3, 3),
+                    np.full((3, 3), 3, dtype=np.double),
+                    np.full((3, 3), 4, dtype=np.double),
                 ],
             ]
         )
-
-        mock_image_list = np.array([mock_image1, mock_image2, mock_image3])
+        mock_image_list = np.array([mock_image] * 3)
 
         # Write the image list to a FITS file
         my_fits_filename = make_mock_fits(
@@ -562,7 +441,8 @@ Image nb 2 of 3 in imagelist
         with pytest.raises(IndexError):
             del imlist[0]
 
-    def test_save(self):
+    def test_save(self, tmp_path):
+        filename = str(tmp_path / "test_image.fits")
         imlist = cplcore.ImageList()
         img1 = cplcore.Image([[1, 2, 3]])
         img2 = cplcore.Image([[2, 3, 4]])
@@ -572,10 +452,8 @@ Image nb 2 of 3 in imagelist
         plist1.append(prop1)
         imlist.append(img1)
         imlist.append(img2)
-        imlist.save(
-            "test_image.fits", plist1, cplcore.io.CREATE, dtype=cplcore.Type.INT
-        )
-        loaded = cplcore.ImageList.load("test_image.fits", cplcore.Type.INT, 0)
+        imlist.save(filename, plist1, cplcore.io.CREATE, dtype=cplcore.Type.INT)
+        loaded = cplcore.ImageList.load(filename, cplcore.Type.INT, 0)
         assert loaded[0][0][0] == 1
         assert loaded[0].shape == (1, 3)
         assert loaded[0].type == cplcore.Type.INT
@@ -585,195 +463,66 @@ Image nb 2 of 3 in imagelist
         img3 = cplcore.Image([[5.5, 6.6, 7.7], [6.7, 8.9, 9.1]])
         imlist2 = cplcore.ImageList()
         imlist2.append(img3)
-        imlist2.save(
-            "test_image.fits", plist1, cplcore.io.EXTEND, dtype=cplcore.Type.DOUBLE
-        )
-        loaded = cplcore.ImageList.load("test_image.fits", cplcore.Type.DOUBLE, 1)
+        imlist2.save(filename, plist1, cplcore.io.EXTEND, dtype=cplcore.Type.DOUBLE)
+        loaded = cplcore.ImageList.load(filename, cplcore.Type.DOUBLE, 1)
         assert loaded[0][0][0] == 5.5
         assert loaded[0][1][0] == 6.7
         assert loaded[0].shape == (2, 3)
         assert loaded[0].type == cplcore.Type.DOUBLE
-        os.remove("test_image.fits")
 
-    def test_add_scalar(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2[0][0] = -4092
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-
-        imlist.add_scalar(-1982)
-        assert imlist[0][0][0] == 8912 + -1982
-        assert imlist[1][0][0] == -4092 + -1982
-
-    def test_multiply_scalar(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2[0][0] = -4092
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.multiply_scalar(-1982)
-        assert imlist[0][0][0] == 8912 * -1982
-        assert imlist[1][0][0] == -4092 * -1982
-
-    def test_subtract_scalar(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2[0][0] = -4092
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.subtract_scalar(-1982)
-        assert imlist[0][0][0] == 8912 - -1982
-        assert imlist[1][0][0] == -4092 - -1982
+    @pytest.mark.parametrize("method", ["add", "subtract", "multiply", "divide"])
+    def test_arithmetic_scalar(self, method):
+        imlist = cplcore.ImageList(
+            [
+                cplcore.Image([[8912]], dtype=cplcore.Type.DOUBLE),
+                cplcore.Image([[-4092]], dtype=cplcore.Type.DOUBLE),
+            ]
+        )
+        getattr(imlist, method + "_scalar")(-1982)
 
-    def test_divide_scalar(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2[0][0] = -4092
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.divide_scalar(-1982)
-        assert imlist[0][0][0] == 8912 / -1982
-        assert imlist[1][0][0] == -4092 / -1982
+        np.testing.assert_array_equal(
+            imlist.as_array(), getattr(np, method)([[[8912]], [[-4092]]], -1982)
+        )
 
     def test_add_image(self):
         img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
         img1[0][0] = 8912
         img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
         img2[0][0] = -4092
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
+        imlist = cplcore.ImageList([img1, img2])
         imlist.divide_scalar(-1982)
         assert imlist[0][0][0] == 8912 / -1982
         assert imlist[1][0][0] == -4092 / -1982
 
-    def test_add(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist1 = cplcore.ImageList()
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist2 = cplcore.ImageList()
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        imlist1.append(img1)
-        imlist2.append(img2)
-        imlist1.add(imlist2)
-
-        assert imlist1[0][0][0] == 8912 + -4092
-
-    def test_subtract(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist1 = cplcore.ImageList()
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist2 = cplcore.ImageList()
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        imlist1.append(img1)
-        imlist2.append(img2)
-        imlist1.subtract(imlist2)
-
-        assert imlist1[0][0][0] == 8912 - -4092
-
-    def test_multiply(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist1 = cplcore.ImageList()
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist2 = cplcore.ImageList()
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        imlist1.append(img1)
-        imlist2.append(img2)
-        imlist1.multiply(imlist2)
-
-        assert imlist1[0][0][0] == 8912 * -4092
-
-    def test_divide(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist1 = cplcore.ImageList()
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        imlist2 = cplcore.ImageList()
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        imlist1.append(img1)
-        imlist2.append(img2)
-        imlist1.divide(imlist2)
-
-        assert imlist1[0][0][0] == 8912 / -4092
-
-    def test_add_image2(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img_add = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        img_add[0][0] = -1982
-
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.add_image(img_add)
-
-        assert imlist[0][0][0] == 8912 + -1982
-        assert imlist[1][0][0] == -4092 + -1982
-
-    def test_subtract_image(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img_sub = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        img_sub[0][0] = -1982
-
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.subtract_image(img_sub)
-
-        assert imlist[0][0][0] == 8912 - -1982
-        assert imlist[1][0][0] == -4092 - -1982
-
-    def test_multiply_image(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img_mul = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        img_mul[0][0] = -1982
-
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.multiply_image(img_mul)
-
-        assert imlist[0][0][0] == 8912 * -1982
-        assert imlist[1][0][0] == -4092 * -1982
+    @pytest.mark.parametrize("method", ["add", "subtract", "multiply", "divide"])
+    def test_arithmetic(self, method):
+        # The ImageList methods share their names with the numpy ufuncs
+        # computing the expected result
+        imlist1 = cplcore.ImageList(
+            [cplcore.Image([[8912]], dtype=cplcore.Type.DOUBLE)]
+        )
+        imlist2 = cplcore.ImageList(
+            [cplcore.Image([[-4092]], dtype=cplcore.Type.DOUBLE)]
+        )
+        getattr(imlist1, method)(imlist2)
 
-    def test_divide_image(self):
-        img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img_div = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
-        img1[0][0] = 8912
-        img2[0][0] = -4092
-        img_div[0][0] = -1982
+        assert imlist1[0][0][0] == getattr(np, method)(8912, -4092)
 
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.divide_image(img_div)
+    @pytest.mark.parametrize("method", ["add", "subtract", "multiply", "divide"])
+    def test_arithmetic_image(self, method):
+        imlist = cplcore.ImageList(
+            [
+                cplcore.Image([[8912]], dtype=cplcore.Type.DOUBLE),
+                cplcore.Image([[-4092]], dtype=cplcore.Type.DOUBLE),
+            ]
+        )
+        img = cplcore.Image([[-1982]], dtype=cplcore.Type.DOUBLE)
+        getattr(imlist, method + "_image")(img)
 
-        assert imlist[0][0][0] == 8912 / -1982
-        assert imlist[1][0][0] == -4092 / -1982
+        assert imlist[0][0][0] == getattr(np, method)(8912, -1982)
+        assert imlist[1][0][0] == getattr(np, method)(-4092, -1982)
 
     def test_exponential(self):
-        from math import isclose
 
         img1 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
         img1[0][0] = 5 / 2
@@ -781,9 +530,7 @@ Image nb 2 of 3 in imagelist
         img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
         img2[0][0] = 60 / -5
 
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
+        imlist = cplcore.ImageList([img1, img2])
 
         imlist.exponential(91)
         assert isclose(imlist[0][0][0], pow(91, 5 / 2), rel_tol=1e-5)
@@ -796,9 +543,7 @@ Image nb 2 of 3 in imagelist
         img2 = cplcore.Image.zeros(1, 1, cplcore.Type.DOUBLE)
         img2[0][0] = 60.2
 
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
+        imlist = cplcore.ImageList([img1, img2])
         castedList = imlist.astype(cplcore.Type.INT)
         assert castedList[0].type == cplcore.Type.INT
         assert castedList[0][0][0] == 5
@@ -809,10 +554,7 @@ Image nb 2 of 3 in imagelist
         img1 = cplcore.Image([[20, 40, 70]])
         img2 = cplcore.Image([[10, 50, 80]])
         img3 = cplcore.Image([[30, 60, 90]])
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.append(img3)
+        imlist = cplcore.ImageList([img1, img2, img3])
         imlist.empty()
         assert len(imlist) == 0
         with pytest.raises(IndexError):
@@ -821,38 +563,33 @@ Image nb 2 of 3 in imagelist
     def test_collapse(self):
         img1 = cplcore.Image([[50, 60, 70], [10, 20, 30]])
         img2 = cplcore.Image([[20, 30, 40], [40, 50, 60]])
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
+        imlist = cplcore.ImageList([img1, img2])
         im_res = imlist.collapse_create()
         assert im_res == cplcore.Image([[35, 45, 55], [25, 35, 45]])
 
     def test_threshold(self):
         img1 = cplcore.Image([[-3027, 50012, 32], [364, -20412, -2]])
         img2 = cplcore.Image([[20, 30, 40], [40, 50, 60]])
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
+        imlist = cplcore.ImageList([img1, img2])
         imlist.threshold(-50, 50, -1, 1)
-        assert imlist[0] == cplcore.Image([[-1, 1, 32], [1, -1, -2]])
-        assert imlist[1] == cplcore.Image([[20, 30, 40], [40, 50, 1]])
+        result = imlist.as_array()
+        assert result.dtype == np.intc
+        np.testing.assert_array_equal(
+            result, [[[-1, 1, 32], [1, -1, -2]], [[20, 30, 40], [40, 50, 1]]]
+        )
 
     def test_collapse_minmax(self):
         img1 = cplcore.Image([[20, 40, 70]])
         img2 = cplcore.Image([[10, 50, 80]])
         img3 = cplcore.Image([[30, 60, 90]])
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.append(img3)
+        imlist = cplcore.ImageList([img1, img2, img3])
         im_res = imlist.collapse_minmax_create(1, 1)
-        assert im_res == cplcore.Image([[20, 50, 80]])
+        assert im_res.type == cplcore.Type.INT
+        np.testing.assert_array_equal(np.asarray(im_res), [[20, 50, 80]])
 
     def test_swap_axis(self, cpl_image_fill_test_create):
         img1 = cpl_image_fill_test_create(10, 2 * 10)
-        imlist1 = cplcore.ImageList()
-        for i in range(30):
-            imlist1.append(img1.duplicate())
+        imlist1 = cplcore.ImageList([img1.duplicate() for i in range(30)])
 
         imlist1[0].reject(0, 0)
         imlist1[1].reject(1, 1)
@@ -868,42 +605,42 @@ Image nb 2 of 3 in imagelist
         assert imlist2[4].count_rejected() == 1
 
     def test_median(self):
-        from statistics import median
-
         img1 = cplcore.Image([[20, 40, 70]])
         img2 = cplcore.Image([[10, 50, 80]])
         img3 = cplcore.Image([[30, 60, 90]])
-        imlist = cplcore.ImageList()
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.append(img3)
+        imlist = cplcore.ImageList([img1, img2, img3])
         im_res = imlist.collapse_median_create()
-        assert im_res[0][0] == median([20, 10, 30])
-        assert im_res[0][1] == median([40, 50, 60])
-        assert im_res[0][2] == median([70, 80, 90])
+        # Pixel wise medians of the three images
+        np.testing.assert_array_equal(np.asarray(im_res), [[20, 50, 80]])
 
     def test_from_accepted(self):
-        imlist = cplcore.ImageList()
         img1 = cplcore.Image([[20, 40, 70]])
         img2 = cplcore.Image([[10, 50, 80]])
         img3 = cplcore.Image([[30, 60, 90]])
         # Set so that first col has 1 bad pixel, second has 2, third has 3
         img1.reject(0, 0)
-        img2.reject(0, 0)
-        img2.reject(0, 1)
-        img3.reject(0, 0)
-        img3.reject(0, 1)
-        img3.reject(0, 2)
+        img2.reject_pixels(np.array([[0, 0], [0, 1]]))
+        img3.reject_pixels(np.array([[0, 0], [0, 1], [0, 2]]))
 
-        imlist.append(img1)
-        imlist.append(img2)
-        imlist.append(img3)
+        imlist = cplcore.ImageList([img1, img2, img3])
+
+        res = cplcore.Image.from_accepted(imlist)
+
+        np.testing.assert_array_equal(np.asarray(res), [[0, 1, 2]])
+
+    def test_from_accepted_without_bpm(self):
+        # Images without a bad pixel map are skipped when counting, only the
+        # images with rejected pixels contribute to the reduction
+        imlist = cplcore.ImageList(
+            [cplcore.Image.zeros(3, 1, cplcore.Type.INT) for _ in range(8)]
+        )
+        imlist[2].reject(0, 1)
+        imlist[5].reject_pixels(np.array([[0, 1], [0, 2]]))
 
         res = cplcore.Image.from_accepted(imlist)
 
-        assert res[0][0] == 0
-        assert res[0][1] == 1
-        assert res[0][2] == 2
+        assert res.type == cplcore.Type.INT
+        np.testing.assert_array_equal(np.asarray(res), [[8, 6, 7]])
 
     @pytest.mark.parametrize(
         "clip_mode",
@@ -913,51 +650,46 @@ Image nb 2 of 3 in imagelist
             cplcore.ImageList.Collapse.MEDIAN_MEAN,
         ],
     )
-    @pytest.mark.parametrize(
-        "pixel_type", [cplcore.Type.INT, cplcore.Type.FLOAT, cplcore.Type.DOUBLE]
-    )
-    @pytest.mark.parametrize("size", [3, 5, 8])
-    def test_collapse_sigclip(self, clip_mode, pixel_type, size):
-        import numpy as np
-        from math import isclose
-
-        DBL_EPSILON = np.finfo(np.float64).eps
-        FLT_EPSILON = np.finfo(np.float32).eps
+    def test_collapse_sigclip(self, clip_mode, noise_image_list):
         # recreate tests up until the cpl_imagelist_collapse_sigclip_create_test_one call (and the whole function
         # itself) from l129 in cpl_imagelist_basic-test.c
-        imlist1 = cplcore.ImageList()
-        for i in range(size):
-            iimg = cplcore.Image.create_noise_uniform(10, 10, pixel_type, -100, 200)
-            imlist1.append(iimg)
+        imlist1 = noise_image_list
+        pixel_type = imlist1[0].type
         # Start of cpl_imagelist_collapse_sigclip_create_test_one
 
         nsize = len(imlist1)
         nx = imlist1[0].width
         ny = imlist1[0].height
+        # Contribution map and mask buffers reused by every pass of the loop below
         im_map = cplcore.Image.zeros(nx, ny, cplcore.Type.INT)
+        bpm = cplcore.Mask(nx, ny)
+        # The input list is not modified by the loop below, so the number of
+        # contributing pixels only needs to be computed once
+        contrib = cplcore.Image.from_accepted(imlist1)
+        minpix, maxpix = contrib.get_minmax()
+        maxbad = nsize - minpix
+        # keepfrac for each ikeep as in the CPL unit test: 1.0 (no clipping)
+        # for the full list, (ikeep + 0.5) / nsize otherwise
+        keepfracs = (np.arange(1, nsize + 1) + 0.5) / nsize
+        keepfracs[-1] = 1.0
         jkeep = nsize
-        for ikeep in reversed(range(1, nsize + 1)):
-            keepfrac = (ikeep if ikeep == nsize else ikeep + 0.5) / nsize
-            clipped, im_map = imlist1.collapse_sigclip_create(
-                0.5, 1.5, keepfrac, clip_mode
+        for ikeep, keepfrac in zip(range(nsize, 0, -1), keepfracs[::-1]):
+            clipped = imlist1.collapse_sigclip_into(
+                im_map, 0.5, 1.5, keepfrac, clip_mode
             )
             assert clipped.type == pixel_type
             assert clipped.width == nx
             assert clipped.height == ny
             # Commented out lines don't seem to have any relevance to function we're testing
-            contrib = cplcore.Image.from_accepted(imlist1)
-
-            minpix = contrib.get_min()
-            maxpix = contrib.get_max()
-            maxbad = nsize - minpix
-            bpm = cplcore.Mask(im_map, -0.5, 0.5)
-            if im_map.get_min == 0:
-                assert bpm == clipped
+            bpm.fill_from_threshold(im_map, -0.5, 0.5)
+            map_min, map_max = im_map.get_minmax()
+            if map_min == 0:
+                assert bpm == clipped.bpm
             else:
                 assert bpm.count() == 0
-                assert max(1, ikeep - maxbad) <= im_map.get_min()
-            assert im_map.get_max() <= min(jkeep, maxpix)
-            jkeep = im_map.get_max()
+                assert max(1, ikeep - maxbad) <= map_min
+            assert map_max <= min(jkeep, maxpix)
+            jkeep = map_max
             if ikeep == nsize:
                 average = imlist1.collapse_create()
 
@@ -977,21 +709,85 @@ Image nb 2 of 3 in imagelist
                 )
                 assert average.width == clipped.width
                 assert average.height == clipped.height
-                for y in range(average.height):
-                    average_row = average[y]
-                    clipped_row = clipped[y]
-                    for x in range(average.width):
-                        assert isclose(
-                            average_row[x], clipped_row[x], abs_tol=tolerance
-                        )
+                # rtol is the default relative tolerance of math.isclose
+                assert np.allclose(
+                    np.asarray(average), np.asarray(clipped), rtol=1e-9, atol=tolerance
+                )
+
+    def test_collapse_sigclip_into_matches_create(self, noise_image_list):
+        contrib = cplcore.Image.zeros(10, 10, cplcore.Type.INT)
+        clipped = noise_image_list.collapse_sigclip_into(
+            contrib, 0.5, 1.5, 0.5, cplcore.ImageList.Collapse.MEAN
+        )
+        expected, expected_contrib = noise_image_list.collapse_sigclip_create(
+            0.5, 1.5, 0.5, cplcore.ImageList.Collapse.MEAN
+        )
+        assert clipped == expected
+        assert contrib == expected_contrib
+
+    @pytest.mark.parametrize(
+        "contrib,error",
+        [
+            (cplcore.Image.zeros(10, 10, cplcore.Type.DOUBLE), cplcore.IllegalInputError),
+            (cplcore.Image.zeros(5, 10, cplcore.Type.INT), cplcore.IllegalInputError),
+            (None, TypeError),
+        ],
+        ids=["type", "size", "none"],
+    )
+    def test_collapse_sigclip_into_bad_contrib(self, contrib, error):
+        imlist = cplcore.ImageList(
+            [
+                cplcore.Image.create_noise_uniform(
+                    10, 10, cplcore.Type.DOUBLE, -100, 200
+                )
+                for _ in range(3)
+            ]
+        )
+        with pytest.raises(error):
+            imlist.collapse_sigclip_into(
+                contrib, 0.5, 1.5, 0.5, cplcore.ImageList.Collapse.MEAN
+            )
+
+    @pytest.mark.parametrize(
+        "clip_mode",
+        [
+            cplcore.ImageList.Collapse.MEAN,
+            cplcore.ImageList.Collapse.MEDIAN,
+            cplcore.ImageList.Collapse.MEDIAN_MEAN,
+        ],
+    )
+    def test_collapse_sigclip_keep_all(self, clip_mode, noise_image_list):
+        # With keepfrac == 1.0 no clipping is done, every value contributes
+        # and the result is the mean computed in double precision and cast
+        # to the pixel type. This differs from collapse_create() for integer
+        # images, which averages using integer arithmetic.
+        clipped, contrib = noise_image_list.collapse_sigclip_create(
+            0.5, 1.5, 1.0, clip_mode
+        )
+        assert clipped.type == noise_image_list[0].type
+        assert contrib.get_minmax() == (len(noise_image_list), len(noise_image_list))
+        clipped = np.asarray(clipped)
+        mean = np.mean(noise_image_list.as_array(), axis=0, dtype=np.double)
+        if clipped.dtype == np.intc:
+            assert np.allclose(clipped, mean, rtol=0, atol=1)
+        else:
+            assert np.allclose(
+                clipped, mean, rtol=np.finfo(clipped.dtype).eps, atol=1e-10
+            )
 
     def test_is_uniform(self):
         img1 = cplcore.Image([[1, 2, 3]])
         img2 = cplcore.Image([[2, 3, 4]])
         img3 = cplcore.Image([[5, 6, 7]])
         imlist = cplcore.ImageList([img2, img1, img3])
+        assert imlist.is_uniform()
 
-        imlist.is_uniform()
+        # Images of a different size or type cannot be added to the list,
+        # so it stays uniform
+        with pytest.raises(cplcore.TypeMismatchError):
+            imlist.append(cplcore.Image([[5.0, 6.0, 7.0]]))
+        with pytest.raises(cplcore.IncompatibleInputError):
+            imlist.append(cplcore.Image([[1, 2]]))
         assert imlist.is_uniform()
 
         imlist1 = cplcore.ImageList()
@@ -16,11 +16,43 @@
 
 from astropy.io import fits
 import numpy as np
+import pickle
 import pytest
-import subprocess
+from scipy import ndimage
 
 from cpl import core as cplcore
 
+# Dump of a 3x3 mask with only the pixel at (2, 2) set
+MASK_DUMP = """#----- mask: 1 <= x <= 3, 1 <= y <= 3 -----
+	X	Y	value
+	1	1	0
+	1	2	0
+	1	3	0
+	2	1	0
+	2	2	0
+	2	3	0
+	3	1	0
+	3	2	0
+	3	3	1
+"""  # noqa
+
+
+@pytest.fixture
+def mask_3x3():
+    # The mask written out in MASK_DUMP
+    mask = cplcore.Mask(3, 3)
+    mask[2][2] = True
+    return mask
+
+
+def assert_mask_equal(mask, expected):
+    np.testing.assert_array_equal(np.asarray(mask), np.asarray(expected, dtype=bool))
+
+
+def random_mask_data(shape, density=0.5, seed=0):
+    # Reproducible boolean array of the given shape, about density of it True
+    return np.random.default_rng(seed).random(shape) < density
+
 
 class TestMask:
     def test_constructor_zero_detected(self):
@@ -42,10 +74,7 @@ class TestMask:
         assert msk.width == 2
         assert msk.height == 2
         assert msk.size == 4
-        assert not msk[0][0]
-        assert msk[0][1]
-        assert msk[1][0]
-        assert not msk[1][1]
+        assert_mask_equal(msk, list_2d)
 
     def test_constructor_from_ndarray_2d(self):
         list_2d = np.array([[False, True], [True, False]])
@@ -54,10 +83,27 @@ class TestMask:
         assert msk.width == 2
         assert msk.height == 2
         assert msk.size == 4
-        assert not msk[0][0]
-        assert msk[0][1]
-        assert msk[1][0]
-        assert not msk[1][1]
+        assert_mask_equal(msk, list_2d)
+
+    @pytest.mark.parametrize("dtype", [np.ubyte, np.intc, np.double])
+    def test_constructor_from_ndarray_numeric(self, dtype):
+        values = np.array([[0, 3, 0], [1, 0, 255]], dtype=dtype)
+        msk = cplcore.Mask(values)
+        assert msk.shape == (2, 3)
+        assert_mask_equal(msk, values != 0)
+        # Nonzero values are stored as 1, like True
+        assert msk.tobytes() == bytes([0, 1, 0, 1, 0, 1])
+
+    def test_constructor_from_ndarray_not_2d(self):
+        with pytest.raises(ValueError):
+            cplcore.Mask(np.array([True, False]))
+        with pytest.raises(ValueError):
+            cplcore.Mask(np.zeros((2, 2, 2), dtype=bool))
+
+    def test_constructor_from_ndarray_not_contiguous(self):
+        values = np.array([[0, 1, 0, 0], [1, 1, 0, 1], [0, 0, 1, 1]], dtype=bool)
+        assert_mask_equal(cplcore.Mask(values.T), values.T)
+        assert_mask_equal(cplcore.Mask(values[:, ::2]), values[:, ::2])
 
     def test_load_constructor(self, make_mock_image, make_mock_fits):
         mock_image = make_mock_image(
@@ -70,9 +116,7 @@ class TestMask:
 
         assert new_mask.shape == mock_image.shape
 
-        for mrow, irow in zip(new_mask, mock_image):
-            for mcell, icell in zip(mrow, irow):
-                assert (mcell == 0) == (icell == 0)
+        assert_mask_equal(new_mask, mock_image != 0)
 
     def test_get_bytes(self, make_mock_image):
         byts = bytes.fromhex("a0398fbc032efbcd903cd9a9c94d0fa78ced8ea5") * 5
@@ -82,11 +126,49 @@ class TestMask:
         assert msk.height == 5
         assert msk.shape == (5, 20)
 
+    @pytest.mark.parametrize(
+        "buffer_type",
+        [bytearray, memoryview, lambda b: np.frombuffer(b, dtype=np.uint8)],
+        ids=["bytearray", "memoryview", "ndarray"],
+    )
+    def test_bytes_like_constructor(self, buffer_type):
+        byts = bytes([0, 1, 1, 0, 0, 1])
+        msk = cplcore.Mask(3, 2, buffer_type(byts))
+        assert msk.shape == (2, 3)
+        assert msk.tobytes() == byts
+
+    def test_bytes_like_constructor_not_contiguous(self):
+        with pytest.raises(ValueError):
+            cplcore.Mask(3, 2, np.zeros(12, dtype=np.uint8)[::2])
+        with pytest.raises(cplcore.IllegalInputError):
+            cplcore.Mask(3, 2, bytearray(5))
+
+    def test_pickle(self):
+        # Starts with a zero byte, so the data must not be treated as a C string
+        byts = bytes([0, 1, 1, 0, 0, 1])
+        msk = cplcore.Mask(3, 2, byts)
+        restored = pickle.loads(pickle.dumps(msk))
+        assert isinstance(restored, cplcore.Mask)
+        assert restored.shape == (2, 3)
+        assert restored.tobytes() == byts
+        assert restored.count() == 3
+        restored = pickle.loads(pickle.dumps(msk._mask))
+        assert restored.get_bytes(0, 6) == byts
+
     def test_get_list(self):
         list_2d = [[False, True], [True, False]]
         msk = cplcore.Mask(list_2d)
         assert msk.tolist() == list_2d
 
+    def test_ones(self):
+        mask1 = cplcore.Mask.ones(5, 3)
+        assert isinstance(mask1, cplcore.Mask)
+        assert mask1.shape == (3, 5)
+        assert mask1.count() == 15
+        assert mask1 == ~cplcore.Mask(5, 3)
+        with pytest.raises(cplcore.IllegalInputError):
+            cplcore.Mask.ones(0, 3)
+
     def test_index_out_of_bounds(self):
         new_mask = cplcore.Mask(1, 1)
 
@@ -104,34 +186,19 @@ class TestMask:
 
     def test_set(self):
         new_mask = cplcore.Mask(2, 2)
-        assert not new_mask[0][0]
-        assert not new_mask[0][1]
-        assert not new_mask[1][0]
-        assert not new_mask[1][1]
+        assert_mask_equal(new_mask, [[0, 0], [0, 0]])
 
         new_mask[0][1] = True
-        assert not new_mask[0][0]
-        assert new_mask[0][1]
-        assert not new_mask[1][0]
-        assert not new_mask[1][1]
+        assert_mask_equal(new_mask, [[0, 1], [0, 0]])
 
         new_mask[1][1] = 62.7  # Numbers also should work
-        assert not new_mask[0][0]
-        assert new_mask[0][1]
-        assert not new_mask[1][0]
-        assert new_mask[1][1]
+        assert_mask_equal(new_mask, [[0, 1], [0, 1]])
 
         new_mask[1][1] = 0  # Unset
-        assert not new_mask[0][0]
-        assert new_mask[0][1]
-        assert not new_mask[1][0]
-        assert not new_mask[1][1]
+        assert_mask_equal(new_mask, [[0, 1], [0, 0]])
 
         new_mask[0][1] = False
-        assert not new_mask[0][0]
-        assert not new_mask[0][1]
-        assert not new_mask[1][0]
-        assert not new_mask[1][1]
+        assert_mask_equal(new_mask, [[0, 0], [0, 0]])
 
     def test_unresizable(self):
         new_mask = cplcore.Mask(1, 1)
@@ -152,6 +219,27 @@ class TestMask:
         mask1[2][2] = True
         assert not mask1.is_empty()
 
+    @pytest.mark.parametrize("index", [0, 63, 64, 1000, 4095])
+    def test_not_empty_wide(self, index):
+        mask1 = cplcore.Mask(64, 64)
+        assert mask1.is_empty()
+        np.asarray(mask1).reshape(-1)[index] = True
+        assert not mask1.is_empty()
+
+    def test_equal(self):
+        data = random_mask_data((31, 77), seed=19)
+        mask1 = cplcore.Mask(data)
+        assert mask1 == mask1
+        assert mask1 == cplcore.Mask(data)
+        data[30, 76] = not data[30, 76]
+        assert not mask1 == cplcore.Mask(data)
+        assert not mask1 == "not a mask"
+
+    def test_equal_different_shape(self):
+        # Same number of pixels, but a different shape
+        assert not cplcore.Mask(4, 6) == cplcore.Mask(6, 4)
+        assert not cplcore.Mask(4, 6) == cplcore.Mask(3, 3)
+
     def test_count_empty(self):
         mask1 = cplcore.Mask(3, 3)
         assert mask1.count() == 0
@@ -200,6 +288,24 @@ class TestMask:
         #  └───┘
         assert mask1.count((1, 1, 2, 2)) == 1
 
+    @pytest.mark.parametrize(
+        "window",
+        [None, (0, 0, 99, 36), (3, 1, 90, 30), (17, 5, 17, 35), (1, 2, 70, 2)],
+        ids=["all", "unaligned", "column", "single_column", "single_row"],
+    )
+    def test_count_wide(self, window):
+        # Wide enough for CPL to count whole words in the middle of each row,
+        # with unaligned leading and trailing bytes for the windows
+        expected = random_mask_data((37, 100), density=0.3, seed=42)
+        mask1 = cplcore.Mask(expected)
+        if window is None:
+            assert mask1.count() == np.count_nonzero(expected)
+        else:
+            llx, lly, urx, ury = window
+            assert mask1.count(window) == np.count_nonzero(
+                expected[lly : ury + 1, llx : urx + 1]
+            )
+
     def test_count_oob(self):
         mask1 = cplcore.Mask(3, 3)
         # An exception should be raised when trying to extract from out of bounds window
@@ -208,7 +314,7 @@ class TestMask:
 
     def test_and(self):
         mask1 = cplcore.Mask(3, 3)
-        mask2 = ~cplcore.Mask(3, 3)
+        mask2 = cplcore.Mask.ones(3, 3)
         # Line down the center of mask1
         # ·█·
         # ·█·
@@ -229,13 +335,11 @@ class TestMask:
         # ···
         # ·█·
         mask3 = mask1 & mask2
-        assert mask3[0][1]
-        assert mask3[2][1]
-        assert mask3.count() == 2
+        assert_mask_equal(mask3, [[0, 1, 0], [0, 0, 0], [0, 1, 0]])
 
     def test_or(self):
         mask1 = cplcore.Mask(3, 3)
-        mask2 = ~cplcore.Mask(3, 3)
+        mask2 = cplcore.Mask.ones(3, 3)
         # Line down the center of mask1
         # ·█·
         # ·█·
@@ -256,13 +360,25 @@ class TestMask:
         # ·█·
         # ███
         mask3 = mask1 | mask2
-        assert not mask3[1][0]
-        assert not mask3[1][2]
-        assert mask3.count() == 7
+        assert_mask_equal(mask3, [[1, 1, 1], [0, 1, 0], [1, 1, 1]])
+
+    @pytest.mark.parametrize("op", ["__and__", "__or__", "__xor__"])
+    def test_logical_wide(self, op):
+        # Large enough for CPL to combine the masks in whole registers, plus
+        # a remainder that is combined byte by byte
+        array1 = random_mask_data((29, 67), seed=7)
+        array2 = random_mask_data((29, 67), seed=8)
+        mask1 = cplcore.Mask(array1)
+        mask2 = cplcore.Mask(array2)
+        result = getattr(mask1, op)(mask2)
+        assert_mask_equal(result, getattr(array1, op)(array2))
+        # The operands are not modified
+        assert_mask_equal(mask1, array1)
+        assert_mask_equal(mask2, array2)
 
     def test_xor(self):
         mask1 = cplcore.Mask(3, 3)
-        mask2 = ~cplcore.Mask(3, 3)
+        mask2 = cplcore.Mask.ones(3, 3)
         # Line down the center of mask1
         # ·█·
         # ·█·
@@ -283,11 +399,7 @@ class TestMask:
         # ·█·
         # █·█
         mask3 = mask1 ^ mask2
-        assert not mask3[0][1]
-        assert not mask3[2][1]
-        assert not mask3[1][0]
-        assert not mask3[1][2]
-        assert mask3.count() == 5
+        assert_mask_equal(mask3, [[1, 0, 1], [0, 1, 0], [1, 0, 1]])
 
     def test_invert(self):
         mask1 = cplcore.Mask(3, 3)
@@ -304,11 +416,15 @@ class TestMask:
         # ·█·
         # █·█
         mask2 = ~mask1
-        assert not mask2[0][1]
-        assert not mask2[2][1]
-        assert not mask2[1][0]
-        assert not mask2[1][2]
-        assert mask2.count() == 5
+        assert_mask_equal(mask2, [[1, 0, 1], [0, 1, 0], [1, 0, 1]])
+
+    def test_invert_in_place(self):
+        expected = random_mask_data((19, 53), seed=11)
+        mask1 = cplcore.Mask(expected)
+        assert mask1.invert() is None
+        assert_mask_equal(mask1, ~expected)
+        mask1.invert()
+        assert_mask_equal(mask1, expected)
 
     def test_collapse_rows(self):
         mask1 = cplcore.Mask(3, 4)
@@ -327,8 +443,7 @@ class TestMask:
         # █···
         collapsed = mask1.collapse_rows()
         assert collapsed.shape == (1, 3)
-        assert collapsed[0][0]
-        assert collapsed.count() == 1
+        assert_mask_equal(collapsed, [[1, 0, 0]])
 
     def test_collapse_cols(self):
         mask1 = cplcore.Mask(4, 3)
@@ -348,8 +463,24 @@ class TestMask:
         # ·
         collapsed = mask1.collapse_cols()
         assert collapsed.shape == (3, 1)
-        assert collapsed[0][0]
-        assert collapsed.count() == 1
+        assert_mask_equal(collapsed, [[1], [0], [0]])
+
+    def test_collapse_wide(self):
+        # Rows wider than a machine word, with most columns all True so that
+        # the AND reduction cannot stop early
+        data = np.ones((29, 131), dtype=bool)
+        data[3, 5] = False
+        data[17, 64] = False
+        data[28, 130] = False
+        mask = cplcore.Mask(data)
+
+        collapsed = mask.collapse_rows()
+        assert collapsed.shape == (1, 131)
+        assert_mask_equal(collapsed, data.all(axis=0, keepdims=True))
+
+        collapsed = mask.collapse_cols()
+        assert collapsed.shape == (29, 1)
+        assert_mask_equal(collapsed, data.all(axis=1, keepdims=True))
 
     def test_extract(self):
         big_mask = cplcore.Mask(3, 3)
@@ -372,10 +503,7 @@ class TestMask:
         #  └───┘
         bottom_right = big_mask.extract((1, 1, 2, 2))
         assert bottom_right.shape == (2, 2)
-        assert bottom_right[0][0]
-        assert bottom_right[0][1]
-        assert bottom_right[1][0]
-        assert not bottom_right[1][1]
+        assert_mask_equal(bottom_right, [[1, 1], [1, 0]])
 
         # The window, here, is inclusive and 2-position based (not position+size)
         # ┌─────┐
@@ -386,9 +514,7 @@ class TestMask:
         # · █ ·
         top = big_mask.extract((0, 0, 2, 0))
         assert top.shape == (1, 3)
-        assert not top[0][0]
-        assert not top[0][1]
-        assert top[0][2]
+        assert_mask_equal(top, [[0, 0, 1]])
 
     def test_extract_oob(self):
         mask1 = cplcore.Mask(3, 3)
@@ -425,14 +551,7 @@ class TestMask:
         # RESOLVED: June 2021, we were printing the masks top->bottom rather than bottom -> top
         mask1.rotate(-1)
         assert mask1.shape == (3, 4)
-        assert mask1[0][2]
-        assert mask1[1][0]
-        assert mask1[1][1]
-        assert mask1[1][2]
-        assert mask1[2][0]
-        assert mask1[2][2]
-        assert mask1[2][3]
-        assert mask1.count() == 7
+        assert_mask_equal(mask1, [[0, 0, 1, 0], [1, 1, 1, 0], [1, 0, 1, 1]])
 
     def test_shift(self):
         mask1 = cplcore.Mask(3, 3)
@@ -524,6 +643,31 @@ class TestMask:
         mask1.flip(3)
         assert mask1[0][0]
 
+    @pytest.mark.parametrize("shape", [(70, 70), (130, 130), (37, 90)])
+    @pytest.mark.parametrize("turns", [-3, -2, -1, 0, 1, 2, 3, 5])
+    def test_rotate_wide(self, shape, turns):
+        data = random_mask_data(shape, seed=13)
+        mask1 = cplcore.Mask(data)
+        mask1.rotate(turns)
+        assert_mask_equal(mask1, np.rot90(data, turns))
+
+    @pytest.mark.parametrize("shape", [(70, 70), (130, 130), (37, 90)])
+    @pytest.mark.parametrize(
+        "axis,reference",
+        [
+            (0, np.flipud),
+            (1, np.transpose),
+            (2, np.fliplr),
+            (3, lambda data: data[::-1, ::-1].T),
+        ],
+    )
+    def test_flip_wide(self, shape, axis, reference):
+        data = random_mask_data(shape, seed=17)
+        mask1 = cplcore.Mask(data)
+        mask1.flip(axis)
+        assert mask1.shape == reference(data).shape
+        assert_mask_equal(mask1, reference(data))
+
     def test_move(self):
         mask1 = cplcore.Mask(4, 4)
         newPos = [1, 0, 3, 2]
@@ -555,24 +699,47 @@ class TestMask:
         # ····
         # ····
         # ·██·
-        assert not mask1[0][0]
-        assert not mask1[0][3]
-        assert not mask1[3][0]
-        assert not mask1[3][3]
-        assert mask1[0][1]
-        assert mask1[0][2]
-        assert mask1[3][1]
-        assert mask1[3][2]
+        assert_mask_equal(
+            mask1, [[0, 1, 1, 0], [0, 0, 0, 0], [0, 0, 0, 0], [0, 1, 1, 0]]
+        )
+
+    def test_move_tiles(self):
+        data = random_mask_data((12, 96), seed=9)
+        nb_cut = 3
+        positions = [4, 8, 0, 2, 6, 1, 5, 3, 7]
+        mask = cplcore.Mask(data)
+        mask.move(nb_cut, positions)
+
+        tile_ny, tile_nx = data.shape[0] // nb_cut, data.shape[1] // nb_cut
+        expected = np.empty_like(data)
+        for j in range(nb_cut):
+            for i in range(nb_cut):
+                tile_y, tile_x = divmod(positions[i + j * nb_cut], nb_cut)
+                expected[
+                    tile_y * tile_ny : (tile_y + 1) * tile_ny,
+                    tile_x * tile_nx : (tile_x + 1) * tile_nx,
+                ] = data[
+                    j * tile_ny : (j + 1) * tile_ny, i * tile_nx : (i + 1) * tile_nx
+                ]
+        assert_mask_equal(mask, expected)
+
+    def test_move_not_a_permutation(self):
+        mask = cplcore.Mask.ones(4, 4)
+        with pytest.raises(cplcore.IllegalInputError):
+            mask.move(2, [0, 0, 1, 2])
+        with pytest.raises(cplcore.IllegalInputError):
+            mask.move(2, [1, 2, 3, 4])
+        assert mask.count() == 16
 
     def test_subsample(self):
         # Create a random mask
         mask1 = cplcore.Mask(12, 9)
-        mask1.insert(~cplcore.Mask(3, 7), 4, 2)
-        mask1.insert(~cplcore.Mask(11, 2), 1, 3)
+        mask1.insert(cplcore.Mask.ones(3, 7), 4, 2)
+        mask1.insert(cplcore.Mask.ones(11, 2), 1, 3)
         mask1.insert(cplcore.Mask(2, 4), 6, 2)
         mask1.insert(cplcore.Mask(2, 3), 3, 6)
-        mask1.insert(~cplcore.Mask(3, 1), 1, 0)
-        mask1.insert(~cplcore.Mask(2, 2), 1, 10)
+        mask1.insert(cplcore.Mask.ones(3, 1), 1, 0)
+        mask1.insert(cplcore.Mask.ones(2, 2), 1, 10)
         # ·███········
         # ↑   ↑   ↑
         # ··········██
@@ -587,10 +754,16 @@ class TestMask:
         # ·····██·····
         # ·····██·····
         mask2 = mask1.subsample(1, 2)
-        assert mask2[1][2]
+        assert_mask_equal(mask2, np.asarray(mask1)[:, ::2])
         assert mask2.shape == (9, 6)
         assert mask2.count() == 17
 
+    @pytest.mark.parametrize("ystep,xstep", [(1, 1), (1, 2), (3, 1), (2, 5), (7, 64)])
+    def test_subsample_wide(self, ystep, xstep):
+        data = random_mask_data((23, 150), seed=3)
+        mask1 = cplcore.Mask(data)
+        assert_mask_equal(mask1.subsample(ystep, xstep), data[::ystep, ::xstep])
+
     # Test the CPL function using example from Schalkoff. Translation of equivalent cpl test to python
     # see R. Schallkoff, "Digital Image Processing and Computer Vision"
     def test_filter_schalkoff(self):
@@ -600,16 +773,12 @@ class TestMask:
         # hy    Number of borders rows to fill
         # fill  Value to use in fill
         def fill_border(mask, hx, hy, fill):
-            if fill:
-                mask.insert(~cplcore.Mask(hx, mask.height), 0, 0)
-                mask.insert(~cplcore.Mask(hx, mask.height), mask.width - hx, 0)
-                mask.insert(~cplcore.Mask(mask.width, hy), 0, 0)
-                mask.insert(~cplcore.Mask(mask.width, hy), 0, mask.height - hy)
-            else:
-                mask.insert(cplcore.Mask(hx, mask.height), 0, 0)
-                mask.insert(cplcore.Mask(hx, mask.height), 0, mask.width - hx)
-                mask.insert(cplcore.Mask(mask.width, hy), 0, 0)
-                mask.insert(cplcore.Mask(mask.width, hy), mask.height - hy, 0)
+            # Writes through the zero-copy view of the mask buffer
+            arr = np.asarray(mask)
+            arr[:, :hx] = fill
+            arr[:, arr.shape[1] - hx :] = fill
+            arr[:hy, :] = fill
+            arr[arr.shape[0] - hy :, :] = fill
 
         nx = 21
         ny = 18
@@ -775,9 +944,9 @@ class TestMask:
                 assert maskD == mask0
 
                 # Test duality of erosion and dilation (kernel is symmetric)
-                flipCopy = ~flipCopy
+                flipCopy.invert()
                 mask0 = flipCopy.filter(kernel, cplcore.Filter.DILATION, b)
-                mask0 = ~mask0
+                mask0.invert()
 
                 # No Duality on Border
                 fill_border(mask0, 3, 3, False)
@@ -787,7 +956,7 @@ class TestMask:
 
                 # Test duality of erosion and dilation (kernel is symmetric)
                 mask0 = flipCopy.filter(kernel, cplcore.Filter.EROSION, b)
-                mask0 = ~mask0
+                mask0.invert()
 
                 # No duality on border
                 fill_border(mask0, 3, 3, False)
@@ -800,9 +969,10 @@ class TestMask:
                 if iflip != 1:
                     flipCopy.flip(iflip)
                 nidem = 2
+                mask0 = flipCopy
                 while nidem != 0:
                     # Idempotency test as well
-                    mask0 = flipCopy.filter(kernel, cplcore.Filter.OPENING, b)
+                    mask0 = mask0.filter(kernel, cplcore.Filter.OPENING, b)
                     nidem -= 1
                 if iflip != 1:
                     mask0.flip(iflip)
@@ -813,18 +983,19 @@ class TestMask:
                 if iflip != 1:
                     flipCopy.flip(iflip)
                 nidem = 2
+                mask0 = flipCopy
                 while nidem != 0:
                     # Idempotency test as well
-                    mask0 = flipCopy.filter(kernel, cplcore.Filter.CLOSING, b)
+                    mask0 = mask0.filter(kernel, cplcore.Filter.CLOSING, b)
                     nidem -= 1
                 if iflip != 1:
                     mask0.flip(iflip)
                 assert mask0 == maskC
 
                 # Test duality of opening and closing
-                flipCopy = ~flipCopy
+                flipCopy.invert()
                 mask0 = flipCopy.filter(kernel, cplcore.Filter.OPENING, b)
-                mask0 = ~mask0
+                mask0.invert()
 
                 # No duality on border
                 fill_border(mask0, 3, 3, False)
@@ -834,7 +1005,7 @@ class TestMask:
 
                 # Test duality of closing and opening
                 mask0 = flipCopy.filter(kernel, cplcore.Filter.CLOSING, b)
-                mask0 = ~mask0
+                mask0.invert()
 
                 # No duality on border
                 fill_border(mask0, 3, 3, False)
@@ -843,6 +1014,24 @@ class TestMask:
                 assert maskO == mask0
                 # Tests for one flip done
 
+    @pytest.mark.parametrize(
+        "filter_mode,reference",
+        [
+            (cplcore.Filter.EROSION, ndimage.binary_erosion),
+            (cplcore.Filter.DILATION, ndimage.binary_dilation),
+        ],
+    )
+    def test_filter_wide(self, filter_mode, reference):
+        # Masks wider than a machine word go through the word-wise kernels
+        data = random_mask_data((37, 203), density=0.6, seed=5)
+        mask = cplcore.Mask(data)
+        kernel = cplcore.Mask.ones(3, 3)
+        filtered = mask.filter(kernel, filter_mode, cplcore.Border.ZERO)
+        expected = reference(data, structure=np.ones((3, 3), dtype=bool))
+        np.testing.assert_array_equal(
+            np.asarray(filtered)[1:-1, 1:-1], expected[1:-1, 1:-1]
+        )
+
     def test_insert(self):
         big_mask = cplcore.Mask(3, 3)
         [a, b, c, d] = [True, False, False, True]
@@ -853,15 +1042,8 @@ class TestMask:
         bottom_right[1][1] = d
 
         big_mask.insert(bottom_right, 1, 1)
-        assert not big_mask[0][0]
-        assert not big_mask[0][1]
-        assert not big_mask[0][2]
-        assert not big_mask[1][0]
-        assert big_mask[1][1] == a  # 0,0 (bottom_right index) + 1,1 (overwrite index)
-        assert big_mask[1][2] == b  # 0,1 (bottom_right index) + 1,1 (overwrite index)
-        assert not big_mask[2][0]
-        assert big_mask[2][1] == c  # 1,0 (bottom_right index) + 1,1 (overwrite index)
-        assert big_mask[2][2] == d  # 1,1 (bottom_right index) + 1,1 (overwrite index)
+        # bottom_right is written at offset 1,1 of big_mask
+        assert_mask_equal(big_mask, [[0, 0, 0], [0, a, b], [0, c, d]])
 
     def test_image_threshold_binary1(self):
         im = cplcore.Image([[1, 2], [3, 4]])
@@ -877,58 +1059,62 @@ class TestMask:
         )  # All within threshold False, rest True
         assert np.array_equal(mask, [[False, False], [True, True]])
 
-    def test_repr(self):
-        mask1 = cplcore.Mask(3, 3)
-        assert repr(mask1) == """<cpl.core.Mask, 3x3 empty mask>"""
-        mask1[2][2] = True
-        assert repr(mask1) == "<cpl.core.Mask, 3x3 non-empty mask>"
+    def test_fill_from_threshold(self):
+        mask = cplcore.Mask(2, 2)
+        mask.fill_from_threshold(cplcore.Image([[1, 2], [3, 4]]), 1.5, 4)
+        assert np.array_equal(mask, [[False, True], [True, False]])
+        # The same mask is overwritten, not combined with the previous result
+        mask.fill_from_threshold(cplcore.Image([[1, 2], [3, 4]]), 0, 2.4, False)
+        assert np.array_equal(mask, [[False, False], [True, True]])
 
-    def test_dump_file(self, tmp_path):
+    def test_fill_from_threshold_size_mismatch(self):
+        mask = cplcore.Mask(3, 3)
+        with pytest.raises(cplcore.IncompatibleInputError):
+            mask.fill_from_threshold(cplcore.Image([[1, 2], [3, 4]]), 1.5, 4)
+
+    @pytest.mark.parametrize("dtype", [np.intc, np.single, np.double])
+    @pytest.mark.parametrize("with_bpm", [False, True], ids=["no_bpm", "bpm"])
+    def test_image_threshold_matches_numpy(self, dtype, with_bpm):
+        rng = np.random.default_rng(3)
+        values = (rng.random((23, 41)) * 100).astype(dtype)
+        if dtype != np.intc:
+            values[3, 5] = np.nan
+            values[7, 11] = np.inf
+        im = cplcore.Image(values)
+        inside = (values > 20) & (values < 70)
+        if with_bpm:
+            # Rejected pixels are never inside the interval
+            im.reject(0, 0)
+            im.reject(10, 20)
+            inside[0, 0] = inside[10, 20] = False
+
+        assert_mask_equal(cplcore.Mask.threshold_image(im, 20, 70, True), inside)
+        assert_mask_equal(cplcore.Mask.threshold_image(im, 20, 70, False), ~inside)
+        assert_mask_equal(cplcore.Mask(im, 20, 70), inside)
+
+    def test_image_threshold_unsupported_type(self):
+        im = cplcore.Image.zeros(3, 3, cplcore.Type.DOUBLE_COMPLEX)
+        with pytest.raises(cplcore.UnsupportedModeError):
+            cplcore.Mask.threshold_image(im, 0, 1, True)
+
+    def test_repr(self, mask_3x3):
+        assert repr(cplcore.Mask(3, 3)) == """<cpl.core.Mask, 3x3 empty mask>"""
+        assert repr(mask_3x3) == "<cpl.core.Mask, 3x3 non-empty mask>"
+
+    def test_dump_file(self, tmp_path, mask_3x3):
         d = tmp_path / "sub"
         d.mkdir()
         p = d / "cpl_mask_dump.txt"
-        mask1 = cplcore.Mask(3, 3)
-        mask1[2][2] = True
         filename = tmp_path.joinpath(p)
-        mask1.dump(filename=str(filename))
-        outp = """#----- mask: 1 <= x <= 3, 1 <= y <= 3 -----
-	X	Y	value
-	1	1	0
-	1	2	0
-	1	3	0
-	2	1	0
-	2	2	0
-	2	3	0
-	3	1	0
-	3	2	0
-	3	3	1
-"""  # noqa
-        contents = ""
-        with open(str(filename), "r") as f:
-            for line in f.readlines():
-                contents += line
-        assert contents == outp
+        mask_3x3.dump(filename=str(filename))
+        assert filename.read_text() == MASK_DUMP
 
-    def test_dump_string(self):
-        mask1 = cplcore.Mask(3, 3)
-        mask1[2][2] = True
-        outp = """#----- mask: 1 <= x <= 3, 1 <= y <= 3 -----
-	X	Y	value
-	1	1	0
-	1	2	0
-	1	3	0
-	2	1	0
-	2	2	0
-	2	3	0
-	3	1	0
-	3	2	0
-	3	3	1
-"""  # noqa
-        assert str(mask1) == outp
-        assert isinstance(mask1.dump(show=False), str)
+    def test_dump_string(self, mask_3x3):
+        assert str(mask_3x3) == MASK_DUMP
+        assert isinstance(mask_3x3.dump(show=False), str)
         # test some special cases
-        assert mask1.dump(window=None, show=False) == outp
-        assert mask1.dump(window=(0, 0, 0, 0), show=False) == outp
+        assert mask_3x3.dump(window=None, show=False) == MASK_DUMP
+        assert mask_3x3.dump(window=(0, 0, 0, 0), show=False) == MASK_DUMP
         # test a window
         outp = """#----- mask: 1 <= x <= 2, 1 <= y <= 2 -----
 	X	Y	value
@@ -937,28 +1123,11 @@ class TestMask:
 	2	1	0
 	2	2	0
 """  # noqa
-        assert mask1.dump(window=(0, 0, 1, 1), show=False) == outp
-
-    def test_dump_stdout(self):
-        cmd = "from cpl import core as cplcore; "
-        cmd += "mask1 = cplcore.Mask(3, 3); "
-        cmd += "mask1[2][2] = True ; "
-        cmd += "mask1.dump()"
-        response = subprocess.run(["python", "-c", cmd], stdout=subprocess.PIPE)
-        outp = str(response.stdout, "utf-8")
-        expect = """#----- mask: 1 <= x <= 3, 1 <= y <= 3 -----
-	X	Y	value
-	1	1	0
-	1	2	0
-	1	3	0
-	2	1	0
-	2	2	0
-	2	3	0
-	3	1	0
-	3	2	0
-	3	3	1
-"""  # noqa
-        assert outp == expect
+        assert mask_3x3.dump(window=(0, 0, 1, 1), show=False) == outp
+
+    def test_dump_stdout(self, capfd, mask_3x3):
+        mask_3x3.dump()
+        assert capfd.readouterr().out == MASK_DUMP
 
     def test_mask_args_yx(self):
         new_mask = cplcore.Mask(20, 5)
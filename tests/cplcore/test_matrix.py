@@ -15,32 +15,40 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
 import copy
-import math
+import functools
 
 import numpy as np
 import pytest
-import subprocess
 
 from cpl import core as cplcore
 
+# Dump of the matrix [[5, 6], [19, -12]]
+MATRIX_DUMP = """          0      1
+  0       5      6
+  1      19    -12
+
+"""
+
 
 # fixtures based off matrices in cpl_matrix-test.c
 
 
-@pytest.fixture(scope="function")
+@pytest.fixture(scope="module")
 def cpl_matrix_fill_illcond():
+    @functools.lru_cache(maxsize=None)
+    def _build(size):
+        # The 'usual' definition of this increasingly ill-conditioned
+        #    matrix is
+        #    A(i,j) = 1/(1+i+j)
+        #    - but to expose direct solvers without pivoting, we use
+        #    A(i,j) = 1/(2*size - (1+i+j))
+        index_sum = np.add.outer(np.arange(size), np.arange(size))
+        return cplcore.Matrix(1.0 / (2 * size - (index_sum + 1)))
+
     def _cpl_matrix_fill_illcond(size):
-        matrix = cplcore.Matrix.zeros(size, size)
-        for i in range(size):
-            for j in range(size):
-                # The 'usual' definition of this increasingly ill-conditioned
-                #    matrix is
-                #    A(i,j) = 1/(1+i+j)
-                #    - but to expose direct solvers without pivoting, we use
-                #    A(i,j) = 1/(2*size - (1+i+j))
-                value = 1.0 / (2 * size - (i + j + 1))
-                matrix[i][j] = value
-        return matrix
+        # Hand out copies, so a test modifying its matrix can't change the
+        # cached one
+        return _build(size).copy()
 
     return _cpl_matrix_fill_illcond
 
@@ -48,11 +56,7 @@ def cpl_matrix_fill_illcond():
 @pytest.fixture(scope="function")
 def cpl_matrix_get_2norm_1():
     def _cpl_matrix_get_2norm_1(matrix):
-        norm = 0
-        for i in range(matrix.shape[0]):
-            value = matrix[i][0]
-            norm += value * value
-        return math.sqrt(norm)
+        return float(np.linalg.norm(np.asarray(matrix)[:, 0]))
 
     return _cpl_matrix_get_2norm_1
 
@@ -104,6 +108,42 @@ class TestMatrix:
         assert img[2][0] == 4
         assert img[2][1] == -99
 
+    @pytest.mark.parametrize(
+        "dtype", [np.bool_, np.ubyte, np.intc, np.int64, np.single]
+    )
+    def test_constructor_from_numeric_ndarray_2d(self, dtype):
+        values = np.arange(12).reshape(3, 4).astype(dtype)
+        mat = cplcore.Matrix(values)
+        assert mat.shape == (3, 4)
+        for row, expected in zip(mat, values.astype(np.double)):
+            assert list(row) == list(expected)
+
+    def test_constructor_from_ndarray_2d_not_contiguous(self):
+        values = np.arange(12.0).reshape(3, 4)
+        mat = cplcore.Matrix(values[:, ::2].T)
+        assert mat.shape == (2, 3)
+        assert mat[1][2] == values[2, 2]
+
+    @pytest.mark.parametrize("dtype", [np.intc, np.int64, np.single, np.double])
+    def test_constructor_from_numeric_ndarray_1d(self, dtype):
+        values = np.arange(12).astype(dtype)
+        mat = cplcore.Matrix(values[::-1], 3)
+        assert mat.shape == (3, 4)
+        np.testing.assert_array_equal(
+            np.asarray(mat), values[::-1].astype(np.double).reshape(3, 4)
+        )
+
+    def test_asarray(self):
+        values = np.arange(12.0).reshape(3, 4)
+        mat = cplcore.Matrix(values)
+        arr = np.asarray(mat)
+        assert arr.dtype == np.double
+        np.testing.assert_array_equal(arr, values)
+        # The array is a copy, not a view of the matrix buffer
+        arr[0, 0] = 99.0
+        assert mat[0][0] == 0.0
+        np.testing.assert_array_equal(np.asarray(mat, dtype=np.intc), values)
+
     def test_set_int(self):
         img = cplcore.Matrix.zeros(2, 1)
         img[0][0] = 5
@@ -131,11 +171,11 @@ class TestMatrix:
 
     def test_extract(self):
         orig_list = [-1837, -59494, -168, 14751, -7984, -35832, 2267, 20176, 14924]
-        img1 = cplcore.Matrix(orig_list, 3)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 3)
 
         img2 = img1[1:, 1:]
         # Check img1 didn't change
-        assert orig_list == [e for row in img1 for e in row]
+        np.testing.assert_array_equal(np.asarray(img1).ravel(), orig_list)
         assert img1.shape == (3, 3)
 
         assert img2[0][0] == -7984
@@ -146,7 +186,7 @@ class TestMatrix:
 
     def test_extract_skip(self):
         orig_list = [-1837, -59494, -168, 14751, -7984, -35832, 2267, 20176, 14924]
-        img1 = cplcore.Matrix(orig_list, 3)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 3)
 
         # Should capture 0, 2 of each dimension #(Not 3)
         img2 = img1[::2, ::2]
@@ -187,32 +227,30 @@ class TestMatrix:
 
     def test_fill(self):
         orig_list = [-1837, -59494, -168, 14751, -7984, -35832, 2267, 20176, 14924]
-        img1 = cplcore.Matrix(orig_list, 3)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 3)
 
         img1.fill(5)
-        assert all((img1[y][x] == 5 for x in range(3) for y in range(3)))
+        np.testing.assert_array_equal(np.asarray(img1), np.full((3, 3), 5.0))
         assert img1.shape == (3, 3)
 
     def test_fill_row(self):
         orig_list = [-1837, -59494, -168, 14751, -7984, -35832, 2267, 20176, 14924]
-        img1 = cplcore.Matrix(orig_list, 3)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 3)
 
         img1.fill_row(5, 1)
-        assert all(
-            (img1[y][x] == orig_list[y * 3 + x] for x in range(3) for y in [0, 2])
-        )
-        assert all((img1[1][x] == 5 for x in range(3)))
+        expected = np.array(orig_list, dtype=np.double).reshape(3, 3)
+        expected[1, :] = 5
+        np.testing.assert_array_equal(np.asarray(img1), expected)
         assert img1.shape == (3, 3)
 
     def test_fill_column(self):
         orig_list = [-1837, -59494, -168, 14751, -7984, -35832, 2267, 20176, 14924]
-        img1 = cplcore.Matrix(orig_list, 3)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 3)
 
         img1.fill_column(5, 1)
-        assert all(
-            (img1[y][x] == orig_list[y * 3 + x] for x in [0, 2] for y in range(3))
-        )
-        assert all((img1[y][1] == 5 for y in range(3)))
+        expected = np.array(orig_list, dtype=np.double).reshape(3, 3)
+        expected[:, 1] = 5
+        np.testing.assert_array_equal(np.asarray(img1), expected)
         assert img1.shape == (3, 3)
 
     def test_fill_row_badindex(self):
@@ -235,16 +273,13 @@ class TestMatrix:
 
     def test_fill_diagonal(self):
         orig_list = [-1837, -59494, -168, 14751, -7984, -35832, 2267, 20176, 14924]
-        img1 = cplcore.Matrix(orig_list, 3)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 3)
 
         img1.fill_diagonal(5, 1)
-        assert all(
-            (
-                img1[y][x] == 5 if x - 1 == y else img1[y][x] == orig_list[y * 3 + x]
-                for x in range(3)
-                for y in range(3)
-            )
-        )
+        expected = np.array(orig_list, dtype=np.double).reshape(3, 3)
+        # Diagonal 1 is the one above the main diagonal, where x == y + 1
+        expected[np.arange(2), np.arange(1, 3)] = 5
+        np.testing.assert_array_equal(np.asarray(img1), expected)
         assert img1.shape == (3, 3)
 
     def test_fill_window(self):
@@ -275,22 +310,34 @@ class TestMatrix:
             1980.2,
             8.25,
         ]
-        img1 = cplcore.Matrix(orig_list, 5)
+        img1 = cplcore.Matrix(np.array(orig_list, dtype=np.double), 5)
 
         img1.fill_window(12094.29012, 1, 1, 2, 2)
-        assert all(
-            (
-                (
-                    img1[y][x] == 12094.29012
-                    if x in range(1, 3) and y in range(1, 3)
-                    else img1[y][x] == orig_list[y * 5 + x]
-                )
-                for x in range(5)
-                for y in range(5)
-            )
-        )
+        expected = np.array(orig_list, dtype=np.double).reshape(5, 5)
+        expected[1:3, 1:3] = 12094.29012
+        np.testing.assert_array_equal(np.asarray(img1), expected)
         assert img1.shape == (5, 5)
 
+    @pytest.mark.parametrize("dtype", [np.intc, np.double])
+    def test_assign(self, dtype):
+        values = np.arange(12).reshape(3, 4).astype(dtype)
+        mat = cplcore.Matrix.zeros(3, 4)
+        mat.assign(values)
+        np.testing.assert_array_equal(np.asarray(mat), values)
+        # The source array is not referenced by the matrix
+        values[0, 0] = 99
+        assert mat[0][0] == 0.0
+        # Non-contiguous input
+        mat.assign(np.arange(24.0).reshape(3, 8)[:, ::2])
+        assert mat[2][3] == 22.0
+
+    def test_assign_wrong_shape(self):
+        mat = cplcore.Matrix.zeros(3, 4)
+        with pytest.raises(cplcore.IncompatibleInputError):
+            mat.assign(np.zeros((4, 3)))
+        with pytest.raises(cplcore.IncompatibleInputError):
+            mat.assign(np.zeros(12))
+
     def test_shift(self):
         orig_list = [
             1092.333,
@@ -324,13 +371,36 @@ class TestMatrix:
         img1.shift(1, 2)  # 1 row, 2 columns
         assert all(())
 
+    @pytest.mark.parametrize(
+        "duplicate", [cplcore.Matrix.copy, copy.copy, copy.deepcopy]
+    )
+    def test_copy(self, duplicate):
+        original = cplcore.Matrix(np.arange(6.0).reshape(2, 3))
+        dupe = duplicate(original)
+        assert isinstance(dupe, cplcore.Matrix)
+        assert dupe == original
+        # The copy doesn't share the buffer of the original
+        dupe.fill(-1.0)
+        np.testing.assert_array_equal(
+            np.asarray(original), np.arange(6.0).reshape(2, 3)
+        )
+
     def test_solve_lu(self):
         original = cplcore.Matrix(
-            [15, 3, 2, 12, 9, 5, 11, 2, 2, 10, 13, 11, 13, 5, 4, 10], 4
+            np.array(
+                [15, 3, 2, 12, 9, 5, 11, 2, 2, 10, 13, 11, 13, 5, 4, 10],
+                dtype=np.double,
+            ),
+            4,
+        )
+        rhs = cplcore.Matrix(
+            np.array(
+                [1, 12, 7, 8, 5, 14, 3, 3, 14, 8, 1, 4, 10, 12, 3, 4], dtype=np.double
+            ),
+            4,
         )
-        rhs = cplcore.Matrix([1, 12, 7, 8, 5, 14, 3, 3, 14, 8, 1, 4, 10, 12, 3, 4], 4)
         perms, even = original.decomp_lu()
-        dupe = copy.deepcopy(original)
+        dupe = original.copy()
 
         dupe.solve_lu(rhs, perms)
 
@@ -401,23 +471,20 @@ class TestMatrix:
             [0.6, 0.33333333333333337, 5.555555555555556, -8.333333333333332],
             [0.8666666666666667, 0.25, -0.16499999999999995, -4.125],
         ]
-        mat = cplcore.Matrix(data)
-        for mat_row, real_row in zip(mat, data):
-            assert np.array_equal(
-                mat_row, real_row
-            )  # Test numpy support for individual rows
-            for mat_val, real_val in zip(mat_row, real_row):
-                assert mat_val == real_val
+        mat = cplcore.Matrix(np.array(data, dtype=np.double))
+        np.testing.assert_array_equal(np.asarray(mat), data)
+        # Smoke test the iterators: one row per iteration step, each row
+        # iterable over its elements and usable with numpy
+        rows = list(mat)
+        assert len(rows) == len(data)
+        assert isinstance(rows[0], cplcore.MatrixRow)
+        assert list(rows[0]) == data[0]
+        np.testing.assert_array_equal(rows[-1], data[-1])
 
     def test_dump_string(self):
         list_2d = [[5, 6], [19, -12]]
         mat = cplcore.Matrix(list_2d)
-        outp = """          0      1
-  0       5      6
-  1      19    -12
-
-"""
-        assert str(mat) == outp
+        assert str(mat) == MATRIX_DUMP
         assert isinstance(mat.dump(show=False), str)
 
     def test_dump_file(self, tmp_path):
@@ -427,33 +494,14 @@ class TestMatrix:
         filename = tmp_path.joinpath(p)
         list_2d = [[5, 6], [19, -12]]
         mat = cplcore.Matrix(list_2d)
-        outp = """          0      1
-  0       5      6
-  1      19    -12
-
-"""
         mat.dump(filename=str(filename))
-        contents = ""
-        with open(str(filename), "r") as f:
-            for line in f.readlines():
-                contents += line
-        assert contents == outp
-
-    def test_dump_stdout(self):
-        # for some reason we can't capture stdout using capsys
-        # a cheeky workaround using subprocess does the trick
-        cmd = "from cpl import core as cplcore; "
-        cmd += "list_2d = [[5, 6], [19, -12]];"
-        cmd += "mat = cplcore.Matrix(list_2d);"
-        cmd += "mat.dump()"
-        response = subprocess.run(["python", "-c", cmd], stdout=subprocess.PIPE)
-        outp = str(response.stdout, "utf-8")
-        expect = """          0      1
-  0       5      6
-  1      19    -12
+        assert filename.read_text() == MATRIX_DUMP
 
-"""
-        assert outp == expect
+    def test_dump_stdout(self, capfd):
+        list_2d = [[5, 6], [19, -12]]
+        mat = cplcore.Matrix(list_2d)
+        mat.dump()
+        assert capfd.readouterr().out == MATRIX_DUMP
 
     def test_repr(self):
         list_2d = [[5, 6], [19, -12]]
@@ -28,6 +28,34 @@ verylongnamesize = 1024 * 1024
 TIME_REGEX = "[0-2][0-9]:[0-5][0-9]:[0-5][0-9]"
 
 
+def log_line_regex(severity, message):
+    # The time stamps are from cpl_msg.c:560 cpl_msg_out
+    # [tid=XXX] is present when your CPL library was compiled with openMP.
+    return re.compile(
+        TIME_REGEX
+        + r" \["
+        + severity
+        + r"\] test_component: (\[tid=[0-9]{0,3}\] )?"
+        + message
+        + "\n"
+    )
+
+
+# Expected lines of the log file written by TestMessage.test_file
+# See cpl_msg.c:266 _cpl_timestamp_iso8601 for ISO-8601 implementation
+# for this first Start TIme
+START_TIME_LINE_REGEX = re.compile(
+    r"Start time     : [0-9]{4}-[0-1][0-9]-[0-3][0-9]T" + TIME_REGEX + "\n"
+)
+PROGRAM_NAME_LINE_REGEX = re.compile(r"Program name   : test_file\n")
+SEVERITY_LEVEL_LINE_REGEX = re.compile(r"Severity level : \[ DEBUG \] \n")
+DEBUG_LINE_REGEX = log_line_regex(" DEBUG ", "Debug line")
+INFO_LINE_REGEX = log_line_regex(" INFO  ", "Info line")
+WARNING_LINE_REGEX = log_line_regex("WARNING", "Warning line")
+ERROR_LINE_REGEX = log_line_regex(" ERROR ", "Error line: Oh no!")
+INDENTED_LINE_REGEX = log_line_regex(" INFO  ", "  Indented line")
+
+
 class TestMessage:
     # First basic test
     def test_display(self):
@@ -88,6 +116,26 @@ class TestMessage:
         Msg.warning(verylongname, "test for long component name")
         Msg.error(verylongname, "test for long component name")
 
+    def test_longname_file(self, tmp_path):
+        Msg.set_config(level=Msg.SeverityLevel.ERROR, show_time=False)
+        log_path = tmp_path / "test_log.txt"
+        if len(str(log_path)) > 72:
+            pytest.xfail("CPL does not support logfile paths longer than 72 characters")
+        Msg.start_file(Msg.SeverityLevel.DEBUG, log_path)
+        Msg.info("A" * verylongnamesize, "test for long component name")
+        Msg.info("TestMessage", "." * verylongnamesize)
+        Msg.stop_file()
+        log_lines = log_path.read_text().splitlines()
+        # CPL cuts the log lines, including the component name, to
+        # CPL_MAX_MSG_LENGTH - 1 characters
+        assert re.fullmatch(TIME_REGEX + r" \[ INFO  \] A+", log_lines[5])
+        assert len(log_lines[5]) == CPL_MAX_MSG_LENGTH - 1
+        assert re.fullmatch(
+            TIME_REGEX + r" \[ INFO  \] TestMessage: (\[tid=[0-9]{0,3}\] )?\.+",
+            log_lines[6],
+        )
+        assert len(log_lines[6]) == CPL_MAX_MSG_LENGTH - 1
+
     def test_file(self, tmp_path):
         component = "test_component"
         Msg.set_config(
@@ -108,65 +156,12 @@ class TestMessage:
         Msg.set_config(indent=1)
         Msg.info(component, "Indented line")
         Msg.stop_file()
-        with log_path.open("r") as f:
-            log_lines = f.readlines()
-            # See cpl_msg.c:266 _cpl_timestamp_iso8601 for ISO-8601 implementation
-            # for this first Start TIme
-            assert (
-                re.fullmatch(
-                    r"Start time     : [0-9]{4}-[0-1][0-9]-[0-3][0-9]T"
-                    + TIME_REGEX
-                    + "\n",
-                    log_lines[1],
-                )
-                is not None
-            )
-            assert (
-                re.fullmatch(r"Program name   : test_file\n", log_lines[2]) is not None
-            )
-            assert (
-                re.fullmatch(r"Severity level : \[ DEBUG \] \n", log_lines[3])
-                is not None
-            )
-            # The rest of these times are from cpl_msg.c:560 cpl_msg_out
-            # [tid=XXX] is present when your CPL library was compiled with openMP.
-            assert (
-                re.fullmatch(
-                    TIME_REGEX
-                    + r" \[ DEBUG \] test_component: (\[tid=[0-9]{0,3}\] )?Debug line\n",
-                    log_lines[5],
-                )
-                is not None
-            )
-            assert (
-                re.fullmatch(
-                    TIME_REGEX
-                    + r" \[ INFO  \] test_component: (\[tid=[0-9]{0,3}\] )?Info line\n",
-                    log_lines[6],
-                )
-                is not None
-            )
-            assert (
-                re.fullmatch(
-                    TIME_REGEX
-                    + r" \[WARNING\] test_component: (\[tid=[0-9]{0,3}\] )?Warning line\n",
-                    log_lines[7],
-                )
-                is not None
-            )
-            assert (
-                re.fullmatch(
-                    TIME_REGEX
-                    + r" \[ ERROR \] test_component: (\[tid=[0-9]{0,3}\] )?Error line: Oh no!\n",
-                    log_lines[8],
-                )
-                is not None
-            )
-            assert (
-                re.fullmatch(
-                    TIME_REGEX
-                    + r" \[ INFO  \] test_component: (\[tid=[0-9]{0,3}\] )?  Indented line\n",
-                    log_lines[9],
-                )
-                is not None
-            )
+        log_lines = log_path.read_text().splitlines(keepends=True)
+        assert START_TIME_LINE_REGEX.fullmatch(log_lines[1]) is not None
+        assert PROGRAM_NAME_LINE_REGEX.fullmatch(log_lines[2]) is not None
+        assert SEVERITY_LEVEL_LINE_REGEX.fullmatch(log_lines[3]) is not None
+        assert DEBUG_LINE_REGEX.fullmatch(log_lines[5]) is not None
+        assert INFO_LINE_REGEX.fullmatch(log_lines[6]) is not None
+        assert WARNING_LINE_REGEX.fullmatch(log_lines[7]) is not None
+        assert ERROR_LINE_REGEX.fullmatch(log_lines[8]) is not None
+        assert INDENTED_LINE_REGEX.fullmatch(log_lines[9]) is not None
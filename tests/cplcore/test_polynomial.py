@@ -14,19 +14,46 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
 
-import copy
 import platform
-from random import random
 
 import numpy as np
 import pytest
-import subprocess
 
 from cpl import core as cplcore
 
+DBL_EPSILON = np.finfo(np.double).eps
 
-@pytest.fixture
-def fit_cmp(request):
+# Dump of the polynomial built by the dump_poly fixture
+POLYNOMIAL_DUMP = """#----- 2 dimensional polynomial of degree 2 -----
+1.dim.power  2.dim.power  coefficient
+      0            0      4
+      0            1      1
+      0            2      3
+#----- 3 coefficient(s) -----
+#------------------------------------
+"""
+
+
+@pytest.fixture(scope="module")
+def np_poly_2d():
+    # P(x, y) = 4 + 1x + 7y + 10xy + 3x² + 2xy³
+    #         = (4 + 1x + 3x²) + (7 + 10x)y + (2x)y³
+    np_term1_coeff = np.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
+    np_term2_coeff = np.polynomial.Polynomial([7, 10])  # P(x) = 7 + 10x
+    np_term3_coeff = np.polynomial.Polynomial([0, 2])  # P(x) = 2x
+    return np.polynomial.Polynomial([np_term1_coeff, np_term2_coeff, 0, np_term3_coeff])
+
+
+@pytest.fixture(scope="module")
+def dump_poly():
+    # P(x, y) = 4 + 1y + 3y², the tests using it must not modify it
+    np_term1_coeff = np.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
+    np_poly = np.polynomial.Polynomial([np_term1_coeff])
+    return cplcore.Polynomial.from_numpy(np_poly)
+
+
+@pytest.fixture(scope="module")
+def fit_cmp():
     def _fit_cmp(
         poly, samppos, fitvals, dimdeg, maxdeg, sampsym=None, fitsigm=None, mindeg=None
     ):
@@ -38,43 +65,16 @@ def fit_cmp(request):
 
         if samppos and (mdim == 1 or dimdeg):
             zeropol = cplcore.Polynomial(mdim)
-            samppos1p = cplcore.Matrix.zeros(1 + samppos.height, samppos.width)
-            sampsym1p = [False] * ndim if sampsym else None
-            mindeg1p = [0] * ndim if mindeg else None
-            maxdeg1p = [0] * ndim if maxdeg else None
+            samppos_arr = np.asarray(samppos)
             for idim in range(ndim):
-                # First copy all rows to new matrix, leaving one with zeroes
-                for j in range(idim):
-                    if j <= samppos.height:
-                        for i in range(samppos.width):
-                            samppos1p[j][i] = samppos[j][i]
-                    if sampsym1p:
-                        sampsym1p[j] = sampsym[j]
-                    if mindeg1p:
-                        mindeg1p[j] = mindeg[j]
-                    if maxdeg1p:
-                        maxdeg1p[j] = maxdeg[j]
-                if idim <= samppos.height:
-                    for i in range(samppos.width):
-                        samppos1p[idim][i] = 0.0
-                if sampsym1p is not None:
-                    sampsym1p[idim] = True
-                if mindeg1p is not None:
-                    mindeg1p[idim] = 0
-                if maxdeg1p is not None:
-                    maxdeg1p[idim] = 0
-                j = idim + 1
-                while j < ndim:
-                    if j <= samppos.height:
-                        for i in range(samppos.width):
-                            samppos1p[j][i] = samppos[j - 1][i]
-                    if sampsym1p is not None:
-                        sampsym1p[j] = sampsym[j - 1]
-                    if mindeg1p is not None:
-                        mindeg1p[j] = mindeg[j - 1]
-                    if maxdeg1p is not None:
-                        maxdeg1p[j] = maxdeg[j - 1]
-                    j += 1
+                # Copy all rows to the new matrix, inserting one with zeroes
+                # at idim
+                samppos1p = cplcore.Matrix(np.insert(samppos_arr, idim, 0.0, axis=0))
+                sampsym1p = (
+                    sampsym[:idim] + [True] + sampsym[idim:] if sampsym else None
+                )
+                mindeg1p = mindeg[:idim] + [0] + mindeg[idim:] if mindeg else None
+                maxdeg1p = maxdeg[:idim] + [0] + maxdeg[idim:] if maxdeg else None
                 if ndim > 3:
                     with pytest.raises(cplcore.UnsupportedModeError):
                         self1p.fit(
@@ -115,7 +115,7 @@ def fit_cmp(request):
                             max(np.fabs(k0), 1)
                             * pow(10.0, degree)
                             * mytol
-                            * np.finfo(np.double).eps,
+                            * DBL_EPSILON,
                         )
                         == 0
                     )
@@ -125,8 +125,8 @@ def fit_cmp(request):
     return _fit_cmp
 
 
-@pytest.fixture
-def vector_get_mse(request):
+@pytest.fixture(scope="module")
+def vector_get_mse():
     def _vector_get_mse(fitvals, fit, samppos):
         """
         Get the mean squared error from a vector of residuals
@@ -142,52 +142,21 @@ def vector_get_mse(request):
 
 
 class TestPolynomial:
-    def test_2d_numpy_equiv(self):
-        import numpy
-
-        # P(x, y) = 4 + 1x + 7y + 10xy + 3x² + 2xy³
-        #         = (4 + 1x + 3x²) + (7 + 10x)y + (2x)y³
-
-        np_term1_coeff = numpy.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
-        np_term2_coeff = numpy.polynomial.Polynomial([7, 10])  # P(x) = 7 + 10x
-        np_term3_coeff = numpy.polynomial.Polynomial([0, 2])  # P(x) = 2x
-
-        np_poly = numpy.polynomial.Polynomial(
-            [np_term1_coeff, np_term2_coeff, 0, np_term3_coeff]
-        )
-
+    def test_2d_numpy_equiv(self, np_poly_2d):
         cpl_poly = cplcore.Polynomial(2)  # 2-dimensional
-        cpl_poly.set_coeff([0, 0], 4)
-        cpl_poly.set_coeff([0, 1], 1)
-        cpl_poly.set_coeff([0, 2], 3)
-
-        cpl_poly.set_coeff([1, 0], 7)
-        cpl_poly.set_coeff([1, 1], 10)
-
-        cpl_poly.set_coeff([3, 1], 2)
+        cpl_poly.set_coeffs(
+            [[0, 0], [0, 1], [0, 2], [1, 0], [1, 1], [3, 1]], [4, 1, 3, 7, 10, 2]
+        )
 
         # P(6,-8) = (4 + 6 + 108) + -8(7 + 60) + -512(12)
         #         = 118 - 536 - 6144
         #         = -6562
 
         assert cpl_poly.eval(cplcore.Vector([-8, 6])) == -6562
-        assert np_poly(-8)(6) == -6562
+        assert np_poly_2d(-8)(6) == -6562
 
-    def test_numpy_conversion(self):
-        import numpy
-
-        # P(x, y) = 4 + 1x + 7y + 10xy + 3x² + 2xy³
-        #         = (4 + 1x + 3x²) + (7 + 10x)y + (2x)y³
-
-        np_term1_coeff = numpy.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
-        np_term2_coeff = numpy.polynomial.Polynomial([7, 10])  # P(x) = 7 + 10x
-        np_term3_coeff = numpy.polynomial.Polynomial([0, 2])  # P(x) = 2x
-
-        np_poly = numpy.polynomial.Polynomial(
-            [np_term1_coeff, np_term2_coeff, 0, np_term3_coeff]
-        )
-
-        assert cplcore.Polynomial.from_numpy(np_poly).eval([-8, 6]) == -6562
+    def test_numpy_conversion(self, np_poly_2d):
+        assert cplcore.Polynomial.from_numpy(np_poly_2d).eval([-8, 6]) == -6562
 
     @pytest.mark.parametrize(
         "evalh_true, xy",
@@ -217,36 +186,33 @@ class TestPolynomial:
         # evaluate at a specific point, at a root
 
         evalh = poly2d.eval(cplcore.Vector(xy))
-        assert np.isclose(evalh, evalh_true, atol=np.finfo(np.double).eps)
+        assert np.isclose(evalh, evalh_true, atol=DBL_EPSILON)
 
     # based off cpl_polynomial_eval_2d_test from cpl_polynomial-test.c
     def tests_eval_2d_empty(self):
         poly = cplcore.Polynomial(2)
         # test empty polynomial
         res = poly.eval_2d(123.0, 123.0)[0]
-        assert np.isclose(res, 0.0, np.finfo(np.double).eps)
+        assert np.isclose(res, 0.0, DBL_EPSILON)
 
     def tests_eval_2d_0_degree(self):
         poly = cplcore.Polynomial(2)
         poly.set_coeff([0, 0], 123)
         # test degree 0 polynomial
         res = poly.eval_2d(123.0, 123.0)[0]
-        assert np.isclose(res, 123.0, np.finfo(np.double).eps)
+        assert np.isclose(res, 123.0, DBL_EPSILON)
 
     def test_eval_2d_random(self):
         mytol = 1e-7
         poly = cplcore.Polynomial(2)
         # Set random coefficients
         # CPL tests use a random number between 0 and 1
-        poly.set_coeff([0, 1], random())
-        poly.set_coeff([1, 0], random())
-        poly.set_coeff([1, 1], random())
-        poly.set_coeff([2, 0], random())
-        poly.set_coeff([0, 3], random())
+        rng = np.random.default_rng(2)
+        poly.set_coeffs([[0, 1], [1, 0], [1, 1], [2, 0], [0, 3]], rng.random(5))
 
         # eval with generic function
 
-        eval_xy = [random(), random()]
+        eval_xy = rng.random(2)
 
         stable_eval = poly.eval(cplcore.Vector(eval_xy))
         eval_res = poly.eval_2d(eval_xy[0], eval_xy[1])
@@ -254,13 +220,13 @@ class TestPolynomial:
         gradient = eval_res[1]
 
         # test gradient
-        dev_poly = copy.deepcopy(poly)
+        dev_poly = poly.copy()
         dev_poly.derivative(0)
-        stable_xpd = dev_poly.eval(cplcore.Vector(eval_xy))
+        stable_xpd = dev_poly.eval_2d(eval_xy[0], eval_xy[1])[0]
         assert np.isclose(stable_xpd, gradient[0], atol=mytol)
-        dev_poly = copy.deepcopy(poly)
+        dev_poly = poly.copy()
         dev_poly.derivative(1)
-        stable_ypd = dev_poly.eval(cplcore.Vector(eval_xy))
+        stable_ypd = dev_poly.eval_2d(eval_xy[0], eval_xy[1])[0]
         assert np.isclose(stable_ypd, gradient[1], atol=mytol)
 
     # based off cpl_polynomial_eval_3d_test from cpl_polynomial-test.c
@@ -268,30 +234,29 @@ class TestPolynomial:
         poly = cplcore.Polynomial(3)
         # test empty polynomial
         res = poly.eval_3d(123.0, 123.0, 123.0)[0]
-        assert np.isclose(res, 0.0, np.finfo(np.double).eps)
+        assert np.isclose(res, 0.0, DBL_EPSILON)
 
     def tests_eval_3d_0_degree(self):
         poly = cplcore.Polynomial(3)
         poly.set_coeff([0, 0, 0], 123)
         # test degree 0 polynomial
         res = poly.eval_3d(123.0, 123.0, 123.0)[0]
-        assert np.isclose(res, 123.0, np.finfo(np.double).eps)
+        assert np.isclose(res, 123.0, DBL_EPSILON)
 
     def test_eval_3d_random(self):
         mytol = 1e-7
         poly = cplcore.Polynomial(3)
         # Set random coefficients
         # CPL tests use a random number between 0 and 1
-        poly.set_coeff([0, 1, 0], random())
-        poly.set_coeff([1, 0, 2], random())
-        poly.set_coeff([1, 1, 3], random())
-        poly.set_coeff([2, 0, 1], random())
-        poly.set_coeff([0, 3, 0], random())
-        poly.set_coeff([4, 0, 4], random())
+        rng = np.random.default_rng(3)
+        poly.set_coeffs(
+            [[0, 1, 0], [1, 0, 2], [1, 1, 3], [2, 0, 1], [0, 3, 0], [4, 0, 4]],
+            rng.random(6),
+        )
 
         # eval with generic function
 
-        eval_xyz = [random(), random(), random()]
+        eval_xyz = rng.random(3)
 
         stable_eval = poly.eval(cplcore.Vector(eval_xyz))
         eval_res = poly.eval_3d(eval_xyz[0], eval_xyz[1], eval_xyz[2])
@@ -299,18 +264,18 @@ class TestPolynomial:
         gradient = eval_res[1]
 
         # test gradient
-        dev_poly = copy.deepcopy(poly)
+        dev_poly = poly.copy()
         dev_poly.derivative(0)
-        stable_xpd = dev_poly.eval(cplcore.Vector(eval_xyz))
+        stable_xpd = dev_poly.eval_3d(eval_xyz[0], eval_xyz[1], eval_xyz[2])[0]
         assert np.isclose(stable_xpd, gradient[0], atol=mytol)
-        dev_poly = copy.deepcopy(poly)
+        dev_poly = poly.copy()
         dev_poly.derivative(1)
-        stable_ypd = dev_poly.eval(cplcore.Vector(eval_xyz))
+        stable_ypd = dev_poly.eval_3d(eval_xyz[0], eval_xyz[1], eval_xyz[2])[0]
         assert np.isclose(stable_ypd, gradient[1], atol=mytol)
 
-        dev_poly = copy.deepcopy(poly)
+        dev_poly = poly.copy()
         dev_poly.derivative(2)
-        stable_zpd = dev_poly.eval(cplcore.Vector(eval_xyz))
+        stable_zpd = dev_poly.eval_3d(eval_xyz[0], eval_xyz[1], eval_xyz[2])[0]
         assert np.isclose(stable_zpd, gradient[2], atol=mytol)
 
     def test_fit_residual(self, fit_cmp, vector_get_mse):
@@ -321,87 +286,36 @@ class TestPolynomial:
         fit_cmp(poly1a, samppos1, taylor, False, [3], mindeg=[0])
         eps, redchisq = vector_get_mse(taylor, poly1a, samppos1)
         assert 0.0 <= redchisq
-        assert np.isclose(
-            eps, 0.0, atol=4359 * np.finfo(np.double).eps * np.finfo(np.double).eps
-        )
+        assert np.isclose(eps, 0.0, atol=4359 * DBL_EPSILON * DBL_EPSILON)
 
-    def test_repr(self):
+    def test_repr(self, dump_poly):
         empty = cplcore.Polynomial(1)
         assert repr(empty) == """<cpl.core.Polynomial, degree 0>"""
-        np_term1_coeff = np.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
-        np_poly = np.polynomial.Polynomial([np_term1_coeff])
-        cpl_poly = cplcore.Polynomial.from_numpy(np_poly)
-        assert repr(cpl_poly) == """<cpl.core.Polynomial, degree 2>"""
-
-    def test_dump_string(self):
-        # P(x, y) = 4 + 1x + 7y + 10xy + 3x² + 2xy³
-        #         = (4 + 1x + 3x²) + (7 + 10x)y + (2x)y³
-
-        np_term1_coeff = np.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
-        np_poly = np.polynomial.Polynomial([np_term1_coeff])
-        assert cplcore.Polynomial.from_numpy(np_poly).eval([-8, 6]) == 118
-        testpoly = cplcore.Polynomial.from_numpy(np_poly)
-        outp = """#----- 2 dimensional polynomial of degree 2 -----
-1.dim.power  2.dim.power  coefficient
-      0            0      4
-      0            1      1
-      0            2      3
-#----- 3 coefficient(s) -----
-#------------------------------------
-"""
-        assert str(testpoly) == outp
-        assert isinstance(testpoly.dump(show=False), str)
+        assert repr(dump_poly) == """<cpl.core.Polynomial, degree 2>"""
 
-    def test_dump_file(self, tmp_path):
+    def test_dump_string(self, dump_poly):
+        assert dump_poly.eval([-8, 6]) == 118
+        assert str(dump_poly) == POLYNOMIAL_DUMP
+        assert isinstance(dump_poly.dump(show=False), str)
+
+    def test_dump_file(self, tmp_path, dump_poly):
         d = tmp_path / "sub"
         d.mkdir()
         p = d / "cpl_polynomial_dump.txt"
         filename = tmp_path.joinpath(p)
-        np_term1_coeff = np.polynomial.Polynomial([4, 1, 3])  # P(x) = 4 + 1x + 3x²
-        np_poly = np.polynomial.Polynomial([np_term1_coeff])
-        testpoly = cplcore.Polynomial.from_numpy(np_poly)
-        testpoly.dump(filename=str(filename))
-        outp = """#----- 2 dimensional polynomial of degree 2 -----
-1.dim.power  2.dim.power  coefficient
-      0            0      4
-      0            1      1
-      0            2      3
-#----- 3 coefficient(s) -----
-#------------------------------------
-"""
-        contents = ""
-        with open(str(filename), "r") as f:
-            for line in f.readlines():
-                contents += line
-        assert contents == outp
-
-    def test_dump_stdout(self):
-        cmd = "from cpl import core as cplcore; "
-        cmd += "import numpy as np; "
-        cmd += "np_term1_coeff = np.polynomial.Polynomial([4, 1, 3]); "
-        cmd += "np_poly = np.polynomial.Polynomial([np_term1_coeff]); "
-        cmd += "testpoly = cplcore.Polynomial.from_numpy(np_poly); "
-        cmd += "testpoly.dump() "
-        response = subprocess.run(["python", "-c", cmd], stdout=subprocess.PIPE)
-        outp = str(response.stdout, "utf-8")
-        expect = """#----- 2 dimensional polynomial of degree 2 -----
-1.dim.power  2.dim.power  coefficient
-      0            0      4
-      0            1      1
-      0            2      3
-#----- 3 coefficient(s) -----
-#------------------------------------
-"""
-        assert outp == expect
+        dump_poly.dump(filename=str(filename))
+        assert filename.read_text() == POLYNOMIAL_DUMP
+
+    def test_dump_stdout(self, capfd, dump_poly):
+        dump_poly.dump()
+        assert capfd.readouterr().out == POLYNOMIAL_DUMP
 
     def test_copy(self):
         poly = cplcore.Polynomial(2)
-        poly.set_coeff([0, 0], random())
-        poly.set_coeff([0, 1], random())
-        poly.set_coeff([1, 0], random())
-        poly.set_coeff([1, 1], random())
-        poly.set_coeff([2, 0], random())
-        poly.set_coeff([0, 2], random())
+        poly.set_coeffs(
+            [[0, 0], [0, 1], [1, 0], [1, 1], [2, 0], [0, 2]],
+            np.random.default_rng(0).random(6),
+        )
 
         poly_copy = poly.copy()
 
@@ -414,3 +328,37 @@ class TestPolynomial:
         assert poly_copy.get_coeff([1, 1]) == poly.get_coeff([1, 1])
         assert poly_copy.get_coeff([2, 0]) == poly.get_coeff([2, 0])
         assert poly_copy.get_coeff([0, 2]) == poly.get_coeff([0, 2])
+
+    def test_set_coeffs(self):
+        pows = [[0, 1], [2, 0], [1, 3], [0, 1]]
+        values = [1.5, -2.0, 4.0, 3.0]
+        poly = cplcore.Polynomial(2)
+        poly.set_coeffs(np.array(pows, dtype=np.intc), values)
+        expected = cplcore.Polynomial(2)
+        for p, v in zip(pows, values):
+            expected.set_coeff(p, v)
+        assert poly == expected
+        # The coefficients are set in order, so the last one of [0, 1] wins
+        assert poly.get_coeff([0, 1]) == 3.0
+        assert poly.degree == 4
+
+    def test_set_coeffs_invalid(self):
+        poly = cplcore.Polynomial(2)
+        with pytest.raises(cplcore.IllegalInputError):
+            poly.set_coeffs([[0, 1, 2]], [1.0])
+        with pytest.raises(cplcore.IllegalInputError):
+            poly.set_coeffs([[0, 1], [1, 0]], [1.0])
+        with pytest.raises(cplcore.IllegalInputError):
+            poly.set_coeffs([[1, 0], [0, -1]], [1.0, 2.0])
+        # No coefficient is set if one of the powers is invalid
+        assert poly.get_coeff([1, 0]) == 0.0
+        with pytest.raises(cplcore.IllegalInputError):
+            # Floating point powers are not truncated
+            poly.set_coeffs([[0.5, 1]], [1.0])
+        assert poly.get_coeff([0, 1]) == 0.0
+
+    def test_set_coeffs_empty(self):
+        poly = cplcore.Polynomial(2)
+        poly.set_coeffs([], [])
+        poly.set_coeffs(np.empty((0, 2), dtype=int), np.empty(0))
+        assert poly == cplcore.Polynomial(2)